@@ -0,0 +1,36 @@
+import time
+from typing import Callable, Dict, List
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * (len(sorted_values) - 1)))))
+    return sorted_values[index]
+
+
+def measure(call: Callable[[], object], calls: int) -> Dict[str, float]:
+    """
+    Call ``call`` sequentially and return calls per second with p50/p99 latency in seconds.
+    """
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(calls):
+        call_start = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - call_start)
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {"rate": calls / elapsed, "p50": percentile(latencies, 0.5), "p99": percentile(latencies, 0.99)}
+
+
+def measure_bulk(call: Callable[[], object], units: int) -> Dict[str, float]:
+    """
+    Time one bulk call covering ``units`` operations and return operations per second.
+    """
+    start = time.perf_counter()
+    call()
+    elapsed = time.perf_counter() - start
+    return {"rate": units / elapsed, "p50": elapsed, "p99": elapsed}
+
+
+def report(name: str, result: Dict[str, float]) -> None:
+    print(f"{name:<40} {result['rate']:>10.0f}/s  p50={result['p50'] * 1e3:8.2f}ms  p99={result['p99'] * 1e3:8.2f}ms")
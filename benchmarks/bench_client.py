@@ -0,0 +1,75 @@
+"""
+End-to-end benchmark of every EagleClient method against the mock Eagle server.
+
+Single-call mode reports calls per second and p50/p99 latency of sequential calls.
+Bulk mode reports items per second of the bulk helpers.
+
+Run with ``python benchmarks/bench_client.py [calls] [latency_ms]``.
+"""
+import sys
+
+from _common import measure, measure_bulk, report
+
+from eaglepy import BatchUpdater, BulkImporter, EagleClient
+from eaglepy.mock_server import MockEagleServer
+
+
+def single_call(client, server, calls):
+    item_id = server.add_items(1, tags=["bench"])[0]
+    folder_id = client.folder.create_folder("bench")["data"]["id"]
+    library_path = server.library_path
+    cases = {
+        "application.get_info": lambda: client.application.get_info(),
+        "folder.create_folder": lambda: client.folder.create_folder("bench", parent=folder_id),
+        "folder.rename_folder": lambda: client.folder.rename_folder(folder_id, "bench"),
+        "folder.update_folder": lambda: client.folder.update_folder(folder_id, "bench", "", "red"),
+        "folder.list_folders": lambda: client.folder.list_folders(),
+        "folder.list_recent_folders": lambda: client.folder.list_recent_folders(),
+        "item.add_item_from_url": lambda: client.item.add_item_from_url("http://example.com/a.jpg", "a"),
+        "item.add_item_from_path": lambda: client.item.add_item_from_path("/tmp/a.jpg", "a"),
+        "item.add_bookmark": lambda: client.item.add_bookmark("http://example.com", "a", None, ""),
+        "item.get_item_info": lambda: client.item.get_item_info(item_id),
+        "item.get_item_thumbnail": lambda: client.item.get_item_thumbnail(item_id),
+        "item.list_items": lambda: client.item.list_items("CREATEDATE", 50),
+        "item.refresh_palette": lambda: client.item.refresh_palette(item_id),
+        "item.refresh_thumbnail": lambda: client.item.refresh_thumbnail(item_id),
+        "item.update_item": lambda: client.item.update_item(item_id, star=3),
+        "library.get_library_info": lambda: client.library.get_library_info(),
+        "library.get_library_history": lambda: client.library.get_library_history(),
+        "library.switch_library": lambda: client.library.switch_library(library_path),
+    }
+    for name, call in cases.items():
+        report(name, measure(call, calls))
+
+
+def bulk(client, server, count):
+    ids = server.add_items(count)
+    entries = [{"path": f"/tmp/{i}.jpg", "name": str(i)} for i in range(count)]
+
+    report("bulk get_items_info", measure_bulk(lambda: client.item.get_items_info(ids), count))
+    report("bulk iter_items", measure_bulk(lambda: sum(1 for _ in client.item.iter_items(page_size=200)), count))
+    importer = BulkImporter(client.item, chunk_size=100)
+    report("bulk import_paths", measure_bulk(lambda: list(importer.import_paths(entries)), count))
+
+    def batched_updates():
+        with BatchUpdater(client.item, max_pending=count, flush_interval=None) as updater:
+            for item_id in ids:
+                updater.update(item_id, tags=["a"])
+                updater.update(item_id, tags=["b"], star=2)
+
+    report("bulk BatchUpdater (2 edits/item)", measure_bulk(batched_updates, count * 2))
+    report("bulk move_items_to_trash", measure_bulk(lambda: client.item.move_items_to_trash(ids), count))
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    latency = float(sys.argv[2]) / 1000 if len(sys.argv) > 2 else 0.0
+    with MockEagleServer(latency=latency) as server, EagleClient(server.base_url, pool_maxsize=16) as client:
+        print(f"single-call mode ({calls} calls each)")
+        single_call(client, server, calls)
+        print(f"bulk mode ({calls * 10} items)")
+        bulk(client, server, calls * 10)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Compare JSON codecs on multi-megabyte bodies: decoding a large list_items
+response, encoding a large add_items_from_paths request, and end to end
+through the mock Eagle server, including the raw pass-through mode.
+
+Run with ``python benchmarks/bench_codec.py [items]``.
+"""
+import sys
+
+from _common import measure, report
+
+from eaglepy import EagleClient, JSONCodec, OrjsonCodec
+from eaglepy.codec import orjson
+from eaglepy.mock_server import MockEagleServer
+
+TAGS = ["red", "blue", "sky", "portrait", "landscape", "ref", "wip", "final"]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    codecs = [JSONCodec()] + ([OrjsonCodec()] if orjson is not None else [])
+    paths = {"items": [{"path": f"/renders/shot{i // 100}/frame_{i:06d}.exr", "name": f"frame_{i:06d}",
+                        "tags": TAGS[i % 4:i % 4 + 3], "annotation": None, "website": None} for i in range(count)],
+             "folderId": None}
+
+    with MockEagleServer() as server:
+        server.add_items(count, tags=TAGS[:3], folders=["F1"])
+        with EagleClient(server.base_url) as client:
+            body = client.transport.get(f"{server.base_url}/api/item/list?orderBy=CREATEDATE&limit={count}").content
+        print(f"list_items body: {len(body) / 1e6:.1f} MB, add_items_from_paths body: "
+              f"{len(JSONCodec().dumps(paths)) / 1e6:.1f} MB")
+
+        for codec in codecs:
+            report(f"decode list_items {codec.name}", measure(lambda: codec.loads(body), 20))
+            report(f"encode add_items_from_paths {codec.name}", measure(lambda: codec.dumps(paths), 20))
+
+        for codec in [None] + codecs:
+            with EagleClient(server.base_url, codec=codec) as client:
+                name = codec.name if codec is not None else "requests"
+                report(f"list_items end to end {name}", measure(lambda: client.item.list_items("CREATEDATE", count), 10))
+        with EagleClient(server.base_url) as client:
+            def raw():
+                with client.raw():
+                    client.item.list_items("CREATEDATE", count)
+
+            report("list_items end to end raw", measure(raw, 10))
+
+
+if __name__ == "__main__":
+    main()
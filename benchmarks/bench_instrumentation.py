@@ -0,0 +1,27 @@
+"""
+Measure the per-call overhead of Instrumentation against the mock Eagle server.
+
+Run with ``python benchmarks/bench_instrumentation.py [calls]``.
+"""
+import sys
+
+from _common import measure, report
+
+from eaglepy import EagleClient, Instrumentation
+from eaglepy.mock_server import MockEagleServer
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    with MockEagleServer() as server:
+        item_id = server.add_items(1)[0]
+        with EagleClient(server.base_url) as client:
+            report("no instrumentation", measure(lambda: client.item.get_item_info(item_id), calls))
+        instrumentation = Instrumentation()
+        instrumentation.add_after_hook(lambda event: None)
+        with EagleClient(server.base_url, instrumentation=instrumentation) as client:
+            report("instrumentation + after hook", measure(lambda: client.item.get_item_info(item_id), calls))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""
+Compare the throughput of serial Item.get_item_info calls with the concurrent
+Item.get_items_info fan-out against the mock Eagle server.
+
+Run with ``python benchmarks/bench_items_info.py [ids] [latency_ms]``.
+"""
+import sys
+
+from _common import measure_bulk, report
+
+from eaglepy import EagleClient
+from eaglepy.mock_server import MockEagleServer
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    latency = float(sys.argv[2]) / 1000 if len(sys.argv) > 2 else 0.002
+    with MockEagleServer(latency=latency) as server:
+        ids = server.add_items(count)
+        with EagleClient(server.base_url, pool_maxsize=16) as client:
+            def serial():
+                for item_id in ids:
+                    client.item.get_item_info(item_id)
+
+            report("serial get_item_info", measure_bulk(serial, count))
+            for workers in (4, 8, 16):
+                report(
+                    f"get_items_info max_workers={workers}",
+                    measure_bulk(lambda: client.item.get_items_info(ids, max_workers=workers), count)
+                )
+
+
+if __name__ == "__main__":
+    main()
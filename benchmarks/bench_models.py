@@ -0,0 +1,48 @@
+"""
+Compare the memory held by raw item dicts, ItemRecord objects and an ItemTable.
+
+Run with ``python benchmarks/bench_models.py [items]``.
+"""
+import json
+import sys
+import tracemalloc
+
+from eaglepy.models import ItemRecord, ItemTable
+
+TAGS = ["red", "blue", "sky", "portrait", "landscape", "ref", "wip", "final"]
+
+
+def payload(count):
+    items = [
+        {"id": f"K{i:012d}", "name": f"render_{i}", "size": 1000 + i, "ext": "png" if i % 3 else "jpg",
+         "tags": TAGS[i % 4:i % 4 + 3], "folders": [f"F{i % 20}"], "isDeleted": False, "url": "",
+         "annotation": "", "modificationTime": 1700000000000 + i, "lastModified": 1700000000000 + i,
+         "width": 1920, "height": 1080, "star": i % 6,
+         "palettes": [{"color": [i % 255, 10, 20], "ratio": 50.0, "$$hashKey": "object:1"}]}
+        for i in range(count)
+    ]
+    return json.dumps({"status": "success", "data": items})
+
+
+def held(build, raw):
+    tracemalloc.start()
+    result = build(json.loads(raw)["data"])
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    raw = payload(count)
+    for name, build in (
+        ("dicts", lambda items: items),
+        ("ItemRecord", lambda items: [ItemRecord.from_dict(item) for item in items]),
+        ("ItemTable", ItemTable.from_items),
+    ):
+        _, size = held(build, raw)
+        print(f"{name:<12} {size / count:8.0f} bytes/item")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""
+Compare the size and encoding time of POST bodies as previously sent (every
+key, nulls included, default separators) with build_payload + compact_json.
+
+Run with ``python benchmarks/bench_payload.py [items]``.
+"""
+import json
+import sys
+
+from _common import measure, report
+
+from eaglepy.payload import build_payload, compact_json
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    entries = [
+        {"path": f"/renders/shot{i // 100}/frame_{i:06d}.exr", "name": f"frame_{i:06d}",
+         "website": None, "tags": ["render", "wip"] if i % 2 else None, "annotation": None}
+        for i in range(count)
+    ]
+    update = {"id": "KBKE04XLP3AZ0", "tags": ["red", "sky"], "annotation": None, "url": None, "star": None}
+    for name, fields in (("add_items_from_paths", {"items": entries, "folderId": None}), ("update_item", update)):
+        before = json.dumps(fields).encode()
+        after = compact_json(build_payload(fields))
+        print(f"{name:<24} {len(before):>10} bytes -> {len(after):>10} bytes ({1 - len(after) / len(before):.0%} smaller)")
+        calls = 20 if name == "add_items_from_paths" else 20000
+        report(f"{name} json.dumps", measure(lambda: json.dumps(fields).encode(), calls))
+        report(f"{name} build_payload+compact", measure(lambda: compact_json(build_payload(fields)), calls))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""
+Compare per-call latency of unpooled ``requests.get`` calls with the pooled
+transport shared by EagleClient.
+
+Run with ``python benchmarks/bench_pooling.py [calls]``.
+"""
+import sys
+
+from _common import measure, report
+
+from eaglepy import EagleClient
+from eaglepy.item import Item
+from eaglepy.mock_server import MockEagleServer
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    with MockEagleServer() as server:
+        item_id = server.add_items(1)[0]
+
+        unpooled = Item(server.base_url)
+        report("unpooled get_item_info", measure(lambda: unpooled.get_item_info(item_id), calls))
+        print(f"  connections opened: {server.connections}")
+
+        server.reset_counters()
+        with EagleClient(server.base_url) as client:
+            report("pooled get_item_info", measure(lambda: client.item.get_item_info(item_id), calls))
+        print(f"  connections opened: {server.connections}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Time boolean queries on an ItemIndex built from a synthetic library.
+
+Run with ``python benchmarks/bench_query.py [items]``.
+"""
+import random
+import sys
+import time
+
+from eaglepy.query import Between, HasTag, InFolder, ItemIndex
+
+TAGS = [f"tag{i}" for i in range(200)]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    rng = random.Random(1)
+    start = time.perf_counter()
+    index = ItemIndex.from_items(
+        {"id": f"K{i:012d}", "tags": rng.sample(TAGS, 5), "folders": [f"F{rng.randrange(50)}"],
+         "ext": rng.choice(["png", "jpg", "gif"]), "width": rng.choice([1280, 1920, 3840, 4096]), "height": 2160}
+        for i in range(count)
+    )
+    print(f"built index of {count} items in {time.perf_counter() - start:.2f}s")
+
+    queries = {
+        "A & B & ~C & folder": HasTag("tag1") & HasTag("tag2") & ~HasTag("tag3") & InFolder("F7"),
+        "A | B": HasTag("tag1") | HasTag("tag2"),
+        "A & width >= 3840": HasTag("tag1") & Between("width", 3840),
+    }
+    for name, query in queries.items():
+        runs = 100
+        start = time.perf_counter()
+        for _ in range(runs):
+            matches = index.count(query)
+        elapsed = (time.perf_counter() - start) / runs
+        print(f"{name:<24} {matches:>8} matches  {elapsed * 1e6:10.1f}us/query")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""
+Measure a burst of identical concurrent reads with and without single-flight
+coalescing against the mock Eagle server.
+
+Run with ``python benchmarks/bench_singleflight.py [calls] [latency_ms]``.
+"""
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from _common import measure_bulk, report
+
+from eaglepy import EagleClient, SingleFlight
+from eaglepy.mock_server import MockEagleServer
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    latency = float(sys.argv[2]) / 1000 if len(sys.argv) > 2 else 0.005
+    with MockEagleServer(latency=latency) as server:
+        ids = server.add_items(10)
+        for single_flight in (None, SingleFlight()):
+            with EagleClient(server.base_url, pool_maxsize=32, single_flight=single_flight) as client:
+                server.reset_counters()
+                with ThreadPoolExecutor(max_workers=32) as executor:
+                    def burst():
+                        list(executor.map(lambda index: client.item.get_item_info(ids[index % len(ids)]), range(calls)))
+
+                    result = measure_bulk(burst, calls)
+                sent = sum(server.request_counts.values())
+                report(f"single_flight={single_flight is not None} sent={sent}", result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Compare serial get_item_thumbnail calls plus disk reads with the concurrent
+ThumbnailLoader, cold and warm, against the mock Eagle server.
+
+Run with ``python benchmarks/bench_thumbnails.py [items] [latency_ms]``.
+"""
+import os
+import sys
+import tempfile
+
+from _common import measure_bulk, report
+
+from eaglepy import EagleClient
+from eaglepy.mock_server import MockEagleServer
+from eaglepy.thumbnails import ThumbnailLoader
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    latency = float(sys.argv[2]) / 1000 if len(sys.argv) > 2 else 0.002
+    with tempfile.TemporaryDirectory() as directory, MockEagleServer(latency=latency) as server:
+        server.library_path = directory
+        items = [server.items[item_id] for item_id in server.add_items(count)]
+        for item in items:
+            folder = os.path.join(directory, "images", f"{item['id']}.info")
+            os.makedirs(folder)
+            with open(os.path.join(folder, f"{item['name']}_thumbnail.png"), "wb") as handle:
+                handle.write(os.urandom(16 * 1024))
+        with EagleClient(server.base_url, pool_maxsize=16) as client:
+            def serial():
+                for item in items:
+                    with open(client.item.get_item_thumbnail(item["id"])["data"], "rb") as handle:
+                        handle.read()
+
+            report("serial get_item_thumbnail + read", measure_bulk(serial, count))
+            for use_mmap in (False, True):
+                loader = ThumbnailLoader(client.item, max_workers=16, use_mmap=use_mmap, mmap_threshold=0)
+                report(f"ThumbnailLoader cold mmap={use_mmap}", measure_bulk(lambda: loader.load(items), count))
+                report(f"ThumbnailLoader warm mmap={use_mmap}", measure_bulk(lambda: loader.load(items), count))
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,20 @@
 from .client import EagleClient
+from .transport import Transport
+from .async_client import AsyncEagleClient
+from .bulk import BulkImporter, BulkItemOperations, ChunkResult
+from .cache import ResponseCache
+from .folder_index import FolderIndex
+from .batch_update import BatchUpdater
+from .instrumentation import Instrumentation
+from .resilience import CircuitBreaker, RetryPolicy
+from .models import ItemRecord, ItemTable
+from .query import ItemIndex
+from .sync import LibrarySync
+from .local_library import LocalLibrary
+from .thumbnails import ThumbnailCache, ThumbnailLoader
+from .scheduler import RequestScheduler, TokenBucket
+from .singleflight import AsyncSingleFlight, SingleFlight
+from .watcher import IngestWatcher
+from .codec import JSONCodec, OrjsonCodec, best_codec
+from .multi_library import LibraryOrchestrator
+from .change_feed import ChangeEvent, ChangeFeed
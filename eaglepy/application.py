@@ -3,8 +3,9 @@ import requests
 
 
 class Application:
-    def __init__(self, base_url):
+    def __init__(self, base_url, session=None):
         self.base_url = base_url
+        self.session = session if session is not None else requests
 
     def get_info(self) -> Dict[str, any]:
         """
@@ -17,5 +18,5 @@ class Application:
             Dict[str, any]: A dictionary containing the detailed information of the Eagle App.
         """
         url = f"{self.base_url}/api/application/info"
-        response = requests.get(url)
+        response = self.session.get(url)
         return response.json()
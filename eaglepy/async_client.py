@@ -0,0 +1,406 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Union
+
+from .application import Application
+from .cache import ResponseCache
+from .exceptions import EagleAPIError
+from .folder import Folder
+from .instrumentation import Instrumentation
+from .item import Item
+from .library import Library
+from .resilience import CircuitBreaker, RetryPolicy
+from .scheduler import RequestScheduler, bind_lane
+from .singleflight import AsyncSingleFlight, SingleFlight
+from .streaming import Source
+from .transport import Codec, Timeout, Transport
+
+
+class _AsyncEndpoint:
+    def __init__(self, endpoint, executor: ThreadPoolExecutor, flights: Optional[AsyncSingleFlight] = None):
+        self._endpoint = endpoint
+        self._executor = executor
+        self._flights = flights
+
+    async def _call(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        loop = asyncio.get_event_loop()
+        # The worker thread sends on the scheduler lane and in the raw mode chosen around the await.
+        session = self._endpoint.session
+        call = bind_lane(session, functools.partial(func, *args, **kwargs))
+        if isinstance(session, Transport):
+            call = session.bind_raw(call)
+        return await loop.run_in_executor(self._executor, call)
+
+    async def _read(self, func: Callable, *args: Any) -> Any:
+        # Identical concurrent reads share one worker thread instead of each taking one.
+        if self._flights is None:
+            return await self._call(func, *args)
+        raw = isinstance(self._endpoint.session, Transport) and self._endpoint.session.is_raw()
+        key = (func.__qualname__, raw) + tuple(tuple(arg) if isinstance(arg, list) else arg for arg in args)
+        return await self._flights.do(key, lambda: self._call(func, *args))
+
+
+class AsyncApplication(_AsyncEndpoint):
+    async def get_info(self) -> Dict[str, any]:
+        """
+        GET Get detailed information on the Eagle App currently running.
+        """
+        return await self._read(self._endpoint.get_info)
+
+
+class AsyncFolder(_AsyncEndpoint):
+    async def create_folder(self, folder_name: str, parent: Optional[str] = None) -> Dict:
+        """
+        Create a folder. See Folder.create_folder.
+        """
+        return await self._call(self._endpoint.create_folder, folder_name, parent)
+
+    async def rename_folder(self, folder_id: str, new_name: str) -> Dict:
+        """
+        Rename the specified folder. See Folder.rename_folder.
+        """
+        return await self._call(self._endpoint.rename_folder, folder_id, new_name)
+
+    async def update_folder(self, folder_id: str, new_name: str, new_description: str, new_color: str) -> Dict:
+        """
+        Update the specified folder. See Folder.update_folder.
+        """
+        return await self._call(self._endpoint.update_folder, folder_id, new_name, new_description, new_color)
+
+    async def list_folders(self) -> Dict:
+        """
+        Get the list of folders of the current library.
+        """
+        return await self._read(self._endpoint.list_folders)
+
+    async def list_recent_folders(self) -> Dict:
+        """
+        Get the list of folders recently used by the user.
+        """
+        return await self._read(self._endpoint.list_recent_folders)
+
+
+class AsyncItem(_AsyncEndpoint):
+    async def add_item_from_url(
+        self,
+        url: str,
+        name: str,
+        website: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        modification_time: Optional[int] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Union[str, int, List[str], Dict[str, str]]]:
+        """
+        POST add an image from a URL to Eagle App. See Item.add_item_from_url.
+        """
+        return await self._call(
+            self._endpoint.add_item_from_url, url, name, website, tags, modification_time, headers
+        )
+
+    async def add_item_from_file(
+        self,
+        source: Source,
+        name: str,
+        website: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        modification_time: Optional[int] = None,
+        headers: Optional[Dict[str, str]] = None,
+        mime_type: Optional[str] = None
+    ) -> Dict[str, Union[str, int, List[str], Dict[str, str]]]:
+        """
+        POST add an image from a file or binary stream, streamed as a base64 URL. See Item.add_item_from_file.
+        """
+        return await self._call(
+            self._endpoint.add_item_from_file, source, name, website, tags, modification_time, headers, mime_type
+        )
+
+    async def add_items_from_urls(
+        self,
+        items: List[Dict[str, Optional[Union[str, List[str], int]]]],
+        folder_id: Optional[str] = None
+    ) -> Dict[str, Union[str, int, List[str], Dict[str, str]]]:
+        """
+        POST add multiple images from URLs to Eagle App. See Item.add_items_from_urls.
+        """
+        return await self._call(self._endpoint.add_items_from_urls, items, folder_id)
+
+    async def add_item_from_path(
+        self,
+        path: str,
+        name: str,
+        website: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        annotation: Optional[str] = None,
+        folder_id: Optional[str] = None
+    ) -> Dict[str, Union[str, int, List[str], Dict[str, str]]]:
+        """
+        POST add a local file to Eagle App. See Item.add_item_from_path.
+        """
+        return await self._call(
+            self._endpoint.add_item_from_path, path, name, website, tags, annotation, folder_id
+        )
+
+    async def add_items_from_paths(
+        self,
+        items: List[Dict[str, Optional[Union[str, List[str]]]]],
+        folder_id: Optional[str] = None
+    ) -> Dict[str, Union[str, int, List[str], Dict[str, str]]]:
+        """
+        POST add multiple local files to Eagle App. See Item.add_items_from_paths.
+        """
+        return await self._call(self._endpoint.add_items_from_paths, items, folder_id)
+
+    async def add_bookmark(
+        self,
+        url: str,
+        name: str,
+        tags: Optional[List[str]],
+        base64_data: str
+    ) -> Dict[str, Union[str, int, List[str], Dict[str, str]]]:
+        """
+        POST save the link in the URL form to Eagle App. See Item.add_bookmark.
+        """
+        return await self._call(self._endpoint.add_bookmark, url, name, tags, base64_data)
+
+    async def add_bookmark_from_file(
+        self,
+        url: str,
+        name: str,
+        tags: Optional[List[str]],
+        source: Source,
+        mime_type: Optional[str] = None
+    ) -> Dict[str, Union[str, int, List[str], Dict[str, str]]]:
+        """
+        POST save a link with a streamed thumbnail. See Item.add_bookmark_from_file.
+        """
+        return await self._call(self._endpoint.add_bookmark_from_file, url, name, tags, source, mime_type)
+
+    async def get_item_info(self, item_id: str) -> Dict[str, Union[str, int, List[str], Dict[str, str]]]:
+        """
+        GET properties of the specified file. See Item.get_item_info.
+        """
+        return await self._read(self._endpoint.get_item_info, item_id)
+
+    async def get_items_info(
+        self,
+        item_ids: Iterable[str]
+    ) -> Dict[str, Dict[str, Union[str, int, List[str], Dict[str, str]]]]:
+        """
+        GET properties of many files at once. See Item.get_items_info.
+
+        Requests run concurrently up to the client's max_concurrency.
+        """
+        unique_ids = list(dict.fromkeys(item_ids))
+        responses = await asyncio.gather(
+            *(self.get_item_info(item_id) for item_id in unique_ids), return_exceptions=True
+        )
+        results = {}
+        for item_id, response in zip(unique_ids, responses):
+            if isinstance(response, Exception):
+                response = {"status": "error", "message": str(response)}
+            results[item_id] = response
+        return results
+
+    async def get_item_thumbnail(self, item_id: str) -> Dict[str, Union[str, int, List[str], Dict[str, str]]]:
+        """
+        GET the path of the thumbnail of the specified file. See Item.get_item_thumbnail.
+        """
+        return await self._read(self._endpoint.get_item_thumbnail, item_id)
+
+    async def list_items(
+        self,
+        order_by: str,
+        limit: int,
+        ext: Optional[str] = None,
+        name: Optional[str] = None,
+        folders: Optional[List[str]] = None,
+        tags: Optional[List[str]] = None,
+        offset: Optional[int] = None
+    ) -> Dict[str, Union[str, int, List[str], Dict[str, str]]]:
+        """
+        GET items that match the filter condition. See Item.list_items.
+        """
+        return await self._read(self._endpoint.list_items, order_by, limit, ext, name, folders, tags, offset)
+
+    async def iter_items(
+        self,
+        order_by: str = "CREATEDATE",
+        page_size: int = 200,
+        ext: Optional[str] = None,
+        name: Optional[str] = None,
+        folders: Optional[List[str]] = None,
+        tags: Optional[List[str]] = None,
+        prefetch: bool = True
+    ) -> AsyncIterator[Dict[str, Union[str, int, List[str], Dict[str, str]]]]:
+        """
+        Asynchronously iterate over every item that matches the filter condition. See Item.iter_items.
+        """
+        async def fetch(offset):
+            response = await self.list_items(order_by, page_size, ext, name, folders, tags, offset=offset)
+            if not isinstance(response, dict) or response.get("status") != "success":
+                raise EagleAPIError(f"Listing items failed at page {offset}", response)
+            return response.get("data") or []
+
+        offset = 0
+        task = asyncio.ensure_future(fetch(offset))
+        try:
+            while task is not None:
+                page = await task
+                offset += 1
+                task = None
+                if len(page) == page_size:
+                    next_page = fetch(offset)
+                    task = asyncio.ensure_future(next_page) if prefetch else next_page
+                for item in page:
+                    yield item
+                del page
+        finally:
+            if asyncio.isfuture(task):
+                task.cancel()
+            elif task is not None:
+                task.close()
+
+    async def move_items_to_trash(self, item_ids: List[str]) -> Dict[str, Union[str, int, List[str], Dict[str, str]]]:
+        """
+        POST move items to trash. See Item.move_items_to_trash.
+        """
+        return await self._call(self._endpoint.move_items_to_trash, item_ids)
+
+    async def refresh_palette(self, item_id: str) -> Dict[str, Union[str, int, List[str], Dict[str, str]]]:
+        """
+        POST re-analyze the color of the file. See Item.refresh_palette.
+        """
+        return await self._call(self._endpoint.refresh_palette, item_id)
+
+    async def refresh_thumbnail(self, item_id: str) -> Dict[str, Union[str, int, List[str], Dict[str, str]]]:
+        """
+        POST re-generate the thumbnail of the file. See Item.refresh_thumbnail.
+        """
+        return await self._call(self._endpoint.refresh_thumbnail, item_id)
+
+    async def update_item(
+        self,
+        item_id: str,
+        tags: Optional[List[str]] = None,
+        annotation: Optional[str] = None,
+        url: Optional[str] = None,
+        star: Optional[int] = None,
+        folders: Optional[List[str]] = None
+    ) -> Dict[str, Union[str, int, List[str], Dict[str, str]]]:
+        """
+        POST modify data of specified fields of the item. See Item.update_item.
+        """
+        return await self._call(self._endpoint.update_item, item_id, tags, annotation, url, star, folders)
+
+
+class AsyncLibrary(_AsyncEndpoint):
+    async def get_library_info(self) -> dict:
+        """
+        GET detailed information of the library currently running.
+        """
+        return await self._read(self._endpoint.get_library_info)
+
+    async def switch_library(self, library_path: str) -> dict:
+        """
+        POST switch the library currently opened by Eagle. See Library.switch_library.
+        """
+        return await self._call(self._endpoint.switch_library, library_path)
+
+    async def get_library_history(self) -> dict:
+        """
+        GET the list of libraries recently opened by the application.
+        """
+        return await self._read(self._endpoint.get_library_history)
+
+    def get_library_icon(self, library_path: str) -> str:
+        """
+        Build the icon URL of the specified library. No request is sent, so this is not a coroutine.
+        """
+        return self._endpoint.get_library_icon(library_path)
+
+
+class AsyncEagleClient:
+    def __init__(
+        self,
+        base_url,
+        max_concurrency: int = 10,
+        timeout: Optional[Timeout] = (3.05, 30),
+        transport: Optional[Transport] = None,
+        cache: Optional[ResponseCache] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        retry: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        single_flight: Optional[SingleFlight] = None,
+        codec: Optional[Codec] = None
+    ):
+        """
+        Create an asyncio client mirroring EagleClient.
+
+        Requests run on a bounded worker pool over one shared pooled transport, so the
+        event loop is never blocked. Any number of calls can be awaited together; at most
+        ``max_concurrency`` of them reach the Eagle app at the same time, the rest wait
+        in the queue.
+        With ``single_flight``, identical concurrent reads are also coalesced on the event
+        loop, so they share one worker thread as well as one HTTP request.
+
+        Parameters:
+            base_url (str): The base URL of the Eagle API, e.g. http://localhost:41595.
+            max_concurrency (int): The maximum number of requests in flight at once.
+            timeout (Optional[Timeout]): Default timeout in seconds, either a single value or a (connect, read) tuple.
+            transport (Optional[Transport]): An existing transport to use instead of creating one.
+            cache (Optional[ResponseCache]): Opt-in cache for read-only endpoints. Ignored when a transport is given.
+            instrumentation (Optional[Instrumentation]): Opt-in request metrics and hooks. Ignored when a transport is given.
+            retry (Optional[RetryPolicy]): Opt-in retries with backoff. Ignored when a transport is given.
+            circuit_breaker (Optional[CircuitBreaker]): Opt-in fail-fast breaker. Ignored when a transport is given.
+            scheduler (Optional[RequestScheduler]): Opt-in rate limit with priority lanes. Ignored when a transport is given.
+            single_flight (Optional[SingleFlight]): Opt-in coalescing of identical concurrent GETs. Ignored when a transport is given.
+            codec (Optional[Codec]): JSON codec for bodies, e.g. codec.best_codec(). Ignored when a transport is given.
+        """
+        self.base_url = base_url
+        self.max_concurrency = max_concurrency
+        if transport is None:
+            transport = Transport(
+                pool_maxsize=max_concurrency,
+                timeout=timeout,
+                cache=cache,
+                instrumentation=instrumentation,
+                retry=retry,
+                circuit_breaker=circuit_breaker,
+                scheduler=scheduler,
+                single_flight=single_flight,
+                codec=codec
+            )
+        self.transport = transport
+        self.cache = transport.cache
+        self.instrumentation = transport.instrumentation
+        self.scheduler = transport.scheduler
+        self.single_flight = AsyncSingleFlight() if transport.single_flight is not None else None
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="eaglepy")
+        flights = self.single_flight
+        self.application = AsyncApplication(Application(base_url, session=transport), self._executor, flights)
+        self.folder = AsyncFolder(Folder(base_url, session=transport), self._executor, flights)
+        self.item = AsyncItem(Item(base_url, session=transport), self._executor, flights)
+        self.library = AsyncLibrary(Library(base_url, session=transport), self._executor, flights)
+
+    def raw(self):
+        """
+        Context manager in which the endpoint methods awaited inside the block return the undecoded
+        JSON body as bytes. See Transport.raw.
+        """
+        return self.transport.raw()
+
+    async def close(self) -> None:
+        """
+        Wait for queued requests, then close the worker pool and the pooled connections.
+        """
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, self._executor.shutdown)
+        self.transport.close()
+
+    async def __aenter__(self) -> "AsyncEagleClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
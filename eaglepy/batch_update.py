@@ -0,0 +1,167 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from .item import Item
+from .scheduler import bind_lane
+
+ResultCallback = Callable[[str, Optional[Dict[str, Any]], Optional[BaseException]], None]
+
+logger = logging.getLogger(__name__)
+
+
+class BatchUpdater:
+    def __init__(
+        self,
+        item: Item,
+        max_pending: int = 500,
+        flush_interval: Optional[float] = 2.0,
+        max_workers: int = 4,
+        on_result: Optional[ResultCallback] = None
+    ):
+        """
+        Write-behind buffer for Item.update_item that coalesces edits to the same item.
+
+        Pending edits to one item are merged: tags are unioned in first-seen order, while
+        annotation, url and star keep the last value written. Each item is then sent with a
+        single update_item call when ``max_pending`` items are waiting, every
+        ``flush_interval`` seconds, or when flush is called.
+
+        Parameters:
+            item (Item): The item endpoint used to send updates.
+            max_pending (int): Flush as soon as this many distinct items have pending edits.
+            flush_interval (Optional[float]): Seconds between background flushes. None disables the timer.
+            max_workers (int): The maximum number of update requests in flight during a flush.
+            on_result (Optional[ResultCallback]): Called with the item ID, the response and the error of each update.
+        """
+        self.item = item
+        self.max_pending = max_pending
+        self.flush_interval = flush_interval
+        self.on_result = on_result
+        self.updates = 0
+        self.sent = 0
+        self.failed = 0
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._closed = threading.Event()
+        self._timer = None
+        if flush_interval is not None:
+            # Background flushes use the lane of the thread that created the updater.
+            timer = bind_lane(item.session, self._run_timer)
+            self._timer = threading.Thread(target=timer, name="eaglepy-batch-update", daemon=True)
+            self._timer.start()
+
+    def update(
+        self,
+        item_id: str,
+        tags: Optional[List[str]] = None,
+        annotation: Optional[str] = None,
+        url: Optional[str] = None,
+        star: Optional[int] = None
+    ) -> None:
+        """
+        Queue an edit of an item. Arguments mirror Item.update_item; None leaves a field unchanged.
+
+        Raises:
+            RuntimeError: If the updater is closed.
+        """
+        with self._lock:
+            # Checked under the lock that close takes, so no edit is queued after the last flush.
+            if self._closed.is_set():
+                raise RuntimeError("BatchUpdater is closed")
+            self.updates += 1
+            pending = self._pending.setdefault(item_id, {})
+            if tags is not None:
+                merged = pending.setdefault("tags", {})
+                for tag in tags:
+                    merged[tag] = None
+            if annotation is not None:
+                pending["annotation"] = annotation
+            if url is not None:
+                pending["url"] = url
+            if star is not None:
+                pending["star"] = star
+            full = len(self._pending) >= self.max_pending
+        if full:
+            self.flush()
+
+    def flush(self) -> Dict[str, Any]:
+        """
+        Send every pending edit now and wait for the responses.
+
+        Returns:
+            Dict[str, Any]: The response, or the raised exception, for each flushed item ID.
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+            if not batch:
+                return {}
+            update_item = bind_lane(self.item.session, self.item.update_item)
+            futures = {
+                item_id: self._executor.submit(
+                    update_item,
+                    item_id,
+                    list(fields["tags"]) if "tags" in fields else None,
+                    fields.get("annotation"),
+                    fields.get("url"),
+                    fields.get("star")
+                )
+                for item_id, fields in batch.items()
+            }
+            results = {}
+            for item_id, future in futures.items():
+                error = future.exception()
+                response = future.result() if error is None else None
+                with self._lock:
+                    self.sent += 1
+                    if error is not None or not isinstance(response, dict) or response.get("status") != "success":
+                        self.failed += 1
+                results[item_id] = error if error is not None else response
+                if self.on_result is not None:
+                    try:
+                        self.on_result(item_id, response, error)
+                    except Exception:
+                        # A failing callback must not stop the other results or the timer thread.
+                        logger.exception("on_result callback failed for item %s", item_id)
+            return results
+
+    @property
+    def pending(self) -> int:
+        """
+        The number of distinct items with edits waiting to be sent.
+        """
+        return len(self._pending)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return the number of queued edits, sent requests, failed requests and pending items.
+        """
+        with self._lock:
+            return {"updates": self.updates, "sent": self.sent, "failed": self.failed, "pending": len(self._pending)}
+
+    def close(self) -> None:
+        """
+        Flush the remaining edits and stop the background timer.
+        """
+        if self._closed.is_set():
+            return
+        with self._lock:
+            self._closed.set()
+        if self._timer is not None:
+            self._timer.join()
+        self.flush()
+        self._executor.shutdown()
+
+    def __enter__(self) -> "BatchUpdater":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _run_timer(self) -> None:
+        while not self._closed.wait(self.flush_interval):
+            self.flush()
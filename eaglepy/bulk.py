@@ -0,0 +1,353 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from .item import Item
+from .resilience import RetryPolicy
+from .scheduler import bind_lane
+
+
+class ChunkResult(NamedTuple):
+    """
+    The final outcome of one chunk of a bulk operation.
+
+    Attributes:
+        index (int): Position of the chunk in the input, starting at 0.
+        items (List[Any]): The entries sent in this chunk.
+        response (Optional[Dict]): The last response from the server, if any.
+        error (Optional[BaseException]): The exception of the last attempt, if it raised.
+        attempts (int): How many times the chunk was sent.
+        completed (int): Number of entries in successful chunks so far, this one included.
+        processed (int): Number of entries in finished chunks so far, successful or not.
+    """
+    index: int
+    items: List[Any]
+    response: Optional[Dict]
+    error: Optional[BaseException]
+    attempts: int
+    completed: int
+    processed: int
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and is_success(self.response)
+
+
+def is_success(response: Optional[Dict]) -> bool:
+    """
+    Whether an Eagle API response reports success.
+    """
+    return isinstance(response, dict) and response.get("status") == "success"
+
+
+def chunked(iterable: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """
+    Split an iterable into lists of at most ``size`` entries without materialising it.
+    """
+    if size < 1:
+        raise ValueError("size must be at least 1")
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_chunks(
+    chunks: Iterable[List[Any]],
+    send: Callable[[List[Any]], Dict],
+    max_workers: int = 4,
+    max_retries: int = 2,
+    backoff_base: float = 0.1,
+    backoff_max: float = 5.0,
+    sleep: Callable[[float], None] = time.sleep
+) -> Iterator[ChunkResult]:
+    """
+    Send chunks over a bounded worker pool and yield each chunk's outcome as it finishes.
+
+    A chunk that raises or gets a non-success response is sent again, up to ``max_retries``
+    extra times, after a jittered exponential backoff so an overloaded Eagle app gets time to
+    recover. The wait happens in the worker, so other chunks keep going meanwhile. Chunks that
+    succeeded are never resent. Results are yielded in completion
+    order, not input order; use ``ChunkResult.index`` to match them up.
+
+    Parameters:
+        chunks (Iterable[List[Any]]): The chunks to send. Consumed lazily.
+        send (Callable[[List[Any]], Dict]): Sends one chunk and returns the API response.
+        max_workers (int): The maximum number of chunks in flight at once.
+        max_retries (int): How many times a failed chunk is retried.
+        backoff_base (float): Upper bound, in seconds, of the delay before the first retry. Doubles on each retry.
+        backoff_max (float): Upper bound, in seconds, of any delay.
+        sleep (Callable[[float], None]): Function used to wait before a retry.
+
+    Returns:
+        Iterator[ChunkResult]: One result per chunk.
+    """
+    policy = RetryPolicy(max_retries, backoff_base, backoff_max, sleep=sleep)
+    source = enumerate(chunks)
+    completed = 0
+    processed = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {}
+
+        def submit(index, chunk, attempts):
+            if attempts > 1:
+                future = executor.submit(_send_later, policy.backoff(attempts - 1), policy.sleep, send, chunk)
+            else:
+                future = executor.submit(send, chunk)
+            pending[future] = (index, chunk, attempts)
+
+        for index, chunk in islice(source, max_workers):
+            submit(index, chunk, 1)
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, chunk, attempts = pending.pop(future)
+                error = future.exception()
+                response = None if error is not None else future.result()
+                if (error is not None or not is_success(response)) and attempts <= max_retries:
+                    submit(index, chunk, attempts + 1)
+                    continue
+                processed += len(chunk)
+                if error is None and is_success(response):
+                    completed += len(chunk)
+                yield ChunkResult(index, chunk, response, error, attempts, completed, processed)
+                for next_index, next_chunk in islice(source, 1):
+                    submit(next_index, next_chunk, 1)
+
+
+def _send_later(delay: float, sleep: Callable[[float], None], send: Callable[[List[Any]], Dict], chunk: List[Any]) -> Dict:
+    sleep(delay)
+    return send(chunk)
+
+
+class BulkImporter:
+    def __init__(
+        self,
+        item: Item,
+        chunk_size: int = 500,
+        max_workers: int = 4,
+        max_retries: int = 2,
+        backoff_base: float = 0.1,
+        backoff_max: float = 5.0
+    ):
+        """
+        Import large batches of files or URLs as many smaller add_items_from_* calls.
+
+        Parameters:
+            item (Item): The item endpoint used to send each chunk.
+            chunk_size (int): The number of entries per request.
+            max_workers (int): The maximum number of chunks in flight at once.
+            max_retries (int): How many times a failed chunk is retried.
+            backoff_base (float): Upper bound, in seconds, of the delay before the first retry. Doubles on each retry.
+            backoff_max (float): Upper bound, in seconds, of any delay.
+        """
+        self.item = item
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+    def import_paths(
+        self,
+        items: Iterable[Dict[str, Any]],
+        folder_id: Optional[str] = None
+    ) -> Iterator[ChunkResult]:
+        """
+        Add local files in chunks through Item.add_items_from_paths.
+
+        Parameters:
+            items (Iterable[Dict[str, Any]]): The entries, as accepted by add_items_from_paths.
+            folder_id (Optional[str]): If defined, the files will be added to the corresponding folder.
+
+        Returns:
+            Iterator[ChunkResult]: One result per chunk, yielded as chunks finish.
+        """
+        return self._run(items, lambda chunk: self.item.add_items_from_paths(chunk, folder_id))
+
+    def import_urls(
+        self,
+        items: Iterable[Dict[str, Any]],
+        folder_id: Optional[str] = None
+    ) -> Iterator[ChunkResult]:
+        """
+        Add images from URLs in chunks through Item.add_items_from_urls.
+
+        Parameters:
+            items (Iterable[Dict[str, Any]]): The entries, as accepted by add_items_from_urls.
+            folder_id (Optional[str]): If defined, the images will be added to the corresponding folder.
+
+        Returns:
+            Iterator[ChunkResult]: One result per chunk, yielded as chunks finish.
+        """
+        return self._run(items, lambda chunk: self.item.add_items_from_urls(chunk, folder_id))
+
+    def _run(self, items: Iterable[Dict[str, Any]], send: Callable[[List[Any]], Dict]) -> Iterator[ChunkResult]:
+        send = bind_lane(self.item.session, send)
+        return run_chunks(chunked(items, self.chunk_size), send, self.max_workers, self.max_retries,
+                          self.backoff_base, self.backoff_max)
+
+
+class BulkSummary(NamedTuple):
+    """
+    The outcome of one BulkItemOperations call.
+
+    Attributes:
+        processed (List[str]): IDs processed by this call.
+        failed (List[str]): IDs that still failed after every retry.
+        skipped (int): IDs skipped because an earlier call already processed them.
+        chunks (int): The number of chunks sent.
+    """
+    processed: List[str]
+    failed: List[str]
+    skipped: int
+    chunks: int
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+
+class BulkItemOperations:
+    def __init__(
+        self,
+        item: Item,
+        chunk_size: int = 500,
+        max_workers: int = 4,
+        max_retries: int = 2,
+        backoff_base: float = 0.1,
+        backoff_max: float = 5.0,
+        state_path: Optional[str] = None,
+        progress: Optional[Callable[[ChunkResult, int], None]] = None
+    ):
+        """
+        Trash or move very large sets of items in chunks, with progress and resume.
+
+        The IDs processed by each operation are tracked, so calling the same operation again,
+        e.g. after a crash or with failed IDs, only sends the IDs not processed yet. With
+        ``state_path`` this survives restarts: the IDs of each chunk are appended to the file as
+        one JSON line, so saving costs the same for the last chunk as for the first.
+
+        Parameters:
+            item (Item): The item endpoint used to send each chunk.
+            chunk_size (int): The number of IDs per chunk.
+            max_workers (int): The maximum number of chunks in flight at once.
+            max_retries (int): How many times a failed chunk is retried.
+            backoff_base (float): Upper bound, in seconds, of the delay before the first retry. Doubles on each retry.
+            backoff_max (float): Upper bound, in seconds, of any delay.
+            state_path (Optional[str]): JSON-lines file keeping the processed IDs across restarts. Kept in memory when None.
+            progress (Optional[Callable[[ChunkResult, int], None]]): Called after each chunk with its result
+                and the number of IDs this call has to process.
+        """
+        self.item = item
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.state_path = state_path
+        self.progress = progress
+        self.processed = {}
+        self._unsaved = []
+        self._lock = threading.Lock()
+        if state_path is not None and os.path.exists(state_path):
+            with open(state_path) as handle:
+                for line in handle:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # A line cut short by a crash; its IDs are simply processed again.
+                        continue
+                    self.processed.setdefault(entry["operation"], set()).update(entry["ids"])
+
+    def trash(self, item_ids: Iterable[str]) -> BulkSummary:
+        """
+        Move items to the trash through Item.move_items_to_trash, one request per chunk.
+        """
+        def send(chunk):
+            response = self.item.move_items_to_trash(chunk)
+            if is_success(response):
+                self._mark("trash", chunk)
+            return response
+
+        return self._run("trash", item_ids, send)
+
+    def move(self, item_ids: Iterable[str], folder_ids: List[str]) -> BulkSummary:
+        """
+        Set the folders of items through Item.update_item, one request per item.
+
+        The API has no bulk update, so each chunk sends its items one by one while chunks run
+        concurrently. A retried chunk skips the items that already succeeded. Note that the
+        ``folders`` field of update_item is not part of the documented Eagle API: Eagle versions
+        that ignore it still report success, so an item only counts as moved when the returned
+        item has the requested folders.
+
+        Parameters:
+            item_ids (Iterable[str]): IDs of the items.
+            folder_ids (List[str]): IDs of the folders the items should belong to, replacing their current ones.
+        """
+        operation = "move:" + ",".join(sorted(folder_ids))
+
+        def send(chunk):
+            done = self.processed[operation]
+            for item_id in chunk:
+                if item_id in done:
+                    continue
+                response = self.item.update_item(item_id, folders=folder_ids)
+                if not is_success(response):
+                    return response
+                data = response.get("data")
+                if not isinstance(data, dict) or sorted(data.get("folders") or []) != sorted(folder_ids):
+                    return {"status": "error", "message": f"Eagle did not set the folders of {item_id}"}
+                self._mark(operation, [item_id])
+            return {"status": "success"}
+
+        return self._run(operation, item_ids, send)
+
+    def _run(self, operation: str, item_ids: Iterable[str], send: Callable[[List[str]], Dict]) -> BulkSummary:
+        done = self.processed.setdefault(operation, set())
+        unique_ids = list(dict.fromkeys(item_ids))
+        pending = [item_id for item_id in unique_ids if item_id not in done]
+        chunks = 0
+        failed = []
+        send = bind_lane(self.item.session, send)
+        results = run_chunks(chunked(pending, self.chunk_size), send, self.max_workers, self.max_retries,
+                             self.backoff_base, self.backoff_max)
+        for result in results:
+            chunks += 1
+            if not result.ok:
+                failed.extend(item_id for item_id in result.items if item_id not in done)
+            self._save()
+            if self.progress is not None:
+                self.progress(result, len(pending))
+        failed_ids = set(failed)
+        processed = [item_id for item_id in pending if item_id not in failed_ids]
+        return BulkSummary(processed, failed, len(unique_ids) - len(pending), chunks)
+
+    def _mark(self, operation: str, item_ids: Iterable[str]) -> None:
+        item_ids = list(item_ids)
+        with self._lock:
+            self.processed.setdefault(operation, set()).update(item_ids)
+            if self.state_path is not None:
+                self._unsaved.append((operation, item_ids))
+
+    def _save(self) -> None:
+        if self.state_path is None:
+            return
+        with self._lock:
+            unsaved, self._unsaved = self._unsaved, []
+        if not unsaved:
+            return
+        by_operation = {}
+        for operation, item_ids in unsaved:
+            by_operation.setdefault(operation, []).extend(item_ids)
+        with open(self.state_path, "a") as handle:
+            for operation, item_ids in by_operation.items():
+                handle.write(json.dumps({"operation": operation, "ids": item_ids}) + "\n")
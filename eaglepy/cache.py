@@ -0,0 +1,204 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+DEFAULT_TTLS = {
+    "/api/application/info": 60.0,
+    "/api/library/info": 5.0,
+    "/api/folder/list": 5.0,
+    "/api/item/info": 5.0,
+}
+
+# Read endpoints whose cached responses are stale after a successful call to a mutating endpoint.
+# None means every cached entry is stale.
+INVALIDATIONS = {
+    "/api/item/addFromURL": ("/api/item/list", "/api/library/info"),
+    "/api/item/addFromURLs": ("/api/item/list", "/api/library/info"),
+    "/api/item/addFromPath": ("/api/item/list", "/api/library/info"),
+    "/api/item/addFromPaths": ("/api/item/list", "/api/library/info"),
+    "/api/item/addBookmark": ("/api/item/list", "/api/library/info"),
+    "/api/item/update": ("/api/item/info", "/api/item/list"),
+    "/api/item/moveToTrash": ("/api/item/info", "/api/item/list", "/api/library/info"),
+    "/api/item/refreshPalette": ("/api/item/info",),
+    "/api/item/refreshThumbnail": ("/api/item/info", "/api/item/thumbnail"),
+    "/api/folder/create": ("/api/folder/list", "/api/folder/listRecent", "/api/library/info"),
+    "/api/folder/rename": ("/api/folder/list", "/api/folder/listRecent", "/api/library/info"),
+    "/api/folder/update": ("/api/folder/list", "/api/folder/listRecent", "/api/library/info"),
+    "/api/library/switch": None,
+}
+
+# Read endpoints addressed by item ID; only the entries of the IDs a mutation touched are dropped.
+ITEM_ENDPOINTS = ("/api/item/info", "/api/item/thumbnail")
+
+CacheKey = Tuple[str, Tuple[Tuple[str, Any], ...]]
+
+
+def cache_key(url: str, params: Optional[Dict[str, Any]] = None) -> CacheKey:
+    """
+    Build a cache key from a URL and its query parameters, ignoring their order.
+    """
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    for name, value in (params or {}).items():
+        if value is None:
+            continue
+        query.append((name, tuple(value) if isinstance(value, list) else value))
+    return parts.path, tuple(sorted(query, key=repr))
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        maxsize: int = 1024,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Bounded LRU cache of read-only API responses with per-endpoint time-to-live.
+
+        Only endpoints listed in ``ttls`` are cached. Successful calls to mutating endpoints
+        drop the entries they make stale, see ``invalidate_for``.
+
+        Parameters:
+            ttls (Optional[Dict[str, float]]): Seconds to keep responses, by endpoint path. Defaults to DEFAULT_TTLS.
+            maxsize (int): The maximum number of cached responses. The least recently used is evicted first.
+            clock (Callable[[], float]): Monotonic time source, in seconds.
+        """
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.maxsize = maxsize
+        self.clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped by every invalidation, globally and per endpoint, so a response fetched before
+        # an invalidation is not stored after it.
+        self._generation = 0
+        self._generations = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def is_cacheable(self, key: CacheKey) -> bool:
+        return key[0] in self.ttls
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """
+        Return the cached value for a key, or None when it is missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self.clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def generation(self, key: CacheKey) -> Tuple[int, int]:
+        """
+        Return a token that changes whenever entries of the key's endpoint are invalidated.
+
+        Take it before fetching a response and pass it to set, so that a response fetched
+        while a mutation was applied is not cached.
+        """
+        with self._lock:
+            return self._generation, self._generations.get(key[0], 0)
+
+    def set(self, key: CacheKey, value: Any, generation: Optional[Tuple[int, int]] = None) -> None:
+        """
+        Store a value under a key for the TTL of its endpoint.
+
+        When ``generation`` is given and the endpoint was invalidated since it was taken, nothing is stored.
+        """
+        ttl = self.ttls.get(key[0])
+        if not ttl or ttl <= 0:
+            return
+        with self._lock:
+            if generation is not None and generation != (self._generation, self._generations.get(key[0], 0)):
+                return
+            self._entries[key] = (self.clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, path: Optional[str] = None, item_ids: Optional[Iterable[str]] = None) -> int:
+        """
+        Drop cached entries.
+
+        Parameters:
+            path (Optional[str]): Only drop entries of this endpoint. Drops everything when None.
+            item_ids (Optional[Iterable[str]]): Only drop entries whose ``id`` query parameter is one of these.
+
+        Returns:
+            int: The number of entries dropped.
+        """
+        ids = set(item_ids) if item_ids is not None else None
+        with self._lock:
+            if path is None:
+                self._generation += 1
+            else:
+                self._generations[path] = self._generations.get(path, 0) + 1
+            stale = [
+                key for key in self._entries
+                if (path is None or key[0] == path)
+                and (ids is None or dict(key[1]).get("id") in ids)
+            ]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+        return len(stale)
+
+    def invalidate_for(self, path: str, payload: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Drop the entries made stale by a successful call to a mutating endpoint.
+
+        Parameters:
+            path (str): The path of the mutating endpoint, e.g. /api/item/update.
+            payload (Optional[Dict[str, Any]]): The JSON body that was sent, used to find the touched item IDs.
+
+        Returns:
+            int: The number of entries dropped.
+        """
+        if path not in INVALIDATIONS:
+            return 0
+        targets = INVALIDATIONS[path]
+        if targets is None:
+            return self.invalidate()
+        payload = payload if isinstance(payload, dict) else {}
+        item_ids = payload.get("itemIds")
+        if item_ids is None and "id" in payload:
+            item_ids = [payload["id"]]
+        dropped = 0
+        for target in targets:
+            dropped += self.invalidate(target, item_ids if target in ITEM_ENDPOINTS else None)
+        return dropped
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return hit, miss, eviction and invalidation counters and the current size.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
@@ -0,0 +1,249 @@
+import asyncio
+import threading
+import time
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from .exceptions import EagleAPIError
+from .folder import Folder
+from .item import Item
+
+ADDED = "added"
+UPDATED = "updated"
+DELETED = "deleted"
+
+
+class ChangeEvent(NamedTuple):
+    """
+    One change seen by a ChangeFeed.
+
+    Attributes:
+        kind (str): "added", "updated" or "deleted".
+        entity (str): "item" or "folder".
+        id (str): The ID of the item or folder.
+        data (Optional[Dict[str, Any]]): The current item or folder dict. None for deletions.
+    """
+    kind: str
+    entity: str
+    id: str
+    data: Optional[Dict[str, Any]]
+
+
+def item_fingerprint(item: Dict[str, Any]) -> int:
+    """
+    Hash the fields of an item that change when it is edited: timestamps, tags, folders and rating.
+    """
+    return hash((
+        item.get("modificationTime"),
+        item.get("lastModified"),
+        tuple(item.get("tags") or ()),
+        tuple(item.get("folders") or ()),
+        item.get("star"),
+    ))
+
+
+def folder_fingerprint(folder: Dict[str, Any]) -> int:
+    return hash((
+        folder.get("modificationTime"),
+        folder.get("name"),
+        folder.get("description"),
+        folder.get("iconColor"),
+        folder.get("parent"),
+    ))
+
+
+def _walk_folders(folders: Iterable[Dict[str, Any]], parent: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    for folder in folders:
+        yield dict({key: value for key, value in folder.items() if key != "children"}, parent=parent)
+        yield from _walk_folders(folder.get("children") or (), folder["id"])
+
+
+def diff(
+    entity: str,
+    previous: Optional[Dict[str, int]],
+    entries: Iterable[Dict[str, Any]],
+    fingerprint: Callable[[Dict[str, Any]], int]
+) -> Tuple[Dict[str, int], List[ChangeEvent]]:
+    """
+    Compare entries with the fingerprint (ID -> hash) of the previous poll.
+
+    Entries are consumed one at a time and only the changed ones are kept, so a large listing
+    is never held in memory as a whole.
+
+    Parameters:
+        entity (str): "item" or "folder", copied into the events.
+        previous (Optional[Dict[str, int]]): The previous fingerprint. None reports nothing, only fingerprints.
+        entries (Iterable[Dict[str, Any]]): The current items or folders.
+        fingerprint (Callable[[Dict[str, Any]], int]): Hashes one entry.
+
+    Returns:
+        Tuple[Dict[str, int], List[ChangeEvent]]: The new fingerprint and the changes.
+    """
+    current = {}
+    events = []
+    for entry in entries:
+        entity_id = entry["id"]
+        value = current[entity_id] = fingerprint(entry)
+        if previous is None:
+            continue
+        known = previous.get(entity_id)
+        if known is None:
+            events.append(ChangeEvent(ADDED, entity, entity_id, entry))
+        elif known != value:
+            events.append(ChangeEvent(UPDATED, entity, entity_id, entry))
+    for entity_id in previous or ():
+        if entity_id not in current:
+            events.append(ChangeEvent(DELETED, entity, entity_id, None))
+    return current, events
+
+
+class ChangeFeed:
+    def __init__(
+        self,
+        item: Item,
+        folder: Optional[Folder] = None,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+        backoff: float = 1.5,
+        page_size: int = 1000,
+        emit_initial: bool = False,
+        on_error: Optional[Callable[[Exception], None]] = None
+    ):
+        """
+        Change feed of a library built on polling, delivering typed add/update/delete events.
+
+        Each poll lists items and folders and compares them with a compact fingerprint of the
+        previous poll, one integer hash per ID, so no full copy of the library is kept. The
+        polling interval drops to ``min_interval`` as soon as changes are seen and grows by
+        ``backoff`` after every idle poll, up to ``max_interval``. When run by run, start or events,
+        a failed poll, e.g. while Eagle restarts, is reported to ``on_error`` and retried after
+        ``max_interval`` instead of ending the feed.
+
+        Parameters:
+            item (Item): The item endpoint used to list items.
+            folder (Optional[Folder]): The folder endpoint used to list folders. Folders are not watched when None.
+            min_interval (float): Seconds between polls while changes are coming in.
+            max_interval (float): The longest wait between polls when idle.
+            backoff (float): Factor the interval grows by after each poll without changes.
+            page_size (int): The number of items requested per call.
+            emit_initial (bool): Report every existing item and folder as added on the first poll.
+            on_error (Optional[Callable[[Exception], None]]): Called with the exception of every failed poll
+                and of every failed subscriber callback.
+        """
+        self.item = item
+        self.folder = folder
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.page_size = page_size
+        self.emit_initial = emit_initial
+        self.on_error = on_error
+        self.interval = min_interval
+        self.items = None
+        self.folders = None
+        self.polls = 0
+        self.errors = 0
+        self.last_error = None
+        self._callbacks = []
+        self._stop = threading.Event()
+        self._thread = None
+
+    def subscribe(self, callback: Callable[[ChangeEvent], None]) -> None:
+        """
+        Call ``callback`` with every event, in the thread that polls.
+
+        An exception raised by a callback is passed to ``on_error``; the other callbacks and
+        events are still delivered.
+        """
+        self._callbacks.append(callback)
+
+    def unsubscribe(self, callback: Callable[[ChangeEvent], None]) -> None:
+        self._callbacks.remove(callback)
+
+    def poll(self) -> List[ChangeEvent]:
+        """
+        Poll once, deliver the events to the subscribers, adapt the interval and return the events.
+
+        The first poll only records the fingerprint, unless ``emit_initial`` is set.
+        """
+        initial = {} if self.emit_initial else None
+        entries = self.item.iter_items(page_size=self.page_size)
+        items, events = diff("item", self.items if self.items is not None else initial, entries, item_fingerprint)
+        if self.folder is not None:
+            response = self.folder.list_folders()
+            if not isinstance(response, dict) or response.get("status") != "success":
+                raise EagleAPIError("Listing folders failed", response)
+            previous = self.folders if self.folders is not None else initial
+            self.folders, folder_events = diff(
+                "folder", previous, _walk_folders(response["data"]), folder_fingerprint
+            )
+            events.extend(folder_events)
+        self.items = items
+        self.polls += 1
+
+        if events:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.max_interval, self.interval * self.backoff)
+        for event in events:
+            for callback in list(self._callbacks):
+                try:
+                    callback(event)
+                except Exception as error:
+                    self._report(error)
+        return events
+
+    def run(self) -> None:
+        """
+        Poll until stop is called, waiting the adaptive interval between polls.
+        """
+        self._stop.clear()
+        while not self._stop.is_set():
+            self._poll_safely()
+            self._stop.wait(self.interval)
+
+    def start(self) -> "ChangeFeed":
+        """
+        Run the feed in a background thread.
+        """
+        self._thread = threading.Thread(target=self.run, name="eaglepy-change-feed", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop polling. Waits for the background thread started by start, if any.
+        """
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+            self._thread = None
+
+    async def events(self) -> AsyncIterator[ChangeEvent]:
+        """
+        Poll in a worker thread and yield the events as they are seen, until stop is called.
+        """
+        loop = asyncio.get_running_loop()
+        self._stop.clear()
+        while not self._stop.is_set():
+            for event in await loop.run_in_executor(None, self._poll_safely):
+                yield event
+            deadline = time.monotonic() + self.interval
+            while not self._stop.is_set() and time.monotonic() < deadline:
+                await asyncio.sleep(min(0.05, self.interval))
+
+    def __aiter__(self) -> AsyncIterator[ChangeEvent]:
+        return self.events()
+
+    def _poll_safely(self) -> List[ChangeEvent]:
+        try:
+            return self.poll()
+        except Exception as error:
+            self.interval = self.max_interval
+            self._report(error)
+            return []
+
+    def _report(self, error: Exception) -> None:
+        self.errors += 1
+        self.last_error = error
+        if self.on_error is not None:
+            self.on_error(error)
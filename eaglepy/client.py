@@ -1,12 +1,87 @@
+from typing import Optional
+
 from .application import Application
+from .cache import ResponseCache
 from .folder import Folder
+from .instrumentation import Instrumentation
 from .item import Item
 from .library import Library
+from .resilience import CircuitBreaker, RetryPolicy
+from .scheduler import RequestScheduler
+from .singleflight import SingleFlight
+from .transport import Codec, Timeout, Transport
 
 
 class EagleClient:
-    def __init__(self, base_url):
-        self.application = Application(base_url)
-        self.folder = Folder(base_url)
-        self.item = Item(base_url)
-        self.library = Library(base_url)
+    def __init__(
+        self,
+        base_url,
+        pool_maxsize: int = 10,
+        keep_alive: bool = True,
+        timeout: Optional[Timeout] = (3.05, 30),
+        transport: Optional[Transport] = None,
+        cache: Optional[ResponseCache] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        retry: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        single_flight: Optional[SingleFlight] = None,
+        codec: Optional[Codec] = None
+    ):
+        """
+        Create a client whose endpoint classes share one pooled transport.
+
+        Parameters:
+            base_url (str): The base URL of the Eagle API, e.g. http://localhost:41595.
+            pool_maxsize (int): The maximum number of connections kept open to the Eagle app.
+            keep_alive (bool): Whether connections are reused between calls.
+            timeout (Optional[Timeout]): Default timeout in seconds, either a single value or a (connect, read) tuple.
+            transport (Optional[Transport]): An existing transport to use instead of creating one.
+            cache (Optional[ResponseCache]): Opt-in cache for read-only endpoints. Ignored when a transport is given.
+            instrumentation (Optional[Instrumentation]): Opt-in request metrics and hooks. Ignored when a transport is given.
+            retry (Optional[RetryPolicy]): Opt-in retries with backoff. Ignored when a transport is given.
+            circuit_breaker (Optional[CircuitBreaker]): Opt-in fail-fast breaker. Ignored when a transport is given.
+            scheduler (Optional[RequestScheduler]): Opt-in rate limit with priority lanes. Ignored when a transport is given.
+            single_flight (Optional[SingleFlight]): Opt-in coalescing of identical concurrent GETs. Ignored when a transport is given.
+            codec (Optional[Codec]): JSON codec for bodies, e.g. codec.best_codec(). Ignored when a transport is given.
+        """
+        self.base_url = base_url
+        if transport is None:
+            transport = Transport(
+                pool_maxsize=pool_maxsize,
+                keep_alive=keep_alive,
+                timeout=timeout,
+                cache=cache,
+                instrumentation=instrumentation,
+                retry=retry,
+                circuit_breaker=circuit_breaker,
+                scheduler=scheduler,
+                single_flight=single_flight,
+                codec=codec
+            )
+        self.transport = transport
+        self.cache = transport.cache
+        self.instrumentation = transport.instrumentation
+        self.scheduler = transport.scheduler
+        self.application = Application(base_url, session=transport)
+        self.folder = Folder(base_url, session=transport)
+        self.item = Item(base_url, session=transport)
+        self.library = Library(base_url, session=transport)
+
+    def raw(self):
+        """
+        Context manager in which the endpoint methods return the undecoded JSON body as bytes. See Transport.raw.
+        """
+        return self.transport.raw()
+
+    def close(self) -> None:
+        """
+        Close the pooled connections of the shared transport.
+        """
+        self.transport.close()
+
+    def __enter__(self) -> "EagleClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -0,0 +1,46 @@
+import json
+from typing import Any
+
+from .payload import compact_json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JSONCodec:
+    """
+    Request and response body codec backed by the standard library ``json`` module.
+    """
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return compact_json(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    """
+    Codec backed by ``orjson``, several times faster on large bodies. Install with ``pip install eaglepy[fast]``.
+    """
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("OrjsonCodec requires the orjson package")
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+def best_codec():
+    """
+    Return the fastest codec available: OrjsonCodec when orjson is installed, JSONCodec otherwise.
+    """
+    return OrjsonCodec() if orjson is not None else JSONCodec()
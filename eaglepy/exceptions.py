@@ -0,0 +1,24 @@
+class EagleError(Exception):
+    """
+    Base class of the errors raised by eaglepy.
+    """
+
+
+class EagleAPIError(EagleError):
+    """
+    Raised when the Eagle API answers a request with a non-success status.
+    """
+
+    def __init__(self, message: str, response=None):
+        super().__init__(message)
+        self.response = response
+
+
+class CircuitOpenError(EagleError):
+    """
+    Raised without sending a request while the circuit breaker considers the Eagle app unresponsive.
+    """
+
+    def __init__(self, message: str, retry_after: float = 0.0):
+        super().__init__(message)
+        self.retry_after = retry_after
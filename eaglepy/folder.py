@@ -1,15 +1,41 @@
 import requests
-from typing import Optional, Dict
+from typing import Callable, Optional, Dict
+
+from .payload import build_payload
 
 
 class Folder:
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, session=None):
         """
         Initialize the Folder class with the base URL for the API.
 
         :param base_url: The base URL for the API.
+        :param session: Object used to send requests, e.g. a shared Transport. Defaults to the requests module.
         """
         self.base_url = base_url
+        self.session = session if session is not None else requests
+        self._listeners = []
+
+    def add_listener(self, listener: Callable[[str, Dict, Dict], None]) -> None:
+        """
+        Register a callback called after every successful create, rename or update.
+
+        :param listener: Called with the action ("create", "rename" or "update"), the request data and the response.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[str, Dict, Dict], None]) -> None:
+        """
+        Unregister a callback added with add_listener.
+
+        :param listener: The callback to remove.
+        """
+        self._listeners.remove(listener)
+
+    def _notify(self, action: str, data: Dict, result: Dict) -> None:
+        if isinstance(result, dict) and result.get("status") == "success":
+            for listener in list(self._listeners):
+                listener(action, data, result)
 
     def create_folder(self, folder_name: str, parent: Optional[str] = None) -> Dict:
         """
@@ -20,9 +46,11 @@ class Folder:
         :return: The response from the API as a dictionary.
         """
         url = f"{self.base_url}/api/folder/create"
-        data = {"folderName": folder_name, "parent": parent}
-        response = requests.post(url, json=data)
-        return response.json()
+        data = build_payload({"folderName": folder_name, "parent": parent})
+        response = self.session.post(url, json=data)
+        result = response.json()
+        self._notify("create", data, result)
+        return result
 
     def rename_folder(self, folder_id: str, new_name: str) -> Dict:
         """
@@ -33,9 +61,11 @@ class Folder:
         :return: The response from the API as a dictionary.
         """
         url = f"{self.base_url}/api/folder/rename"
-        data = {"folderId": folder_id, "newName": new_name}
-        response = requests.post(url, json=data)
-        return response.json()
+        data = build_payload({"folderId": folder_id, "newName": new_name})
+        response = self.session.post(url, json=data)
+        result = response.json()
+        self._notify("rename", data, result)
+        return result
 
     def update_folder(self, folder_id: str, new_name: str, new_description: str, new_color: str) -> Dict:
         """
@@ -48,14 +78,16 @@ class Folder:
         :return: The response from the API as a dictionary.
         """
         url = f"{self.base_url}/api/folder/update"
-        data = {
+        data = build_payload({
             "folderId": folder_id,
             "newName": new_name,
             "newDescription": new_description,
             "newColor": new_color
-        }
-        response = requests.post(url, json=data)
-        return response.json()
+        })
+        response = self.session.post(url, json=data)
+        result = response.json()
+        self._notify("update", data, result)
+        return result
 
     def list_folders(self) -> Dict:
         """
@@ -64,7 +96,7 @@ class Folder:
         :return: The response from the API as a dictionary.
         """
         url = f"{self.base_url}/api/folder/list"
-        response = requests.get(url)
+        response = self.session.get(url)
         return response.json()
 
     def list_recent_folders(self) -> Dict:
@@ -74,5 +106,5 @@ class Folder:
         :return: The response from the API as a dictionary.
         """
         url = f"{self.base_url}/api/folder/listRecent"
-        response = requests.get(url)
+        response = self.session.get(url)
         return response.json()
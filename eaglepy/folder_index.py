@@ -0,0 +1,230 @@
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .exceptions import EagleAPIError
+from .folder import Folder
+
+
+class FolderNode:
+    """
+    One folder of a FolderIndex.
+
+    Attributes:
+        id (str): The folder's ID.
+        name (str): The folder's name.
+        parent_id (Optional[str]): ID of the parent folder, None for top-level folders.
+        children_ids (List[str]): IDs of the direct sub-folders, in API order.
+        data (Dict[str, Any]): The folder's fields from the API, without ``children``.
+    """
+    __slots__ = ("id", "name", "parent_id", "children_ids", "data")
+
+    def __init__(self, folder_id: str, name: str, parent_id: Optional[str], data: Dict[str, Any]):
+        self.id = folder_id
+        self.name = name
+        self.parent_id = parent_id
+        self.children_ids = []
+        self.data = data
+
+    def __repr__(self) -> str:
+        return f"FolderNode(id={self.id!r}, name={self.name!r}, parent_id={self.parent_id!r})"
+
+
+class FolderIndex:
+    def __init__(self, folders: Iterable[Dict[str, Any]] = (), separator: str = "/"):
+        """
+        Dictionary-backed index of a library's folder tree.
+
+        Folders can be looked up by ID, by name and by full path (names joined with
+        ``separator``, e.g. "Projects/2024/Refs") in constant time.
+
+        Parameters:
+            folders (Iterable[Dict[str, Any]]): The nested folder list, as in the ``data`` of Folder.list_folders.
+            separator (str): The separator between folder names in paths.
+        """
+        self.separator = separator
+        self.roots = []
+        self._by_id = {}
+        self._by_name = {}
+        self._by_path = {}
+        self._paths = {}
+        self._folder_api = None
+        for folder in folders:
+            self._add_tree(folder, None)
+
+    @classmethod
+    def from_response(cls, response: Dict[str, Any], separator: str = "/") -> "FolderIndex":
+        """
+        Build an index from a Folder.list_folders or Library.get_library_info response.
+
+        Raises:
+            EagleAPIError: If the response is not a success or has no folder list.
+        """
+        if not isinstance(response, dict) or response.get("status") != "success":
+            raise EagleAPIError("Listing folders failed", response)
+        data = response.get("data")
+        if isinstance(data, dict):
+            data = data.get("folders")
+        if data is None:
+            raise EagleAPIError("The response has no folder list", response)
+        return cls(data, separator=separator)
+
+    @classmethod
+    def from_folder_api(cls, folder_api: Folder, separator: str = "/") -> "FolderIndex":
+        """
+        Build an index from Folder.list_folders and keep it updated as folders are created,
+        renamed or updated through the same Folder instance.
+        """
+        index = cls.from_response(folder_api.list_folders(), separator=separator)
+        index.attach(folder_api)
+        return index
+
+    def attach(self, folder_api: Folder) -> None:
+        """
+        Apply the successful create, rename and update calls of a Folder instance to this index.
+        """
+        self.detach()
+        folder_api.add_listener(self.apply)
+        self._folder_api = folder_api
+
+    def detach(self) -> None:
+        """
+        Stop following the Folder instance given to attach.
+        """
+        if self._folder_api is not None:
+            self._folder_api.remove_listener(self.apply)
+            self._folder_api = None
+
+    def apply(self, action: str, request: Dict[str, Any], response: Dict[str, Any]) -> None:
+        """
+        Update the index after a successful folder call, without refetching the tree.
+
+        Parameters:
+            action (str): "create", "rename" or "update".
+            request (Dict[str, Any]): The data sent to the API.
+            response (Dict[str, Any]): The response from the API.
+        """
+        data = response.get("data") if isinstance(response.get("data"), dict) else {}
+        if action == "create":
+            folder = dict(data)
+            folder.setdefault("name", request.get("folderName"))
+            folder.setdefault("children", [])
+            if folder.get("id") is not None:
+                self._add_tree(folder, request.get("parent"))
+        elif action in ("rename", "update"):
+            node = self._by_id.get(request.get("folderId"))
+            if node is None:
+                return
+            node.data.update({key: value for key, value in data.items() if key != "children"})
+            if action == "update":
+                if request.get("newDescription") is not None:
+                    node.data["description"] = request["newDescription"]
+                if request.get("newColor") is not None:
+                    node.data["iconColor"] = request["newColor"]
+            new_name = request.get("newName")
+            if new_name is not None and new_name != node.name:
+                self._rename(node, new_name)
+
+    def get(self, folder_id: str) -> Optional[FolderNode]:
+        """
+        Return the folder with the given ID, or None.
+        """
+        return self._by_id.get(folder_id)
+
+    def find_by_name(self, name: str) -> List[FolderNode]:
+        """
+        Return every folder with the given name. Names are not unique across the tree.
+        """
+        return [self._by_id[folder_id] for folder_id in self._by_name.get(name, ())]
+
+    def find_by_path(self, path: str) -> Optional[FolderNode]:
+        """
+        Return the folder at the given path, e.g. "Projects/2024/Refs", or None.
+        """
+        folder_id = self._by_path.get(path.strip(self.separator))
+        return self._by_id.get(folder_id) if folder_id is not None else None
+
+    def path_of(self, folder_id: str) -> Optional[str]:
+        """
+        Return the full path of a folder, or None if the ID is unknown.
+        """
+        return self._paths.get(folder_id)
+
+    def parent(self, folder_id: str) -> Optional[FolderNode]:
+        node = self._by_id.get(folder_id)
+        if node is None or node.parent_id is None:
+            return None
+        return self._by_id.get(node.parent_id)
+
+    def children(self, folder_id: str) -> List[FolderNode]:
+        node = self._by_id.get(folder_id)
+        return [self._by_id[child_id] for child_id in node.children_ids] if node is not None else []
+
+    def ancestors(self, folder_id: str) -> List[FolderNode]:
+        """
+        Return the parents of a folder, nearest first.
+        """
+        result = []
+        node = self.parent(folder_id)
+        while node is not None:
+            result.append(node)
+            node = self.parent(node.id)
+        return result
+
+    def descendants(self, folder_id: str) -> Iterator[FolderNode]:
+        """
+        Iterate over every sub-folder of a folder, depth first.
+        """
+        stack = list(reversed(self.children(folder_id)))
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(self.children(node.id)))
+
+    def __contains__(self, folder_id: str) -> bool:
+        return folder_id in self._by_id
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __iter__(self) -> Iterator[FolderNode]:
+        return iter(self._by_id.values())
+
+    def _add_tree(self, folder: Dict[str, Any], parent_id: Optional[str]) -> None:
+        stack = [(folder, parent_id)]
+        while stack:
+            current, current_parent = stack.pop()
+            data = {key: value for key, value in current.items() if key != "children"}
+            node = FolderNode(current["id"], current.get("name", ""), current_parent, data)
+            self._by_id[node.id] = node
+            self._by_name.setdefault(node.name, []).append(node.id)
+            parent = self._by_id.get(current_parent) if current_parent is not None else None
+            if parent is not None:
+                parent.children_ids.append(node.id)
+                path = self._paths[parent.id] + self.separator + node.name
+            else:
+                self.roots.append(node.id)
+                path = node.name
+            self._paths[node.id] = path
+            self._by_path[path] = node.id
+            for child in reversed(current.get("children") or []):
+                stack.append((child, node.id))
+
+    def _rename(self, node: FolderNode, new_name: str) -> None:
+        ids = self._by_name[node.name]
+        ids.remove(node.id)
+        if not ids:
+            del self._by_name[node.name]
+        self._by_name.setdefault(new_name, []).append(node.id)
+        node.name = new_name
+        node.data["name"] = new_name
+
+        parent_path = self._paths.get(node.parent_id) if node.parent_id is not None else None
+        for current in [node] + list(self.descendants(node.id)):
+            old_path = self._paths[current.id]
+            if self._by_path.get(old_path) == current.id:
+                del self._by_path[old_path]
+            if current is node:
+                path = new_name if parent_path is None else parent_path + self.separator + new_name
+            else:
+                path = self._paths[current.parent_id] + self.separator + current.name
+            self._paths[current.id] = path
+            self._by_path[path] = current.id
@@ -0,0 +1,195 @@
+import bisect
+import threading
+import time
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+from urllib.parse import urlsplit
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class RequestEvent:
+    """
+    One HTTP request observed by Instrumentation, passed to the before and after hooks.
+
+    Attributes:
+        method (str): The HTTP method.
+        endpoint (str): The URL path, e.g. /api/item/info.
+        url (str): The full URL.
+        started (float): ``time.perf_counter()`` when the request started.
+        elapsed (Optional[float]): Seconds the request took. None in before hooks.
+        request_bytes (int): Size of the request body.
+        response_bytes (int): Size of the response body. 0 in before hooks or on errors.
+        status_code (Optional[int]): The HTTP status, if a response was received.
+        error (Optional[BaseException]): The exception raised by the request, if any.
+    """
+    __slots__ = ("method", "endpoint", "url", "started", "elapsed", "request_bytes", "response_bytes",
+                 "status_code", "error")
+
+    def __init__(self, method: str, url: str):
+        self.method = method
+        self.url = url
+        self.endpoint = urlsplit(url).path
+        self.started = time.perf_counter()
+        self.elapsed = None
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.status_code = None
+        self.error = None
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None or (self.status_code is not None and self.status_code >= 400)
+
+
+class _EndpointStats:
+    __slots__ = ("count", "errors", "request_bytes", "response_bytes", "latency_sum", "buckets")
+
+    def __init__(self, bucket_count: int):
+        self.count = 0
+        self.errors = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.latency_sum = 0.0
+        self.buckets = [0] * (bucket_count + 1)
+
+
+class Instrumentation:
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Per-endpoint request metrics with before/after hooks.
+
+        Records counts, error counts, request and response byte totals and a latency
+        histogram for every (method, endpoint) pair, exportable with ``as_dict`` or
+        ``to_prometheus``. A Transport without instrumentation skips all of this.
+
+        Parameters:
+            buckets (Sequence[float]): Upper bounds, in seconds, of the latency histogram buckets.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.before_hooks = []
+        self.after_hooks = []
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def add_before_hook(self, hook: Callable[[RequestEvent], None]) -> None:
+        """
+        Register a callback called before each request is sent.
+        """
+        self.before_hooks.append(hook)
+
+    def add_after_hook(self, hook: Callable[[RequestEvent], None]) -> None:
+        """
+        Register a callback called after each request completes or fails.
+        """
+        self.after_hooks.append(hook)
+
+    def observe(self, send: Callable[..., Any], method: str, url: str, kwargs: Dict[str, Any]) -> Any:
+        """
+        Call ``send(method, url, **kwargs)`` and record it.
+        """
+        event = RequestEvent(method, url)
+        event.request_bytes = _size(kwargs.get("data"))
+        for hook in self.before_hooks:
+            hook(event)
+        try:
+            response = send(method, url, **kwargs)
+        except BaseException as error:
+            event.error = error
+            event.elapsed = time.perf_counter() - event.started
+            self.record(event)
+            raise
+        event.elapsed = time.perf_counter() - event.started
+        event.status_code = getattr(response, "status_code", None)
+        event.request_bytes = _size(getattr(getattr(response, "request", None), "body", None)) or event.request_bytes
+        event.response_bytes = _size(getattr(response, "content", None))
+        self.record(event)
+        return response
+
+    def record(self, event: RequestEvent) -> None:
+        """
+        Add a finished request to the metrics and call the after hooks.
+        """
+        with self._lock:
+            stats = self._stats.get((event.method, event.endpoint))
+            if stats is None:
+                stats = self._stats[(event.method, event.endpoint)] = _EndpointStats(len(self.buckets))
+            stats.count += 1
+            stats.errors += event.failed
+            stats.request_bytes += event.request_bytes
+            stats.response_bytes += event.response_bytes
+            stats.latency_sum += event.elapsed
+            stats.buckets[bisect.bisect_left(self.buckets, event.elapsed)] += 1
+        for hook in self.after_hooks:
+            hook(event)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats = {}
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Export the metrics as ``{"METHOD /path": {...}}`` with counts, error rate, byte totals,
+        mean latency and cumulative histogram buckets keyed by their upper bound.
+        """
+        with self._lock:
+            snapshot = list(self._stats.items())
+        result = {}
+        for (method, endpoint), stats in sorted(snapshot):
+            result[f"{method} {endpoint}"] = {
+                "count": stats.count,
+                "errors": stats.errors,
+                "error_rate": stats.errors / stats.count if stats.count else 0.0,
+                "request_bytes": stats.request_bytes,
+                "response_bytes": stats.response_bytes,
+                "latency_sum": stats.latency_sum,
+                "latency_mean": stats.latency_sum / stats.count if stats.count else 0.0,
+                "latency_buckets": dict(self._cumulative(stats)),
+            }
+        return result
+
+    def to_prometheus(self, prefix: str = "eaglepy") -> str:
+        """
+        Export the metrics in the Prometheus text exposition format.
+        """
+        with self._lock:
+            snapshot = list(self._stats.items())
+        lines = []
+
+        def family(name, kind, help_text, samples):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            lines.extend(samples)
+
+        def labels(method, endpoint, extra=""):
+            return f'{{method="{method}",endpoint="{endpoint}"{extra}}}'
+
+        snapshot.sort()
+        family("requests_total", "counter", "Requests sent to the Eagle API.",
+               [f"{prefix}_requests_total{labels(*key)} {stats.count}" for key, stats in snapshot])
+        family("request_errors_total", "counter", "Requests that raised or returned an HTTP error status.",
+               [f"{prefix}_request_errors_total{labels(*key)} {stats.errors}" for key, stats in snapshot])
+        family("request_bytes_total", "counter", "Bytes sent in request bodies.",
+               [f"{prefix}_request_bytes_total{labels(*key)} {stats.request_bytes}" for key, stats in snapshot])
+        family("response_bytes_total", "counter", "Bytes received in response bodies.",
+               [f"{prefix}_response_bytes_total{labels(*key)} {stats.response_bytes}" for key, stats in snapshot])
+        samples = []
+        for key, stats in snapshot:
+            for bound, count in self._cumulative(stats):
+                le = ',le="{}"'.format("+Inf" if bound == float("inf") else repr(bound))
+                samples.append(f"{prefix}_request_duration_seconds_bucket{labels(*key, le)} {count}")
+            samples.append(f"{prefix}_request_duration_seconds_sum{labels(*key)} {stats.latency_sum}")
+            samples.append(f"{prefix}_request_duration_seconds_count{labels(*key)} {stats.count}")
+        family("request_duration_seconds", "histogram", "Latency of requests to the Eagle API.", samples)
+        return "\n".join(lines) + "\n"
+
+    def _cumulative(self, stats: _EndpointStats) -> List[Tuple[float, int]]:
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets + (float("inf"),), stats.buckets):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+def _size(body: Any) -> int:
+    return len(body) if isinstance(body, (bytes, bytearray, str)) else 0
@@ -1,10 +1,17 @@
 import requests
-from typing import Optional, List, Dict, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Iterable, Iterator, List, Dict, Union
+
+from .exceptions import EagleAPIError
+from .payload import build_payload
+from .scheduler import bind_lane
+from .streaming import Source, stream_json_body
 
 
 class Item:
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, session=None):
         self.base_url = base_url
+        self.session = session if session is not None else requests
 
     def add_item_from_url(
         self,
@@ -30,15 +37,55 @@ class Item:
             Dict[str, Union[str, int, List[str], Dict[str, str]]]: The response from the server.
         """
         api_url = f"{self.base_url}/api/item/addFromURL"
-        data = {
+        data = build_payload({
             "url": url,
             "name": name,
             "website": website,
             "tags": tags,
             "modificationTime": modification_time,
             "headers": headers
-        }
-        response = requests.post(api_url, json=data)
+        })
+        response = self.session.post(api_url, json=data)
+        return response.json()
+
+    def add_item_from_file(
+        self,
+        source: Source,
+        name: str,
+        website: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        modification_time: Optional[int] = None,
+        headers: Optional[Dict[str, str]] = None,
+        mime_type: Optional[str] = None
+    ) -> Dict[str, Union[str, int, List[str], Dict[str, str]]]:
+        """
+        POST add an image from a file or binary stream to Eagle App, sent as a base64 URL.
+
+        The base64 body is encoded and streamed while it is sent, so peak memory stays bounded
+        regardless of the size of the image.
+
+        Parameters:
+            source (Source): The path of the image, or a binary stream opened for reading.
+            name (str): The name of the image to be added.
+            website (Optional[str]): The address of the source of the image.
+            tags (Optional[List[str]]): Tags for the image.
+            modification_time (Optional[int]): The creation date of the image.
+            headers (Optional[Dict[str, str]]): Customize the HTTP headers properties.
+            mime_type (Optional[str]): The MIME type of the image. Guessed from the file name when not defined.
+
+        Returns:
+            Dict[str, Union[str, int, List[str], Dict[str, str]]]: The response from the server.
+        """
+        api_url = f"{self.base_url}/api/item/addFromURL"
+        fields = build_payload({
+            "name": name,
+            "website": website,
+            "tags": tags,
+            "modificationTime": modification_time,
+            "headers": headers
+        })
+        body = stream_json_body(fields, "url", source, mime_type)
+        response = self.session.post(api_url, data=body, headers={"Content-Type": "application/json"})
         return response.json()
 
     def add_items_from_urls(
@@ -57,8 +104,8 @@ class Item:
             Dict[str, Union[str, int, List[str], Dict[str, str]]]: The response from the server.
         """
         api_url = f"{self.base_url}/api/item/addFromURLs"
-        data = {"items": items, "folderId": folder_id}
-        response = requests.post(api_url, json=data)
+        data = build_payload({"items": items, "folderId": folder_id})
+        response = self.session.post(api_url, json=data)
         return response.json()
 
     def add_item_from_path(
@@ -85,15 +132,15 @@ class Item:
             Dict[str, Union[str, int, List[str], Dict[str, str]]]: The response from the server.
         """
         url = f"{self.base_url}/api/item/addFromPath"
-        data = {
+        data = build_payload({
             "path": path,
             "name": name,
             "website": website,
             "tags": tags,
             "annotation": annotation,
             "folderId": folder_id
-        }
-        response = requests.post(url, json=data)
+        })
+        response = self.session.post(url, json=data)
         return response.json()
 
     def add_items_from_paths(
@@ -112,8 +159,8 @@ class Item:
             Dict[str, Union[str, int, List[str], Dict[str, str]]]: The response from the server.
         """
         api_url = f"{self.base_url}/api/item/addFromPaths"
-        data = {"items": items, "folderId": folder_id}
-        response = requests.post(api_url, json=data)
+        data = build_payload({"items": items, "folderId": folder_id})
+        response = self.session.post(api_url, json=data)
         return response.json()
 
     def add_bookmark(
@@ -136,13 +183,47 @@ class Item:
             Dict[str, Union[str, int, List[str], Dict[str, str]]]: The response from the server.
         """
         api_url = f"{self.base_url}/api/item/addBookmark"
-        data = {
+        data = build_payload({
             "url": url,
             "name": name,
             "tags": tags,
             "base64": base64_data
-        }
-        response = requests.post(api_url, json=data)
+        })
+        response = self.session.post(api_url, json=data)
+        return response.json()
+
+    def add_bookmark_from_file(
+        self,
+        url: str,
+        name: str,
+        tags: Optional[List[str]],
+        source: Source,
+        mime_type: Optional[str] = None
+    ) -> Dict[str, Union[str, int, List[str], Dict[str, str]]]:
+        """
+        POST save the link in the URL form to Eagle App, with a thumbnail read from a file or binary stream.
+
+        The thumbnail is base64 encoded and streamed while it is sent, so peak memory stays bounded
+        regardless of its size.
+
+        Parameters:
+            url (str): The link of the image to be saved.
+            name (str): The name of the image to be added.
+            tags (Optional[List[str]]): Tags for the image.
+            source (Source): The path of the thumbnail, or a binary stream opened for reading.
+            mime_type (Optional[str]): The MIME type of the thumbnail. Guessed from the file name when not defined.
+
+        Returns:
+            Dict[str, Union[str, int, List[str], Dict[str, str]]]: The response from the server.
+        """
+        api_url = f"{self.base_url}/api/item/addBookmark"
+        fields = build_payload({
+            "url": url,
+            "name": name,
+            "tags": tags
+        })
+        body = stream_json_body(fields, "base64", source, mime_type)
+        response = self.session.post(api_url, data=body, headers={"Content-Type": "application/json"})
         return response.json()
 
     def get_item_info(self, item_id: str) -> Dict[str, Union[str, int, List[str], Dict[str, str]]]:
@@ -156,9 +237,41 @@ class Item:
             Dict[str, Union[str, int, List[str], Dict[str, str]]]: The response from the server.
         """
         url = f"{self.base_url}/api/item/info?id={item_id}"
-        response = requests.get(url)
+        response = self.session.get(url)
         return response.json()
 
+    def get_items_info(
+        self,
+        item_ids: Iterable[str],
+        max_workers: int = 8
+    ) -> Dict[str, Dict[str, Union[str, int, List[str], Dict[str, str]]]]:
+        """
+        GET properties of many files at once, fetched concurrently.
+
+        Duplicate IDs are fetched once. A failing ID does not abort the batch: its entry holds
+        an error response, ``{"status": "error", "message": ...}``, instead.
+
+        Parameters:
+            item_ids (Iterable[str]): IDs of the files.
+            max_workers (int): The maximum number of requests in flight at once.
+
+        Returns:
+            Dict[str, Dict[str, Union[str, int, List[str], Dict[str, str]]]]: The response for each ID, in input order.
+        """
+        unique_ids = list(dict.fromkeys(item_ids))
+        if not unique_ids:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_ids))) as executor:
+            get_item_info = bind_lane(self.session, self.get_item_info)
+            futures = [(item_id, executor.submit(get_item_info, item_id)) for item_id in unique_ids]
+        results = {}
+        for item_id, future in futures:
+            try:
+                results[item_id] = future.result()
+            except Exception as error:
+                results[item_id] = {"status": "error", "message": str(error)}
+        return results
+
     def get_item_thumbnail(self, item_id: str) -> Dict[str, Union[str, int, List[str], Dict[str, str]]]:
         """
         GET the path of the thumbnail of the specified file.
@@ -170,17 +283,18 @@ class Item:
             Dict[str, Union[str, int, List[str], Dict[str, str]]]: The response from the server.
         """
         url = f"{self.base_url}/api/item/thumbnail?id={item_id}"
-        response = requests.get(url)
+        response = self.session.get(url)
         return response.json()
 
     def list_items(
         self,
         order_by: str,
         limit: int,
-        ext: str,
-        name: str,
-        folders: List[str],
-        tags: List[str]
+        ext: Optional[str] = None,
+        name: Optional[str] = None,
+        folders: Optional[List[str]] = None,
+        tags: Optional[List[str]] = None,
+        offset: Optional[int] = None
     ) -> Dict[str, Union[str, int, List[str], Dict[str, str]]]:
         """
         GET items that match the filter condition.
@@ -188,10 +302,11 @@ class Item:
         Parameters:
             order_by (str): The sorting order. Options: CREATEDATE, FILESIZE, NAME, RESOLUTION.
             limit (int): The number of items to be displayed. Default is 200.
-            ext (str): Filter by the extension type, e.g., jpg, png.
-            name (str): Filter by the keyword.
-            folders (List[str]): Filter by folders. Use ',' to divide folder IDs.
-            tags (List[str]): Filter by tags. Use ',' to divide different tags.
+            ext (Optional[str]): Filter by the extension type, e.g., jpg, png.
+            name (Optional[str]): Filter by the keyword.
+            folders (Optional[List[str]]): Filter by folders. Use ',' to divide folder IDs.
+            tags (Optional[List[str]]): Filter by tags. Use ',' to divide different tags.
+            offset (Optional[int]): The page to return, starting with 0. Each page holds `limit` items.
 
         Returns:
             Dict[str, Union[str, int, List[str], Dict[str, str]]]: The response from the server.
@@ -203,11 +318,70 @@ class Item:
             "ext": ext,
             "name": name,
             "folders": folders,
-            "tags": ",".join(tags)
+            "tags": ",".join(tags) if tags is not None else None
         }
-        response = requests.get(url, params=params)
+        if offset is not None:
+            params["offset"] = offset
+        response = self.session.get(url, params=params)
         return response.json()
 
+    def iter_items(
+        self,
+        order_by: str = "CREATEDATE",
+        page_size: int = 200,
+        ext: Optional[str] = None,
+        name: Optional[str] = None,
+        folders: Optional[List[str]] = None,
+        tags: Optional[List[str]] = None,
+        prefetch: bool = True
+    ) -> Iterator[Dict[str, Union[str, int, List[str], Dict[str, str]]]]:
+        """
+        Iterate over every item that matches the filter condition, one page at a time.
+
+        Only the current page, and the next one while it is prefetched in the background,
+        are held in memory, so memory use does not grow with the size of the library.
+
+        Parameters:
+            order_by (str): The sorting order. Options: CREATEDATE, FILESIZE, NAME, RESOLUTION.
+            page_size (int): The number of items requested per call.
+            ext (Optional[str]): Filter by the extension type, e.g., jpg, png.
+            name (Optional[str]): Filter by the keyword.
+            folders (Optional[List[str]]): Filter by folders.
+            tags (Optional[List[str]]): Filter by tags.
+            prefetch (bool): Whether to fetch the next page while the current one is being consumed.
+
+        Returns:
+            Iterator[Dict[str, Union[str, int, List[str], Dict[str, str]]]]: The items, in server order.
+
+        Raises:
+            EagleAPIError: If a page request does not succeed.
+        """
+        def fetch(offset):
+            response = self.list_items(order_by, page_size, ext, name, folders, tags, offset=offset)
+            if not isinstance(response, dict) or response.get("status") != "success":
+                raise EagleAPIError(f"Listing items failed at page {offset}", response)
+            return response.get("data") or []
+
+        if not prefetch:
+            offset = 0
+            while True:
+                page = fetch(offset)
+                yield from page
+                if len(page) < page_size:
+                    return
+                offset += 1
+
+        fetch = bind_lane(self.session, fetch)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            offset = 0
+            future = executor.submit(fetch, offset)
+            while future is not None:
+                page = future.result()
+                offset += 1
+                future = executor.submit(fetch, offset) if len(page) == page_size else None
+                yield from page
+                del page
+
     def move_items_to_trash(self, item_ids: List[str]) -> Dict[str, Union[str, int, List[str], Dict[str, str]]]:
         """
         POST move items to trash.
@@ -219,8 +393,8 @@ class Item:
             Dict[str, Union[str, int, List[str], Dict[str, str]]]: The response from the server.
         """
         api_url = f"{self.base_url}/api/item/moveToTrash"
-        data = {"itemIds": item_ids}
-        response = requests.post(api_url, json=data)
+        data = build_payload({"itemIds": item_ids})
+        response = self.session.post(api_url, json=data)
         return response.json()
 
     def refresh_palette(self, item_id: str) -> Dict[str, Union[str, int, List[str], Dict[str, str]]]:
@@ -234,8 +408,8 @@ class Item:
             Dict[str, Union[str, int, List[str], Dict[str, str]]]: The response from the server.
         """
         api_url = f"{self.base_url}/api/item/refreshPalette"
-        data = {"id": item_id}
-        response = requests.post(api_url, json=data)
+        data = build_payload({"id": item_id})
+        response = self.session.post(api_url, json=data)
         return response.json()
 
     def refresh_thumbnail(self, item_id: str) -> Dict[str, Union[str, int, List[str], Dict[str, str]]]:
@@ -249,8 +423,8 @@ class Item:
             Dict[str, Union[str, int, List[str], Dict[str, str]]]: The response from the server.
         """
         api_url = f"{self.base_url}/api/item/refreshThumbnail"
-        data = {"id": item_id}
-        response = requests.post(api_url, json=data)
+        data = build_payload({"id": item_id})
+        response = self.session.post(api_url, json=data)
         return response.json()
 
     def update_item(
@@ -259,7 +433,8 @@ class Item:
         tags: Optional[List[str]] = None,
         annotation: Optional[str] = None,
         url: Optional[str] = None,
-        star: Optional[int] = None
+        star: Optional[int] = None,
+        folders: Optional[List[str]] = None
     ) -> Dict[str, Union[str, int, List[str], Dict[str, str]]]:
         """
         POST modify data of specified fields of the item.
@@ -270,17 +445,20 @@ class Item:
             annotation (Optional[str]): Annotations.
             url (Optional[str]): The source URL.
             star (Optional[int]): Ratings.
+            folders (Optional[List[str]]): IDs of the folders the item belongs to, replacing the current ones.
+                Not part of the documented Eagle API; Eagle versions that do not support it ignore the field.
 
         Returns:
             Dict[str, Union[str, int, List[str], Dict[str, str]]]: The response from the server.
         """
         api_url = f"{self.base_url}/api/item/update"
-        data = {
+        data = build_payload({
             "id": item_id,
             "tags": tags,
             "annotation": annotation,
             "url": url,
-            "star": star
-        }
-        response = requests.post(api_url, json=data)
+            "star": star,
+            "folders": folders
+        })
+        response = self.session.post(api_url, json=data)
         return response.json()
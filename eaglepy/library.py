@@ -1,9 +1,12 @@
 import requests
 
+from .payload import build_payload
+
 
 class Library:
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, session=None):
         self.base_url = base_url
+        self.session = session if session is not None else requests
 
     def get_library_info(self) -> dict:
         """
@@ -13,7 +16,7 @@ class Library:
             dict: A dictionary containing details such as all folders, smart folders, tag groups, quick access, etc.
         """
         url = f"{self.base_url}/api/library/info"
-        response = requests.get(url)
+        response = self.session.get(url)
         return response.json()
 
     def switch_library(self, library_path: str) -> dict:
@@ -27,8 +30,8 @@ class Library:
             dict: A dictionary containing the response from the server.
         """
         url = f"{self.base_url}/api/library/switch"
-        data = {"libraryPath": library_path}
-        response = requests.post(url, json=data)
+        data = build_payload({"libraryPath": library_path})
+        response = self.session.post(url, json=data)
         return response.json()
 
     def get_library_history(self) -> dict:
@@ -40,7 +43,7 @@ class Library:
         """
         url = f"{self.base_url}/api/library/history"
         try:
-            response = requests.get(url)
+            response = self.session.get(url)
             response.raise_for_status()
             return response.json()
         except requests.RequestException as error:
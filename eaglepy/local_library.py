@@ -0,0 +1,127 @@
+import json
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional
+
+
+def _read_batch(paths: List[str]) -> List[Dict[str, Any]]:
+    items = []
+    for path in paths:
+        try:
+            with open(path, "rb") as handle:
+                items.append(json.loads(handle.read()))
+        except (OSError, ValueError):
+            continue
+    return items
+
+
+class LocalLibrary:
+    def __init__(self, library_path: str, max_workers: Optional[int] = None, use_processes: bool = False,
+                 batch_size: int = 256):
+        """
+        Read-only access to an Eagle library directly from disk, without the HTTP API.
+
+        An Eagle library is a directory holding ``metadata.json`` with the folder tree and one
+        ``images/<id>.info/metadata.json`` per item. Reading those files is far faster than
+        listing items through the API, and works while Eagle has another library open.
+
+        Parameters:
+            library_path (str): The path of the library, as accepted by Library.switch_library.
+            max_workers (Optional[int]): The number of workers reading item metadata. Defaults to the executor's default.
+            use_processes (bool): Parse metadata in worker processes instead of threads, for CPU-bound scans.
+            batch_size (int): The number of metadata files each worker task reads.
+        """
+        self.library_path = library_path
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+        self.batch_size = batch_size
+
+    @property
+    def images_path(self) -> str:
+        return os.path.join(self.library_path, "images")
+
+    def get_library_info(self) -> dict:
+        """
+        Read the library metadata, shaped like Library.get_library_info.
+
+        Returns:
+            dict: A dictionary containing details such as all folders, smart folders, tag groups, quick access, etc.
+        """
+        with open(os.path.join(self.library_path, "metadata.json"), "rb") as handle:
+            data = json.loads(handle.read())
+        data.setdefault("library", {
+            "path": self.library_path,
+            "name": os.path.splitext(os.path.basename(os.path.normpath(self.library_path)))[0],
+        })
+        return {"status": "success", "data": data}
+
+    def list_folders(self) -> dict:
+        """
+        Read the folder tree, shaped like Folder.list_folders.
+        """
+        return {"status": "success", "data": self.get_library_info()["data"].get("folders") or []}
+
+    def get_item_info(self, item_id: str) -> dict:
+        """
+        Read the metadata of one item, shaped like Item.get_item_info.
+        """
+        items = _read_batch([self._metadata_path(item_id)])
+        if not items:
+            return {"status": "error", "message": f"Item {item_id} not found"}
+        return {"status": "success", "data": items[0]}
+
+    def get_item_thumbnail(self, item_id: str) -> dict:
+        """
+        Return the path of the thumbnail of an item, shaped like Item.get_item_thumbnail.
+
+        Files without a separate thumbnail (e.g. small images) return the original file.
+        """
+        info = self.get_item_info(item_id)
+        if info["status"] != "success":
+            return info
+        item = info["data"]
+        directory = os.path.join(self.images_path, f"{item_id}.info")
+        thumbnail = os.path.join(directory, f"{item['name']}_thumbnail.png")
+        if not os.path.exists(thumbnail):
+            thumbnail = os.path.join(directory, f"{item['name']}.{item.get('ext', '')}")
+        return {"status": "success", "data": thumbnail}
+
+    def iter_items(self, include_deleted: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the metadata of every item, read concurrently in batches.
+
+        Items are yielded in ID order, each as the same dict Item.get_item_info returns in ``data``.
+        Unreadable or half-written metadata files are skipped.
+
+        Parameters:
+            include_deleted (bool): Also yield items that are in the trash.
+
+        Returns:
+            Iterator[Dict[str, Any]]: The item dicts.
+        """
+        paths = iter(self._metadata_paths())
+        batches = iter(lambda: list(islice(paths, self.batch_size)), [])
+        with self._executor() as executor:
+            for batch in executor.map(_read_batch, batches):
+                for item in batch:
+                    if include_deleted or not item.get("isDeleted"):
+                        yield item
+
+    def list_items(self, include_deleted: bool = False) -> dict:
+        """
+        Read every item, shaped like an unpaginated Item.list_items.
+        """
+        return {"status": "success", "data": list(self.iter_items(include_deleted=include_deleted))}
+
+    def _executor(self) -> Executor:
+        if self.use_processes:
+            return ProcessPoolExecutor(max_workers=self.max_workers)
+        return ThreadPoolExecutor(max_workers=self.max_workers)
+
+    def _metadata_path(self, item_id: str) -> str:
+        return os.path.join(self.images_path, f"{item_id}.info", "metadata.json")
+
+    def _metadata_paths(self) -> List[str]:
+        names = sorted(entry.name for entry in os.scandir(self.images_path) if entry.name.endswith(".info"))
+        return [os.path.join(self.images_path, name, "metadata.json") for name in names]
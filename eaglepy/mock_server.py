@@ -0,0 +1,378 @@
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlsplit
+
+Latency = Union[float, Dict[str, float]]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        self.server.mock.connection_opened()
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def _dispatch(self, method: str):
+        parts = urlsplit(self.path)
+        query = {name: ",".join(values) for name, values in parse_qs(parts.query, keep_blank_values=True).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            raw = self.rfile.read(length)
+        elif self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            raw = self._read_chunked()
+        else:
+            raw = b""
+        status, payload = self.server.mock.handle(method, parts.path, query, raw)
+        body = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_chunked(self) -> bytes:
+        chunks = []
+        while True:
+            size = int(self.rfile.readline().split(b";")[0].strip(), 16)
+            if size == 0:
+                self.rfile.readline()
+                return b"".join(chunks)
+            chunks.append(self.rfile.read(size))
+            self.rfile.readline()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MockEagleServer:
+    def __init__(
+        self,
+        latency: Latency = 0.0,
+        failure_rate: float = 0.0,
+        failure_status: int = 500,
+        seed: Optional[int] = None,
+        host: str = "127.0.0.1",
+        port: int = 0
+    ):
+        """
+        In-process HTTP server implementing the Eagle API with in-memory state.
+
+        It serves the /api/application, /api/folder, /api/item and /api/library routes
+        so clients can be exercised end to end, with configurable latency and failure
+        injection for benchmarks and resilience tests.
+
+        Parameters:
+            latency (Latency): Seconds every request waits before answering, or a dict of seconds by path.
+            failure_rate (float): Probability, from 0 to 1, that a request fails with ``failure_status``.
+            failure_status (int): The HTTP status of injected failures.
+            seed (Optional[int]): Seed of the failure injection random generator.
+            host (str): The address to listen on.
+            port (int): The port to listen on. 0 picks a free port.
+        """
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.failure_status = failure_status
+        self.host = host
+        self.port = port
+        self.library_path = "/Users/eagle/Pictures/Mock.library"
+        self.history = [self.library_path]
+        self.items = {}
+        self.folders = []
+        self.recent_folders = []
+        self.request_counts = {}
+        self.connections = 0
+        self._random = random.Random(seed)
+        self._failures = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> "MockEagleServer":
+        """
+        Start serving on a background thread.
+        """
+        self._server = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self._server.daemon_threads = True
+        self._server.mock = self
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, name="eaglepy-mock", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop serving and close the listening socket.
+        """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+
+    def __enter__(self) -> "MockEagleServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    def fail_next(self, path: str, count: int = 1, status: Optional[int] = None) -> None:
+        """
+        Make the next ``count`` requests to ``path`` fail with ``status``.
+        """
+        with self._lock:
+            self._failures[path] = (count, status or self.failure_status)
+
+    def add_items(self, count: int, **fields: Any) -> List[str]:
+        """
+        Seed the library with generated items and return their IDs.
+        """
+        with self._lock:
+            return [self._create_item(dict({"name": f"item{self._next_id}"}, **fields)) for _ in range(count)]
+
+    def connection_opened(self) -> None:
+        with self._lock:
+            self.connections += 1
+
+    def reset_counters(self) -> None:
+        with self._lock:
+            self.request_counts = {}
+            self.connections = 0
+
+    def handle(self, method: str, path: str, query: Dict[str, str], raw: bytes) -> Tuple[int, Any]:
+        """
+        Answer one request. Returns the HTTP status and the JSON-serialisable body.
+        """
+        latency = self.latency.get(path, 0.0) if isinstance(self.latency, dict) else self.latency
+        if latency:
+            time.sleep(latency)
+        with self._lock:
+            self.request_counts[path] = self.request_counts.get(path, 0) + 1
+            failure = self._failures.get(path)
+            if failure is not None:
+                count, status = failure
+                if count <= 1:
+                    del self._failures[path]
+                else:
+                    self._failures[path] = (count - 1, status)
+                return status, {"status": "error", "message": "injected failure"}
+            if self.failure_rate and self._random.random() < self.failure_rate:
+                return self.failure_status, {"status": "error", "message": "injected failure"}
+
+            route = self._routes.get((method, path))
+            if route is None:
+                return 404, {"status": "error", "message": f"unknown route {method} {path}"}
+            try:
+                body = json.loads(raw) if raw else {}
+            except ValueError:
+                return 400, {"status": "error", "message": "invalid JSON"}
+            try:
+                data = route(self, query, body)
+            except KeyError as error:
+                return 200, {"status": "error", "message": f"not found: {error}"}
+            if isinstance(data, bytes):
+                return 200, data
+            return 200, {"status": "success", "data": data} if data is not None else {"status": "success"}
+
+    def _new_id(self) -> str:
+        self._next_id += 1
+        return f"M{self._next_id:012X}"
+
+    def _now(self) -> int:
+        return int(time.time() * 1000)
+
+    def _create_item(self, fields: Dict[str, Any], folder_id: Optional[str] = None) -> str:
+        item_id = self._new_id()
+        source = fields.get("path") or fields.get("url") or ""
+        name = fields.get("name") or source.rsplit("/", 1)[-1] or item_id
+        ext = source.rsplit(".", 1)[-1].lower() if "." in source.rsplit("/", 1)[-1] else fields.get("ext", "jpg")
+        now = fields.get("modificationTime") or self._now()
+        self.items[item_id] = {
+            "id": item_id,
+            "name": name,
+            "size": fields.get("size", 1024),
+            "ext": ext,
+            "tags": list(fields.get("tags") or []),
+            "folders": [folder_id] if folder_id else list(fields.get("folders") or []),
+            "isDeleted": False,
+            "url": fields.get("website") or fields.get("url") or "",
+            "annotation": fields.get("annotation") or "",
+            "modificationTime": now,
+            "lastModified": now,
+            "width": fields.get("width", 640),
+            "height": fields.get("height", 480),
+            "star": fields.get("star", 0),
+            "palettes": [],
+        }
+        return item_id
+
+    def _find_folder(self, folder_id: str, folders: Optional[List[Dict]] = None) -> Optional[Dict]:
+        for folder in self.folders if folders is None else folders:
+            if folder["id"] == folder_id:
+                return folder
+            found = self._find_folder(folder_id, folder["children"])
+            if found is not None:
+                return found
+        return None
+
+    def _folder(self, folder_id: str) -> Dict:
+        folder = self._find_folder(folder_id)
+        if folder is None:
+            raise KeyError(folder_id)
+        return folder
+
+    def _item(self, item_id: str) -> Dict:
+        item = self.items.get(item_id)
+        if item is None or item["isDeleted"]:
+            raise KeyError(item_id)
+        return item
+
+    def _application_info(self, query, body):
+        return {"version": "3.0.0", "prereleaseVersion": None, "buildVersion": "20230101", "execPath": "",
+                "platform": "darwin"}
+
+    def _folder_create(self, query, body):
+        folder = {"id": self._new_id(), "name": body["folderName"], "description": "", "children": [],
+                  "modificationTime": self._now(), "tags": [], "images": [], "imagesMappings": {}, "isExpand": True}
+        parent = body.get("parent")
+        if parent:
+            self._folder(parent)["children"].append(folder)
+        else:
+            self.folders.append(folder)
+        self.recent_folders = [folder["id"]] + [fid for fid in self.recent_folders if fid != folder["id"]][:9]
+        return {key: value for key, value in folder.items() if key != "children"}
+
+    def _folder_rename(self, query, body):
+        folder = self._folder(body["folderId"])
+        folder["name"] = body["newName"]
+        folder["modificationTime"] = self._now()
+        return {key: value for key, value in folder.items() if key != "children"}
+
+    def _folder_update(self, query, body):
+        folder = self._folder(body["folderId"])
+        if body.get("newName") is not None:
+            folder["name"] = body["newName"]
+        if body.get("newDescription") is not None:
+            folder["description"] = body["newDescription"]
+        if body.get("newColor") is not None:
+            folder["iconColor"] = body["newColor"]
+        folder["modificationTime"] = self._now()
+        return {key: value for key, value in folder.items() if key != "children"}
+
+    def _folder_list(self, query, body):
+        return self.folders
+
+    def _folder_list_recent(self, query, body):
+        return [self._find_folder(folder_id) for folder_id in self.recent_folders if self._find_folder(folder_id)]
+
+    def _item_add_from_url(self, query, body):
+        self._create_item(body, body.get("folderId"))
+
+    def _item_add_many(self, query, body):
+        for entry in body.get("items") or []:
+            self._create_item(entry, body.get("folderId"))
+
+    def _item_add_bookmark(self, query, body):
+        self._create_item(dict(body, ext="url"), body.get("folderId"))
+
+    def _item_info(self, query, body):
+        return self._item(query["id"])
+
+    def _item_thumbnail(self, query, body):
+        item = self._item(query["id"])
+        return f"{self.library_path}/images/{item['id']}.info/{item['name']}_thumbnail.png"
+
+    def _item_list(self, query, body):
+        order_by = query.get("orderBy") or "CREATEDATE"
+        limit = int(query.get("limit") or 200)
+        offset = int(query.get("offset") or 0)
+        ext = query.get("ext")
+        keyword = (query.get("name") or "").lower()
+        folders = set(filter(None, (query.get("folders") or "").split(",")))
+        tags = set(filter(None, (query.get("tags") or "").split(",")))
+        items = [
+            item for item in self.items.values()
+            if not item["isDeleted"]
+            and (not ext or item["ext"] == ext)
+            and (not keyword or keyword in item["name"].lower())
+            and (not folders or folders.intersection(item["folders"]))
+            and (not tags or tags.issubset(item["tags"]))
+        ]
+        descending = order_by.startswith("-")
+        field = {"CREATEDATE": "modificationTime", "FILESIZE": "size", "NAME": "name",
+                 "RESOLUTION": "width"}.get(order_by.lstrip("-"), "modificationTime")
+        items.sort(key=lambda item: item[field], reverse=descending)
+        return items[offset * limit:(offset + 1) * limit]
+
+    def _item_move_to_trash(self, query, body):
+        for item_id in body.get("itemIds") or []:
+            self._item(item_id)["isDeleted"] = True
+
+    def _item_refresh(self, query, body):
+        self._item(body["id"])["lastModified"] = self._now()
+
+    def _item_update(self, query, body):
+        item = self._item(body["id"])
+        for field in ("tags", "annotation", "url", "star", "folders"):
+            if body.get(field) is not None:
+                item[field] = body[field]
+        item["lastModified"] = self._now()
+        return item
+
+    def _library_info(self, query, body):
+        return {"folders": self.folders, "smartFolders": [], "quickAccess": [], "tagsGroups": [],
+                "modificationTime": self._now(), "applicationVersion": "3.0.0",
+                "library": {"path": self.library_path, "name": self.library_path.rsplit("/", 1)[-1]}}
+
+    def _library_history(self, query, body):
+        return self.history
+
+    def _library_switch(self, query, body):
+        path = body["libraryPath"]
+        self.library_path = path
+        self.history = [path] + [entry for entry in self.history if entry != path]
+
+    def _library_icon(self, query, body):
+        return b""
+
+    _routes = {
+        ("GET", "/api/application/info"): _application_info,
+        ("POST", "/api/folder/create"): _folder_create,
+        ("POST", "/api/folder/rename"): _folder_rename,
+        ("POST", "/api/folder/update"): _folder_update,
+        ("GET", "/api/folder/list"): _folder_list,
+        ("GET", "/api/folder/listRecent"): _folder_list_recent,
+        ("POST", "/api/item/addFromURL"): _item_add_from_url,
+        ("POST", "/api/item/addFromURLs"): _item_add_many,
+        ("POST", "/api/item/addFromPath"): _item_add_from_url,
+        ("POST", "/api/item/addFromPaths"): _item_add_many,
+        ("POST", "/api/item/addBookmark"): _item_add_bookmark,
+        ("GET", "/api/item/info"): _item_info,
+        ("GET", "/api/item/thumbnail"): _item_thumbnail,
+        ("GET", "/api/item/list"): _item_list,
+        ("POST", "/api/item/moveToTrash"): _item_move_to_trash,
+        ("POST", "/api/item/refreshPalette"): _item_refresh,
+        ("POST", "/api/item/refreshThumbnail"): _item_refresh,
+        ("POST", "/api/item/update"): _item_update,
+        ("GET", "/api/library/info"): _library_info,
+        ("GET", "/api/library/history"): _library_history,
+        ("POST", "/api/library/switch"): _library_switch,
+        ("GET", "/api/library/icon"): _library_icon,
+    }
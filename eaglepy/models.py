@@ -0,0 +1,295 @@
+import sys
+from array import array
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+
+class Palette(NamedTuple):
+    """
+    One dominant color of an item.
+    """
+    color: Tuple[int, ...]
+    ratio: float
+
+
+def _intern_all(values: Optional[Iterable[str]]) -> Tuple[str, ...]:
+    return tuple(sys.intern(value) for value in values) if values else ()
+
+
+def _pack_palettes(palettes: Optional[Iterable[Dict[str, Any]]]) -> Optional[array]:
+    # Flat (r, g, b, ratio) doubles: one object per item instead of a dict, list and floats per palette.
+    if not palettes:
+        return None
+    packed = array("d")
+    for entry in palettes:
+        color = tuple(entry.get("color") or ())[:3]
+        packed.extend(color + (0,) * (3 - len(color)))
+        packed.append(float(entry.get("ratio") or 0.0))
+    return packed
+
+
+class ItemRecord:
+    """
+    Compact, read-only view of one item from the Eagle API.
+
+    Uses ``__slots__`` instead of a per-object dict, shares tag, folder and extension strings
+    between records through ``sys.intern``, and packs the RGB palettes into one ``array`` of
+    doubles, so the palette dicts of the API response are not kept.
+    """
+    __slots__ = ("id", "name", "size", "ext", "tags", "folders", "is_deleted", "url", "annotation",
+                 "modification_time", "last_modified", "width", "height", "star", "_palettes")
+
+    def __init__(
+        self,
+        item_id: str,
+        name: str = "",
+        size: int = 0,
+        ext: str = "",
+        tags: Sequence[str] = (),
+        folders: Sequence[str] = (),
+        is_deleted: bool = False,
+        url: str = "",
+        annotation: str = "",
+        modification_time: int = 0,
+        last_modified: int = 0,
+        width: int = 0,
+        height: int = 0,
+        star: int = 0,
+        palettes: Optional[Iterable[Dict[str, Any]]] = None
+    ):
+        self.id = item_id
+        self.name = name
+        self.size = size
+        self.ext = sys.intern(ext)
+        self.tags = _intern_all(tags)
+        self.folders = _intern_all(folders)
+        self.is_deleted = is_deleted
+        self.url = url
+        self.annotation = annotation
+        self.modification_time = modification_time
+        self.last_modified = last_modified
+        self.width = width
+        self.height = height
+        self.star = star
+        self._palettes = _pack_palettes(palettes)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ItemRecord":
+        """
+        Build a record from an item dict, as in the ``data`` of Item.get_item_info or Item.list_items.
+        """
+        return cls(
+            data["id"],
+            data.get("name") or "",
+            data.get("size") or 0,
+            data.get("ext") or "",
+            data.get("tags"),
+            data.get("folders"),
+            bool(data.get("isDeleted")),
+            data.get("url") or "",
+            data.get("annotation") or "",
+            data.get("modificationTime") or 0,
+            data.get("lastModified") or 0,
+            data.get("width") or 0,
+            data.get("height") or 0,
+            data.get("star") or 0,
+            data.get("palettes"),
+        )
+
+    @property
+    def palettes(self) -> Tuple[Palette, ...]:
+        """
+        The dominant colors of the item, built from the packed array on each access.
+        """
+        packed = self._palettes
+        if packed is None:
+            return ()
+        return tuple(
+            Palette(tuple(int(value) for value in packed[index:index + 3]), packed[index + 3])
+            for index in range(0, len(packed), 4)
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert back to the API's item dict layout.
+        """
+        return {
+            "id": self.id,
+            "name": self.name,
+            "size": self.size,
+            "ext": self.ext,
+            "tags": list(self.tags),
+            "folders": list(self.folders),
+            "isDeleted": self.is_deleted,
+            "url": self.url,
+            "annotation": self.annotation,
+            "modificationTime": self.modification_time,
+            "lastModified": self.last_modified,
+            "width": self.width,
+            "height": self.height,
+            "star": self.star,
+            "palettes": [{"color": list(palette.color), "ratio": palette.ratio} for palette in self.palettes],
+        }
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, ItemRecord):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"ItemRecord(id={self.id!r}, name={self.name!r}, ext={self.ext!r})"
+
+
+class ItemTable:
+    # Numeric columns: name -> (array typecode, item dict key)
+    COLUMNS = {
+        "size": ("q", "size"),
+        "width": ("l", "width"),
+        "height": ("l", "height"),
+        "modification_time": ("q", "modificationTime"),
+        "last_modified": ("q", "lastModified"),
+        "star": ("b", "star"),
+    }
+
+    def __init__(self):
+        """
+        Columnar store of item metadata for filtering and sorting whole libraries.
+
+        IDs are kept in a list, extensions as small integer codes, and sizes, dimensions,
+        timestamps and ratings in typed ``array`` columns, so no Python object is kept per
+        item besides its ID string.
+        """
+        self.ids = []
+        self.ext_codes = array("H")
+        self.exts = []
+        self._ext_lookup = {}
+        self._columns = {name: array(typecode) for name, (typecode, _) in self.COLUMNS.items()}
+
+    @classmethod
+    def from_items(cls, items: Iterable[Dict[str, Any]]) -> "ItemTable":
+        """
+        Build a table from item dicts, e.g. from Item.iter_items. The iterable is consumed once.
+        """
+        table = cls()
+        table.extend(items)
+        return table
+
+    def append(self, item: Dict[str, Any]) -> None:
+        ext = item.get("ext") or ""
+        code = self._ext_lookup.get(ext)
+        if code is None:
+            code = self._ext_lookup[ext] = len(self.exts)
+            self.exts.append(sys.intern(ext))
+        self.ids.append(item["id"])
+        self.ext_codes.append(code)
+        for name, (_, key) in self.COLUMNS.items():
+            self._columns[name].append(item.get(key) or 0)
+
+    def extend(self, items: Iterable[Dict[str, Any]]) -> None:
+        for item in items:
+            self.append(item)
+
+    def replace(self, index: int, item: Dict[str, Any]) -> None:
+        """
+        Overwrite one row with another item.
+        """
+        ext = item.get("ext") or ""
+        code = self._ext_lookup.get(ext)
+        if code is None:
+            code = self._ext_lookup[ext] = len(self.exts)
+            self.exts.append(sys.intern(ext))
+        self.ids[index] = item["id"]
+        self.ext_codes[index] = code
+        for name, (_, key) in self.COLUMNS.items():
+            self._columns[name][index] = item.get(key) or 0
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def column(self, name: str) -> array:
+        """
+        Return a numeric column: size, width, height, modification_time, last_modified or star.
+        """
+        return self._columns[name]
+
+    def ext_at(self, index: int) -> str:
+        return self.exts[self.ext_codes[index]]
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """
+        Return one row as a dict, with the same keys as the API where they exist.
+        """
+        row = {"id": self.ids[index], "ext": self.ext_at(index)}
+        for name, (_, key) in self.COLUMNS.items():
+            row[key] = self._columns[name][index]
+        return row
+
+    def filter(
+        self,
+        ext: Optional[str] = None,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+        min_width: Optional[int] = None,
+        min_height: Optional[int] = None,
+        min_star: Optional[int] = None,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+        indices: Optional[Iterable[int]] = None
+    ) -> array:
+        """
+        Return the row indices matching every given condition.
+
+        Parameters:
+            ext (Optional[str]): Only items with this extension.
+            min_size (Optional[int]): Only items of at least this many bytes.
+            max_size (Optional[int]): Only items of at most this many bytes.
+            min_width (Optional[int]): Only items at least this wide.
+            min_height (Optional[int]): Only items at least this tall.
+            min_star (Optional[int]): Only items rated at least this.
+            since (Optional[int]): Only items modified at or after this timestamp, in milliseconds.
+            until (Optional[int]): Only items modified before this timestamp, in milliseconds.
+            indices (Optional[Iterable[int]]): Only consider these rows. Defaults to all rows.
+
+        Returns:
+            array: The matching row indices, in ascending order.
+        """
+        selected = array("l", range(len(self.ids)) if indices is None else indices)
+        if ext is not None:
+            code = self._ext_lookup.get(ext)
+            codes = self.ext_codes
+            selected = array("l", (index for index in selected if codes[index] == code))
+        for name, bound, lower in (
+            ("size", min_size, True),
+            ("size", max_size, False),
+            ("width", min_width, True),
+            ("height", min_height, True),
+            ("star", min_star, True),
+            ("modification_time", since, True),
+        ):
+            if bound is None:
+                continue
+            values = self._columns[name]
+            if lower:
+                selected = array("l", (index for index in selected if values[index] >= bound))
+            else:
+                selected = array("l", (index for index in selected if values[index] <= bound))
+        if until is not None:
+            values = self._columns["modification_time"]
+            selected = array("l", (index for index in selected if values[index] < until))
+        return selected
+
+    def sort(self, column: str, indices: Optional[Iterable[int]] = None, reverse: bool = False) -> array:
+        """
+        Return row indices ordered by a numeric column.
+        """
+        values = self._columns[column]
+        rows = range(len(self.ids)) if indices is None else indices
+        return array("l", sorted(rows, key=values.__getitem__, reverse=reverse))
+
+    def ids_at(self, indices: Iterable[int]) -> List[str]:
+        """
+        Return the item IDs of the given rows.
+        """
+        ids = self.ids
+        return [ids[index] for index in indices]
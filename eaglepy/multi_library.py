@@ -0,0 +1,206 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, NamedTuple, Optional
+
+from .client import EagleClient
+from .exceptions import EagleAPIError
+from .local_library import LocalLibrary
+
+
+class LibraryJob(NamedTuple):
+    """
+    A unit of work queued on a LibraryOrchestrator.
+
+    Live jobs are called with the EagleClient while Eagle has their library open. Read-only
+    jobs are called with a LocalLibrary and never switch the app.
+    """
+    library_path: str
+    func: Callable[[Any], Any]
+    read_only: bool
+    name: str
+
+
+class JobResult(NamedTuple):
+    job: LibraryJob
+    result: Any
+    error: Optional[BaseException]
+    elapsed: float
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class SwitchTiming(NamedTuple):
+    """
+    How long one library switch took, from the request until Eagle reported the new library.
+
+    ``error`` holds the exception of a switch that failed.
+    """
+    library_path: str
+    elapsed: float
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class OrchestratorReport(NamedTuple):
+    results: List[JobResult]
+    switches: List[SwitchTiming]
+    elapsed: float
+
+    @property
+    def switch_time(self) -> float:
+        """
+        The total time spent switching libraries, in seconds.
+        """
+        return sum(switch.elapsed for switch in self.switches)
+
+
+class LibraryOrchestrator:
+    def __init__(
+        self,
+        client: EagleClient,
+        max_workers: int = 4,
+        switch_timeout: float = 30.0,
+        poll_interval: float = 0.1
+    ):
+        """
+        Run queued work across many libraries with as few library switches as possible.
+
+        Eagle has one library open at a time, and switching blocks every other user of the app.
+        Live jobs are grouped by library: the open library is served first, then each other
+        library is opened once for all of its jobs. Read-only jobs read the library files from
+        disk through LocalLibrary, concurrently and without switching. The library that was open
+        at the start is restored at the end, also when a job fails.
+
+        Parameters:
+            client (EagleClient): The client used for live jobs and for switching libraries.
+            max_workers (int): The maximum number of read-only jobs run at once.
+            switch_timeout (float): Seconds to wait for Eagle to report a newly opened library.
+            poll_interval (float): Seconds between checks of the open library after a switch.
+        """
+        self.client = client
+        self.max_workers = max_workers
+        self.switch_timeout = switch_timeout
+        self.poll_interval = poll_interval
+        self.jobs = []
+
+    def add(
+        self,
+        library_path: str,
+        func: Callable[[Any], Any],
+        read_only: bool = False,
+        name: Optional[str] = None
+    ) -> LibraryJob:
+        """
+        Queue a job.
+
+        Parameters:
+            library_path (str): The library the job works on.
+            func (Callable[[Any], Any]): Called with the EagleClient, or with a LocalLibrary when read-only.
+            read_only (bool): Read the library from disk instead of opening it in Eagle.
+            name (Optional[str]): A label for the report. Defaults to the function name.
+
+        Returns:
+            LibraryJob: The queued job.
+        """
+        job = LibraryJob(library_path, func, read_only, name or getattr(func, "__name__", repr(func)))
+        self.jobs.append(job)
+        return job
+
+    def run(self) -> OrchestratorReport:
+        """
+        Run every queued job and empty the queue.
+
+        A failing job does not stop the others; its exception is kept in its JobResult. A failed
+        switch is kept in the report too, including a failure to restore the original library.
+
+        Returns:
+            OrchestratorReport: The result of each job in queue order, and the time taken by each switch.
+        """
+        started = time.perf_counter()
+        jobs, self.jobs = self.jobs, []
+        results = {}
+        switches = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                (job, executor.submit(self._run_job, job, LocalLibrary(job.library_path)))
+                for job in jobs if job.read_only
+            ]
+            live = [job for job in jobs if not job.read_only]
+            if live:
+                original = self.current_library()
+                groups = {}
+                for job in live:
+                    groups.setdefault(_normalize(job.library_path), []).append(job)
+                order = sorted(groups, key=lambda path: (path != _normalize(original), path))
+                current = original
+                try:
+                    for path in order:
+                        if path != _normalize(current):
+                            current = groups[path][0].library_path
+                            switch = self._try_switch(current)
+                            switches.append(switch)
+                            if not switch.ok:
+                                for job in groups[path]:
+                                    results[id(job)] = JobResult(job, None, switch.error, 0.0)
+                                continue
+                        for job in groups[path]:
+                            results[id(job)] = self._run_job(job, self.client)
+                finally:
+                    if _normalize(current) != _normalize(original):
+                        switches.append(self._try_switch(original))
+            for job, future in futures:
+                results[id(job)] = future.result()
+        return OrchestratorReport([results[id(job)] for job in jobs], switches, time.perf_counter() - started)
+
+    def current_library(self) -> str:
+        """
+        Return the path of the library Eagle has open.
+        """
+        response = self.client.library.get_library_info()
+        if not isinstance(response, dict) or response.get("status") != "success":
+            raise EagleAPIError("Reading library info failed", response)
+        return response["data"]["library"]["path"]
+
+    def switch(self, library_path: str) -> SwitchTiming:
+        """
+        Open a library and wait until Eagle reports it as open.
+
+        Returns:
+            SwitchTiming: How long the switch took.
+        """
+        started = time.perf_counter()
+        response = self.client.library.switch_library(library_path)
+        if not isinstance(response, dict) or response.get("status") != "success":
+            raise EagleAPIError(f"Switching to {library_path} failed", response)
+        deadline = started + self.switch_timeout
+        while _normalize(self.current_library()) != _normalize(library_path):
+            if time.perf_counter() >= deadline:
+                raise EagleAPIError(f"Eagle did not open {library_path} within {self.switch_timeout}s", response)
+            time.sleep(self.poll_interval)
+        return SwitchTiming(library_path, time.perf_counter() - started)
+
+    def _try_switch(self, library_path: str) -> SwitchTiming:
+        started = time.perf_counter()
+        try:
+            return self.switch(library_path)
+        except Exception as error:
+            return SwitchTiming(library_path, time.perf_counter() - started, error)
+
+    @staticmethod
+    def _run_job(job: LibraryJob, target: Any) -> JobResult:
+        started = time.perf_counter()
+        try:
+            result = job.func(target)
+        except Exception as error:
+            return JobResult(job, None, error, time.perf_counter() - started)
+        return JobResult(job, result, None, time.perf_counter() - started)
+
+
+def _normalize(path: str) -> str:
+    return os.path.normpath(path)
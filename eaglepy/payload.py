@@ -0,0 +1,88 @@
+import json
+from typing import Any, Dict, Iterable, List, Union
+
+# Folder colors accepted by the Eagle app.
+COLORS = ("red", "orange", "green", "yellow", "aqua", "blue", "purple", "pink")
+
+_SEPARATORS = (",", ":")
+
+
+def normalize_tags(tags: Union[str, Iterable[str]]) -> List[str]:
+    """
+    Return tags as a list of stripped, non-empty, unique strings in their original order.
+
+    A single string is treated as one tag. An empty list is kept, as it clears the tags of an item.
+    """
+    if isinstance(tags, str):
+        tags = [tags]
+    result = []
+    seen = set()
+    for tag in tags:
+        if not isinstance(tag, str):
+            raise TypeError(f"Tags must be strings, got {tag!r}")
+        tag = tag.strip()
+        if tag and tag not in seen:
+            seen.add(tag)
+            result.append(tag)
+    return result
+
+
+def normalize_star(star: int) -> int:
+    """
+    Return a rating checked to be an integer from 0 to 5.
+    """
+    if isinstance(star, bool) or not isinstance(star, int) or not 0 <= star <= 5:
+        raise ValueError(f"star must be an integer from 0 to 5, got {star!r}")
+    return star
+
+
+def normalize_color(color: str) -> str:
+    """
+    Return a folder color checked against COLORS, in lower case.
+    """
+    normalized = color.strip().lower() if isinstance(color, str) else color
+    if normalized not in COLORS:
+        raise ValueError(f"color must be one of {', '.join(COLORS)}, got {color!r}")
+    return normalized
+
+
+def _normalize_items(items: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [build_payload(item) for item in items]
+
+
+_NORMALIZERS = {
+    "tags": normalize_tags,
+    "star": normalize_star,
+    "newColor": normalize_color,
+    "items": _normalize_items,
+}
+
+
+def build_payload(fields: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the JSON body of a POST endpoint: drop unset (None) fields and normalise the known ones.
+
+    ``tags`` are normalised with normalize_tags, ``star`` and ``newColor`` are validated, and
+    each entry of ``items`` is built the same way, so bulk calls do not send a null per unset
+    field of every entry.
+
+    Parameters:
+        fields (Dict[str, Any]): The fields of the body, by API name.
+
+    Returns:
+        Dict[str, Any]: The body to send.
+    """
+    payload = {}
+    for key, value in fields.items():
+        if value is None:
+            continue
+        normalize = _NORMALIZERS.get(key)
+        payload[key] = normalize(value) if normalize is not None else value
+    return payload
+
+
+def compact_json(payload: Any) -> bytes:
+    """
+    Encode a body as UTF-8 JSON without the spaces ``json.dumps`` puts after separators.
+    """
+    return json.dumps(payload, separators=_SEPARATORS, ensure_ascii=False).encode()
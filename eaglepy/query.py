@@ -0,0 +1,285 @@
+import abc
+from typing import Any, Dict, Iterable, List, Optional
+
+from .models import ItemTable
+
+
+class Query(abc.ABC):
+    """
+    Boolean condition over an ItemIndex. Combine with ``&``, ``|`` and ``~``.
+    """
+
+    @abc.abstractmethod
+    def bitmap(self, index: "ItemIndex") -> int:
+        """
+        Return the bitmap of the rows matching the condition.
+        """
+
+    def __and__(self, other: "Query") -> "Query":
+        return _And(self, other)
+
+    def __or__(self, other: "Query") -> "Query":
+        return _Or(self, other)
+
+    def __invert__(self) -> "Query":
+        return _Not(self)
+
+
+class HasTag(Query):
+    def __init__(self, tag: str):
+        self.tag = tag
+
+    def bitmap(self, index: "ItemIndex") -> int:
+        return index.tags.get(self.tag, 0)
+
+
+class InFolder(Query):
+    def __init__(self, folder_id: str):
+        self.folder_id = folder_id
+
+    def bitmap(self, index: "ItemIndex") -> int:
+        return index.folders.get(self.folder_id, 0)
+
+
+class HasExt(Query):
+    def __init__(self, ext: str):
+        self.ext = ext
+
+    def bitmap(self, index: "ItemIndex") -> int:
+        return index.exts.get(self.ext, 0)
+
+
+class Between(Query):
+    def __init__(self, column: str, minimum: Optional[int] = None, maximum: Optional[int] = None):
+        """
+        Items whose numeric column is within [minimum, maximum]. See ItemTable.COLUMNS for the column names.
+        """
+        self.column = column
+        self.minimum = minimum
+        self.maximum = maximum
+
+    def bitmap(self, index: "ItemIndex") -> int:
+        return index.range_bitmap(self.column, self.minimum, self.maximum)
+
+
+class Everything(Query):
+    def bitmap(self, index: "ItemIndex") -> int:
+        return index.live
+
+
+class _And(Query):
+    def __init__(self, left: Query, right: Query):
+        self.left, self.right = left, right
+
+    def bitmap(self, index: "ItemIndex") -> int:
+        bits = self.left.bitmap(index)
+        return bits & self.right.bitmap(index) if bits else 0
+
+
+class _Or(Query):
+    def __init__(self, left: Query, right: Query):
+        self.left, self.right = left, right
+
+    def bitmap(self, index: "ItemIndex") -> int:
+        return self.left.bitmap(index) | self.right.bitmap(index)
+
+
+class _Not(Query):
+    def __init__(self, query: Query):
+        self.query = query
+
+    def bitmap(self, index: "ItemIndex") -> int:
+        return index.live & ~self.query.bitmap(index)
+
+
+class ItemIndex:
+    def __init__(self):
+        """
+        Local inverted index over a snapshot of items, answering boolean queries without HTTP calls.
+
+        Every item gets a row number; each tag, folder and extension maps to an integer used as a
+        bitmap of the rows that have it, so AND/OR/NOT are single big-integer operations. Numeric
+        columns (size, width, height, timestamps, rating) are kept in an ItemTable. Rows freed by
+        remove are reused by add, so the table and bitmaps do not grow with replacements.
+        """
+        self.table = ItemTable()
+        self.tags = {}
+        self.folders = {}
+        self.exts = {}
+        self.live = 0
+        self._rows = {}
+        self._free = []
+        self._ranges = {}
+
+    @classmethod
+    def from_items(cls, items: Iterable[Dict[str, Any]]) -> "ItemIndex":
+        """
+        Build an index from item dicts, e.g. from Item.iter_items.
+
+        Rows are collected per key first and each bitmap is built once, which is much faster
+        than calling add for every item. When an ID appears twice, the last occurrence wins and
+        the earlier row is left free for add.
+        """
+        index = cls()
+        tags, folders, exts = {}, {}, {}
+        for item in items:
+            row = len(index.table)
+            index.table.append(item)
+            index._rows[item["id"]] = row
+            for tag in item.get("tags") or ():
+                tags.setdefault(tag, []).append(row)
+            for folder_id in item.get("folders") or ():
+                folders.setdefault(folder_id, []).append(row)
+            exts.setdefault(item.get("ext") or "", []).append(row)
+        size = len(index.table)
+        index.live = _from_rows(index._rows.values(), size)
+        if len(index._rows) < size:
+            live = set(index._rows.values())
+            index._free = [row for row in range(size) if row not in live]
+            for bitmaps in (tags, folders, exts):
+                for key in list(bitmaps):
+                    bitmaps[key] = [row for row in bitmaps[key] if row in live]
+                    if not bitmaps[key]:
+                        del bitmaps[key]
+        index.tags = {key: _from_rows(rows, size) for key, rows in tags.items()}
+        index.folders = {key: _from_rows(rows, size) for key, rows in folders.items()}
+        index.exts = {key: _from_rows(rows, size) for key, rows in exts.items()}
+        return index
+
+    def add(self, item: Dict[str, Any]) -> None:
+        """
+        Index an item. An item already indexed is replaced.
+        """
+        if item["id"] in self._rows:
+            self.remove(item["id"])
+        self._ranges.clear()
+        if self._free:
+            row = self._free.pop()
+            self.table.replace(row, item)
+        else:
+            row = len(self.table)
+            self.table.append(item)
+        bit = 1 << row
+        self._rows[item["id"]] = row
+        self.live |= bit
+        for tag in item.get("tags") or ():
+            self.tags[tag] = self.tags.get(tag, 0) | bit
+        for folder_id in item.get("folders") or ():
+            self.folders[folder_id] = self.folders.get(folder_id, 0) | bit
+        ext = item.get("ext") or ""
+        self.exts[ext] = self.exts.get(ext, 0) | bit
+
+    def remove(self, item_id: str) -> bool:
+        """
+        Drop an item from the results. Returns False if it was not indexed.
+        """
+        row = self._rows.pop(item_id, None)
+        if row is None:
+            return False
+        self._ranges.clear()
+        self._free.append(row)
+        mask = ~(1 << row)
+        self.live &= mask
+        for bitmaps in (self.tags, self.folders, self.exts):
+            for key in [key for key, bits in bitmaps.items() if bits >> row & 1]:
+                bits = bitmaps[key] & mask
+                if bits:
+                    bitmaps[key] = bits
+                else:
+                    del bitmaps[key]
+        return True
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._rows
+
+    def bitmap(self, query: Query) -> int:
+        return query.bitmap(self) & self.live
+
+    def range_bitmap(self, column: str, minimum: Optional[int] = None, maximum: Optional[int] = None) -> int:
+        """
+        Return the bitmap of rows whose numeric column is within [minimum, maximum].
+
+        The column is scanned once per distinct range; the result is cached until the index changes.
+        """
+        key = (column, minimum, maximum)
+        bits = self._ranges.get(key)
+        if bits is None:
+            low = minimum if minimum is not None else float("-inf")
+            high = maximum if maximum is not None else float("inf")
+            values = self.table.column(column)
+            bits = _from_rows((row for row, value in enumerate(values) if low <= value <= high), len(values))
+            self._ranges[key] = bits
+        return bits
+
+    def count(self, query: Query) -> int:
+        """
+        Return the number of items matching a query.
+        """
+        return bin(self.bitmap(query)).count("1")
+
+    def rows(self, query: Query) -> List[int]:
+        """
+        Return the row numbers of the items matching a query, in ascending order.
+        """
+        bits = bin(self.bitmap(query))[:1:-1]
+        return [row for row, bit in enumerate(bits) if bit == "1"]
+
+    def search(self, query: Query) -> List[str]:
+        """
+        Return the IDs of the items matching a query, in row order. Rows freed by remove are reused, so
+        this is indexing order only while no item was removed.
+        """
+        return self.table.ids_at(self.rows(query))
+
+    def find(
+        self,
+        all_tags: Iterable[str] = (),
+        any_tags: Iterable[str] = (),
+        no_tags: Iterable[str] = (),
+        folders: Iterable[str] = (),
+        ext: Optional[str] = None
+    ) -> List[str]:
+        """
+        Convenience search combining the common conditions.
+
+        Parameters:
+            all_tags (Iterable[str]): Items must have every one of these tags.
+            any_tags (Iterable[str]): Items must have at least one of these tags, if any are given.
+            no_tags (Iterable[str]): Items must have none of these tags.
+            folders (Iterable[str]): Items must be in at least one of these folders, if any are given.
+            ext (Optional[str]): Items must have this extension.
+
+        Returns:
+            List[str]: The matching item IDs.
+        """
+        bits = self.live
+        for tag in all_tags:
+            bits &= self.tags.get(tag, 0)
+        any_tags = list(any_tags)
+        if any_tags:
+            bits &= _union(self.tags, any_tags)
+        for tag in no_tags:
+            bits &= ~self.tags.get(tag, 0)
+        folders = list(folders)
+        if folders:
+            bits &= _union(self.folders, folders)
+        if ext is not None:
+            bits &= self.exts.get(ext, 0)
+        return self.table.ids_at(row for row, bit in enumerate(bin(bits)[:1:-1]) if bit == "1")
+
+
+def _from_rows(rows: Iterable[int], size: int) -> int:
+    buffer = bytearray((size + 7) // 8)
+    for row in rows:
+        buffer[row >> 3] |= 1 << (row & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def _union(bitmaps: Dict[str, int], keys: Iterable[str]) -> int:
+    bits = 0
+    for key in keys:
+        bits |= bitmaps.get(key, 0)
+    return bits
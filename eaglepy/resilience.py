@@ -0,0 +1,150 @@
+import random
+import threading
+import time
+from typing import Callable, Collection, Dict, Optional, Union
+
+from .exceptions import CircuitOpenError
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_base: float = 0.1,
+        backoff_max: float = 5.0,
+        methods: Collection[str] = ("GET",),
+        status_codes: Collection[int] = (500, 502, 503, 504),
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Retry failed requests with jittered exponential backoff.
+
+        Only idempotent methods are retried by default, so a POST that may already have been
+        applied by the Eagle app is never sent twice.
+
+        Parameters:
+            max_retries (int): How many times a request is retried after the first attempt.
+            backoff_base (float): Upper bound, in seconds, of the delay before the first retry. Doubles on each retry.
+            backoff_max (float): Upper bound, in seconds, of any delay.
+            methods (Collection[str]): The HTTP methods that may be retried.
+            status_codes (Collection[int]): HTTP statuses treated as failures worth retrying.
+            sleep (Callable[[float], None]): Function used to wait between attempts.
+        """
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.methods = frozenset(method.upper() for method in methods)
+        self.status_codes = frozenset(status_codes)
+        self.sleep = sleep
+
+    def should_retry(self, method: str, attempt: int) -> bool:
+        """
+        Whether a failed attempt (counting from 1) of a request may be retried.
+        """
+        return attempt <= self.max_retries and method.upper() in self.methods
+
+    def backoff(self, attempt: int) -> float:
+        """
+        The delay before retrying after the given attempt, with full jitter.
+        """
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1))))
+
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Fail fast while the Eagle app is unresponsive.
+
+        After ``failure_threshold`` consecutive failures the breaker opens and every request
+        raises CircuitOpenError without being sent. After ``reset_timeout`` seconds one trial
+        request is let through: success closes the breaker, failure opens it again.
+
+        Parameters:
+            failure_threshold (int): Consecutive failures that open the breaker.
+            reset_timeout (float): Seconds to stay open before sending a trial request.
+            clock (Callable[[], float]): Monotonic time source, in seconds.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.failures = 0
+        self.rejected = 0
+        self.opened = 0
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """
+        "closed", "open" or "half_open".
+        """
+        with self._lock:
+            if self._state == self.OPEN and self.clock() - self._opened_at >= self.reset_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def before_request(self) -> None:
+        """
+        Raise CircuitOpenError if a request may not be sent now.
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return
+            remaining = self.reset_timeout - (self.clock() - self._opened_at)
+            if remaining <= 0 and not self._trial_in_flight:
+                self._state = self.HALF_OPEN
+                self._trial_in_flight = True
+                return
+            self.rejected += 1
+        raise CircuitOpenError("Circuit breaker is open; the Eagle app is not responding", max(remaining, 0.0))
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self._state = self.CLOSED
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self._state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    self.opened += 1
+                self._state = self.OPEN
+                self._opened_at = self.clock()
+                self._trial_in_flight = False
+
+    def reset(self) -> None:
+        """
+        Close the breaker and forget past failures.
+        """
+        self.record_success()
+
+    def stats(self) -> Dict[str, Union[str, int, Optional[float]]]:
+        """
+        Return the state, consecutive failures, times opened, rejected requests and
+        seconds until a trial request is allowed.
+        """
+        state = self.state
+        with self._lock:
+            retry_after = None
+            if state == self.OPEN:
+                retry_after = max(0.0, self.reset_timeout - (self.clock() - self._opened_at))
+            return {
+                "state": state,
+                "failures": self.failures,
+                "opened": self.opened,
+                "rejected": self.rejected,
+                "retry_after": retry_after,
+            }
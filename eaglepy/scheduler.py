@@ -0,0 +1,216 @@
+import functools
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+from urllib.parse import urlsplit
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+
+# Share of the request slots each lane gets while both have requests waiting.
+DEFAULT_WEIGHTS = {INTERACTIVE: 4, BULK: 1}
+
+# Endpoints sent on the bulk lane unless the calling thread chose a lane with RequestScheduler.lane.
+BULK_ENDPOINTS = (
+    "/api/item/addFromURLs",
+    "/api/item/addFromPaths",
+    "/api/item/moveToTrash",
+)
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        """
+        Token bucket rate limit. Not thread-safe on its own; RequestScheduler calls it under its lock.
+
+        Parameters:
+            rate (float): Tokens added per second.
+            burst (Optional[float]): The maximum number of tokens stored. Defaults to ``rate``, i.e. one second of requests.
+        """
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self.clock = clock
+        self.tokens = self.burst
+        self._updated = clock()
+
+    def take(self) -> float:
+        """
+        Take one token if available. Returns 0 when taken, otherwise the seconds until one is available.
+        """
+        now = self.clock()
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class RequestScheduler:
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+        weights: Optional[Dict[str, int]] = None,
+        bulk_endpoints: Optional[tuple] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Admit requests under a global rate limit, sharing it fairly between priority lanes.
+
+        Each request waits in the queue of its lane. While several lanes have requests waiting,
+        they are admitted in proportion to the lane weights (weighted fair queueing), so a large
+        import on the bulk lane cannot starve interactive lookups, and interactive bursts cannot
+        stop the import either. A lane that was idle joins at the current fair share instead of
+        catching up on the slots it did not use.
+
+        Parameters:
+            rate (Optional[float]): Requests per second admitted across all lanes. Unlimited when None.
+            burst (Optional[float]): Requests that may be admitted at once after an idle period. Defaults to ``rate``.
+            max_concurrency (Optional[int]): The maximum number of requests in flight. Unlimited when None.
+            weights (Optional[Dict[str, int]]): Relative share of each lane. Defaults to DEFAULT_WEIGHTS.
+            bulk_endpoints (Optional[tuple]): Endpoint paths sent on the bulk lane by default. Defaults to BULK_ENDPOINTS.
+            clock (Callable[[], float]): Monotonic time source, in seconds.
+        """
+        self.bucket = TokenBucket(rate, burst, clock) if rate else None
+        self.max_concurrency = max_concurrency
+        self.weights = dict(DEFAULT_WEIGHTS if weights is None else weights)
+        self.bulk_endpoints = frozenset(BULK_ENDPOINTS if bulk_endpoints is None else bulk_endpoints)
+        self.clock = clock
+        self.in_flight = 0
+        self._condition = threading.Condition()
+        self._local = threading.local()
+        self._queues = {lane: deque() for lane in self.weights}
+        self._finish = dict.fromkeys(self.weights, 0.0)
+        self._metrics = {
+            lane: {"admitted": 0, "max_depth": 0, "wait_total": 0.0, "wait_max": 0.0} for lane in self.weights
+        }
+
+    @contextmanager
+    def lane(self, lane: str) -> Iterator[None]:
+        """
+        Send every request made by the current thread inside the block on the given lane.
+
+        Worker threads do not inherit the lane; wrap the work handed to them with bind. The
+        helpers of this package that send through thread pools already do.
+        """
+        if lane not in self.weights:
+            raise ValueError(f"Unknown lane {lane!r}")
+        previous = getattr(self._local, "lane", None)
+        self._local.lane = lane
+        try:
+            yield
+        finally:
+            self._local.lane = previous
+
+    def bind(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Wrap func so that it sends its requests on the lane of the calling thread, in whichever thread it runs.
+        """
+        lane = getattr(self._local, "lane", None)
+        if lane is None:
+            return func
+
+        @functools.wraps(func)
+        def bound(*args, **kwargs):
+            with self.lane(lane):
+                return func(*args, **kwargs)
+
+        return bound
+
+    def lane_for(self, url: str) -> str:
+        """
+        The lane of a request: the one chosen by the current thread, else bulk for bulk endpoints, else interactive.
+        """
+        lane = getattr(self._local, "lane", None)
+        if lane is not None:
+            return lane
+        if urlsplit(url).path in self.bulk_endpoints and BULK in self.weights:
+            return BULK
+        return INTERACTIVE if INTERACTIVE in self.weights else next(iter(self.weights))
+
+    @contextmanager
+    def slot(self, lane: str) -> Iterator[None]:
+        """
+        Wait until a request on the given lane may be sent, and hold its slot for the duration of the block.
+        """
+        self.acquire(lane)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def acquire(self, lane: str) -> float:
+        """
+        Wait for a request slot on a lane. Returns the seconds spent waiting. Pair with release.
+        """
+        ticket = object()
+        queue = self._queues[lane]
+        started = self.clock()
+        with self._condition:
+            if not queue:
+                active = [self._finish[other] for other, waiting in self._queues.items() if waiting]
+                if active:
+                    self._finish[lane] = max(self._finish[lane], min(active))
+            queue.append(ticket)
+            metrics = self._metrics[lane]
+            metrics["max_depth"] = max(metrics["max_depth"], len(queue))
+            self._condition.notify_all()
+            while True:
+                delay = None
+                if self._next_lane() == lane and queue[0] is ticket and self._has_capacity():
+                    delay = self.bucket.take() if self.bucket is not None else 0.0
+                    if not delay:
+                        break
+                self._condition.wait(delay)
+            queue.popleft()
+            self._finish[lane] += 1.0 / self.weights[lane]
+            self.in_flight += 1
+            waited = self.clock() - started
+            metrics["admitted"] += 1
+            metrics["wait_total"] += waited
+            metrics["wait_max"] = max(metrics["wait_max"], waited)
+            self._condition.notify_all()
+        return waited
+
+    def release(self) -> None:
+        with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def stats(self) -> Dict[str, object]:
+        """
+        Return the requests in flight and, per lane, the queue depth and wait-time metrics in seconds.
+        """
+        with self._condition:
+            lanes = {}
+            for lane, metrics in self._metrics.items():
+                admitted = metrics["admitted"]
+                lanes[lane] = dict(
+                    metrics,
+                    depth=len(self._queues[lane]),
+                    wait_mean=metrics["wait_total"] / admitted if admitted else 0.0
+                )
+            return {"in_flight": self.in_flight, "lanes": lanes}
+
+    def _has_capacity(self) -> bool:
+        return self.max_concurrency is None or self.in_flight < self.max_concurrency
+
+    def _next_lane(self) -> Optional[str]:
+        # The waiting lane with the smallest virtual finish time; ties go to the lane declared first.
+        best = None
+        for lane, queue in self._queues.items():
+            if queue and (best is None or self._finish[lane] < self._finish[best]):
+                best = lane
+        return best
+
+
+def bind_lane(session: Any, func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Bind func to the lane of the calling thread when session is a transport with a scheduler, see RequestScheduler.bind.
+    """
+    scheduler = getattr(session, "scheduler", None)
+    return scheduler.bind(func) if isinstance(scheduler, RequestScheduler) else func
@@ -0,0 +1,104 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    def __init__(self):
+        """
+        Coalesce identical concurrent calls across threads.
+
+        The first caller of a key runs the call; callers arriving while it is in flight wait
+        for it and receive the same result, or the same exception. Nothing is kept once the
+        call returns, so this is not a cache: the next call after it runs again.
+        """
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        Run ``func`` unless a call with the same key is in flight, then return its result.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+            else:
+                self.shared += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = func()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return the number of calls run, the number of callers that shared one, and the calls in flight.
+        """
+        with self._lock:
+            return {"calls": self.calls, "shared": self.shared, "in_flight": len(self._calls)}
+
+
+class AsyncSingleFlight:
+    def __init__(self):
+        """
+        Coalesce identical concurrent coroutine calls on one event loop, see SingleFlight.
+
+        If the first caller is cancelled, the callers sharing its call are cancelled too.
+        """
+        self._futures = {}
+        self.calls = 0
+        self.shared = 0
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await ``factory()`` unless a call with the same key is in flight, then return its result.
+        """
+        future = self._futures.get(key)
+        if future is not None:
+            self.shared += 1
+            return await asyncio.shield(future)
+        future = asyncio.get_event_loop().create_future()
+        self._futures[key] = future
+        self.calls += 1
+        try:
+            result = await factory()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as error:
+            future.set_exception(error)
+            # Mark the exception as retrieved when no other caller was waiting for it.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            del self._futures[key]
+        return result
+
+    def stats(self) -> Dict[str, int]:
+        return {"calls": self.calls, "shared": self.shared, "in_flight": len(self._futures)}
@@ -0,0 +1,89 @@
+import base64
+import mimetypes
+import os
+from typing import Any, BinaryIO, Dict, Iterator, Optional, Union
+
+from .payload import compact_json
+
+Source = Union[str, "os.PathLike[str]", BinaryIO]
+
+# Read size for streamed files. A multiple of 3 so each chunk base64-encodes without padding.
+CHUNK_SIZE = 3 * 64 * 1024
+
+
+def guess_mime_type(source: Source, default: str = "image/png") -> str:
+    """
+    Guess the MIME type of a file path, or of a stream from its ``name`` attribute.
+    """
+    name = source if isinstance(source, (str, os.PathLike)) else getattr(source, "name", None)
+    if isinstance(name, (str, os.PathLike)):
+        mime_type, _ = mimetypes.guess_type(os.fspath(name))
+        if mime_type is not None:
+            return mime_type
+    return default
+
+
+def iter_base64(source: Source, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Yield the base64 encoding of a file or binary stream piece by piece.
+
+    Parameters:
+        source (Source): A file path, or a binary stream opened for reading. Streams are not closed.
+        chunk_size (int): Bytes read per step. Rounded down to a multiple of 3.
+
+    Returns:
+        Iterator[bytes]: Base64 chunks whose concatenation encodes the whole input.
+    """
+    chunk_size = max(3, chunk_size - chunk_size % 3)
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as stream:
+            yield from _encode_stream(stream, chunk_size)
+    else:
+        yield from _encode_stream(source, chunk_size)
+
+
+def _encode_stream(stream: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+    pending = b""
+    while True:
+        data = stream.read(chunk_size)
+        if not data:
+            break
+        data = pending + data
+        usable = len(data) - len(data) % 3
+        pending = data[usable:]
+        if usable:
+            yield base64.b64encode(data[:usable])
+    if pending:
+        yield base64.b64encode(pending)
+
+
+def stream_json_body(
+    fields: Dict[str, Any],
+    base64_field: str,
+    source: Source,
+    mime_type: Optional[str] = None,
+    chunk_size: int = CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    Yield a JSON object whose ``base64_field`` holds a file encoded as a base64 data URL.
+
+    The file is read and encoded incrementally, so peak memory does not depend on its size.
+    The result is suitable as a streamed ``data=`` request body.
+
+    Parameters:
+        fields (Dict[str, Any]): The other fields of the object, see payload.build_payload.
+        base64_field (str): The key of the encoded file, e.g. "base64" or "url".
+        source (Source): A file path, or a binary stream opened for reading.
+        mime_type (Optional[str]): MIME type of the data URL. Guessed from the file name when None.
+        chunk_size (int): Bytes read per step.
+
+    Returns:
+        Iterator[bytes]: The UTF-8 encoded JSON body, in pieces.
+    """
+    if mime_type is None:
+        mime_type = guess_mime_type(source)
+    head = compact_json(fields)
+    head = head[:-1] + b"," if fields else b"{"
+    yield head + compact_json(base64_field) + b':"data:' + mime_type.encode() + b';base64,'
+    yield from iter_base64(source, chunk_size)
+    yield b'"}'
@@ -0,0 +1,199 @@
+import json
+import sqlite3
+import time
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+from .exceptions import EagleAPIError
+from .item import Item
+from .library import Library
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id TEXT PRIMARY KEY,
+    modification_time INTEGER NOT NULL,
+    last_modified INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class SyncResult(NamedTuple):
+    """
+    Summary of one LibrarySync.sync call.
+    """
+    full: bool
+    fetched: int
+    added: int
+    updated: int
+    deleted: int
+    elapsed: float
+
+
+class LibrarySync:
+    def __init__(self, path: str, item: Item, library: Library, page_size: int = 200):
+        """
+        Local SQLite snapshot of a library's items and folders, kept up to date incrementally.
+
+        Opening an existing snapshot is instant; ``sync`` then only stores what changed. A quick
+        sync walks items newest first and stops at the first page that reaches back to the
+        watermark. A full sync walks every item, rewrites the ones whose ``lastModified``
+        changed and drops the ones no longer listed.
+
+        Parameters:
+            path (str): The SQLite database file. Created when missing. ":memory:" keeps it in memory.
+            item (Item): The item endpoint used to list items.
+            library (Library): The library endpoint used to read folders and detect library switches.
+            page_size (int): The number of items requested per call.
+        """
+        self.path = path
+        self.item = item
+        self.library = library
+        self.page_size = page_size
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(_SCHEMA)
+
+    @property
+    def last_synced(self) -> Optional[int]:
+        """
+        When the last successful sync finished, in milliseconds since the epoch. None if never synced.
+        """
+        value = self._meta("last_synced")
+        return int(value) if value is not None else None
+
+    @property
+    def watermark(self) -> int:
+        """
+        The newest item ``modificationTime`` stored, in milliseconds. 0 for an empty snapshot.
+        """
+        value = self._meta("watermark")
+        return int(value) if value is not None else 0
+
+    @property
+    def library_path(self) -> Optional[str]:
+        return self._meta("library_path")
+
+    def sync(self, full: bool = False) -> SyncResult:
+        """
+        Bring the snapshot up to date with the Eagle app.
+
+        Parameters:
+            full (bool): Walk every item to also pick up edits and deletions of older items.
+                A full sync is forced when the snapshot is empty or Eagle switched library.
+
+        Returns:
+            SyncResult: What was fetched and changed.
+        """
+        started = time.perf_counter()
+        info = self.library.get_library_info()
+        if not isinstance(info, dict) or info.get("status") != "success":
+            raise EagleAPIError("Reading library info failed", info)
+        data = info.get("data") or {}
+        library_path = (data.get("library") or {}).get("path")
+        with self.connection:
+            if library_path != self.library_path:
+                self.connection.execute("DELETE FROM items")
+                self.connection.execute("DELETE FROM meta")
+                self._set_meta("library_path", library_path)
+            self._set_meta("folders", json.dumps(data.get("folders") or []))
+        full = full or self.last_synced is None
+
+        known = dict(self.connection.execute("SELECT id, last_modified FROM items"))
+        watermark = self.watermark
+        newest = watermark
+        fetched = added = updated = 0
+        seen = set()
+        offset = 0
+        while True:
+            page = self._page(offset)
+            fetched += len(page)
+            rows = []
+            for entry in page:
+                seen.add(entry["id"])
+                modification_time = entry.get("modificationTime") or 0
+                last_modified = entry.get("lastModified") or modification_time
+                newest = max(newest, modification_time)
+                previous = known.get(entry["id"])
+                if previous is None:
+                    added += 1
+                elif previous != last_modified:
+                    updated += 1
+                else:
+                    continue
+                rows.append((entry["id"], modification_time, last_modified, json.dumps(entry)))
+            if rows:
+                with self.connection:
+                    self.connection.executemany(
+                        "INSERT OR REPLACE INTO items (id, modification_time, last_modified, data) VALUES (?, ?, ?, ?)",
+                        rows
+                    )
+            if len(page) < self.page_size:
+                break
+            if not full:
+                oldest = page[-1].get("modificationTime") or 0
+                if oldest < watermark or (oldest == watermark and page[-1]["id"] in known):
+                    break
+            offset += 1
+
+        deleted = 0
+        with self.connection:
+            if full:
+                stale = [(item_id,) for item_id in known if item_id not in seen]
+                self.connection.executemany("DELETE FROM items WHERE id = ?", stale)
+                deleted = len(stale)
+            self._set_meta("watermark", str(newest))
+            self._set_meta("last_synced", str(int(time.time() * 1000)))
+        return SyncResult(full, fetched, added, updated, deleted, time.perf_counter() - started)
+
+    def get(self, item_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the stored item dict with the given ID, or None.
+        """
+        row = self.connection.execute("SELECT data FROM items WHERE id = ?", (item_id,)).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def items(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the stored item dicts, newest first, without loading them all at once.
+        """
+        cursor = self.connection.execute("SELECT data FROM items ORDER BY modification_time DESC, id")
+        for (data,) in cursor:
+            yield json.loads(data)
+
+    def folders(self) -> List[Dict[str, Any]]:
+        """
+        Return the stored folder tree, as in the ``folders`` of Library.get_library_info.
+        """
+        value = self._meta("folders")
+        return json.loads(value) if value is not None else []
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> "LibrarySync":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _page(self, offset: int) -> List[Dict[str, Any]]:
+        response = self.item.list_items("-CREATEDATE", self.page_size, offset=offset)
+        if not isinstance(response, dict) or response.get("status") != "success":
+            raise EagleAPIError(f"Listing items failed at page {offset}", response)
+        return response.get("data") or []
+
+    def _meta(self, key: str) -> Optional[str]:
+        row = self.connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row is not None else None
+
+    def _set_meta(self, key: str, value: Optional[str]) -> None:
+        if value is None:
+            self.connection.execute("DELETE FROM meta WHERE key = ?", (key,))
+        else:
+            self.connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
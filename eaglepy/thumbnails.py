@@ -0,0 +1,202 @@
+import mmap
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+from urllib.parse import unquote
+
+from .item import Item
+from .scheduler import bind_lane
+
+ThumbnailKey = Tuple[str, Optional[int]]
+ItemRef = Union[str, Dict[str, Any]]
+
+
+class ThumbnailCache:
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, max_mapped: int = 64):
+        """
+        LRU cache of thumbnail bytes bounded by their total size.
+
+        Entries are keyed by item ID and ``lastModified``, so an edited item misses the
+        cache instead of returning its old thumbnail.
+
+        Every cached ``mmap`` holds an open file descriptor, so their number is bounded
+        separately. An evicted mmap is closed once no caller holds it any more.
+
+        Parameters:
+            max_bytes (int): The maximum total size of the cached thumbnails. The least recently used is evicted first.
+            max_mapped (int): The maximum number of cached ``mmap`` objects.
+        """
+        self.max_bytes = max_bytes
+        self.max_mapped = max_mapped
+        self.size = 0
+        self.mapped = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: ThumbnailKey) -> Optional[Any]:
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def set(self, key: ThumbnailKey, data: Any) -> None:
+        """
+        Store the thumbnail of a key. Thumbnails larger than the whole cache are not stored.
+        """
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._forget(previous)
+            self._entries[key] = data
+            self.size += len(data)
+            self.mapped += isinstance(data, mmap.mmap)
+            while self.size > self.max_bytes or self.mapped > self.max_mapped:
+                _, evicted = self._entries.popitem(last=False)
+                self._forget(evicted)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+            self.mapped = 0
+
+    def _forget(self, data: Any) -> None:
+        self.size -= len(data)
+        self.mapped -= isinstance(data, mmap.mmap)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return hit, miss and eviction counters, the number of entries and their total size.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self.size,
+                "mapped": self.mapped,
+                "max_bytes": self.max_bytes,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: ThumbnailKey) -> bool:
+        return key in self._entries
+
+
+class ThumbnailLoader:
+    def __init__(
+        self,
+        item: Item,
+        cache: Optional[ThumbnailCache] = None,
+        max_workers: int = 8,
+        use_mmap: bool = False,
+        mmap_threshold: int = 1024 * 1024
+    ):
+        """
+        Bulk thumbnail pipeline: resolves thumbnail paths concurrently and reads the image bytes.
+
+        Thumbnails already in the cache cost no HTTP call and no disk read.
+
+        Parameters:
+            item (Item): The item endpoint used to resolve thumbnail paths.
+            cache (Optional[ThumbnailCache]): Where loaded thumbnails are kept. Defaults to a new 256 MiB cache.
+            max_workers (int): The maximum number of thumbnails resolved and read at once.
+            use_mmap (bool): Return read-only ``mmap`` objects instead of ``bytes``, so large files are not copied.
+            mmap_threshold (int): The smallest file, in bytes, that is mapped. Smaller files are read as bytes.
+        """
+        self.item = item
+        self.cache = cache if cache is not None else ThumbnailCache()
+        self.max_workers = max_workers
+        self.use_mmap = use_mmap
+        self.mmap_threshold = mmap_threshold
+
+    def load(self, items: Iterable[ItemRef]) -> Dict[str, Optional[Any]]:
+        """
+        Load the thumbnails of many items.
+
+        Pass item dicts, e.g. from Item.list_items, so that ``lastModified`` is part of the
+        cache key. Bare IDs are accepted too, but their cached thumbnails are not refreshed when
+        the item changes.
+
+        Parameters:
+            items (Iterable[ItemRef]): Item dicts or item IDs. Duplicates are loaded once.
+
+        Returns:
+            Dict[str, Optional[Any]]: The thumbnail of each ID, in input order. None when it could not be loaded.
+        """
+        keys = list(dict.fromkeys(_key(item) for item in items))
+        results = {}
+        missing = []
+        for key in keys:
+            data = self.cache.get(key)
+            results[key[0]] = data
+            if data is None:
+                missing.append(key)
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(missing))) as executor:
+                fetch = bind_lane(self.item.session, self._fetch)
+                for key, data in zip(missing, executor.map(fetch, missing)):
+                    results[key[0]] = data
+        return results
+
+    def load_one(self, item: ItemRef) -> Optional[Any]:
+        """
+        Load the thumbnail of one item, see load.
+        """
+        return self.load([item])[_key(item)[0]]
+
+    def resolve_path(self, item_id: str) -> Optional[str]:
+        """
+        Return the local path of the thumbnail of an item, or None if Eagle did not return one.
+        """
+        response = self.item.get_item_thumbnail(item_id)
+        if not isinstance(response, dict) or response.get("status") != "success" or not response.get("data"):
+            return None
+        path = response["data"]
+        if not os.path.exists(path) and os.path.exists(unquote(path)):
+            path = unquote(path)
+        return path
+
+    def read(self, path: str) -> Any:
+        """
+        Read a thumbnail file, as bytes or, for files of at least ``mmap_threshold`` bytes, as a read-only mmap.
+        """
+        with open(path, "rb") as handle:
+            size = os.fstat(handle.fileno()).st_size
+            if self.use_mmap and size and size >= self.mmap_threshold:
+                return mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            return handle.read()
+
+    def _fetch(self, key: ThumbnailKey) -> Optional[Any]:
+        try:
+            path = self.resolve_path(key[0])
+            if path is None:
+                return None
+            data = self.read(path)
+        except Exception:
+            return None
+        self.cache.set(key, data)
+        return data
+
+
+def _key(item: ItemRef) -> ThumbnailKey:
+    if isinstance(item, dict):
+        # Eagle bumps lastModified on edits and thumbnail refreshes; modificationTime stays put.
+        modified = item.get("lastModified")
+        return item["id"], modified if modified is not None else item.get("modificationTime")
+    return item, None
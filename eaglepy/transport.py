@@ -0,0 +1,287 @@
+import functools
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .cache import ResponseCache, cache_key
+from .codec import JSONCodec, OrjsonCodec
+from .payload import compact_json
+from .instrumentation import Instrumentation
+from .resilience import CircuitBreaker, RetryPolicy
+from .scheduler import RequestScheduler
+from .singleflight import SingleFlight
+
+Timeout = Union[float, Tuple[float, float]]
+Codec = Union[JSONCodec, OrjsonCodec]
+
+
+class Transport:
+    """
+    Pooled HTTP transport shared by every endpoint class of an EagleClient.
+
+    The transport mirrors the ``requests.get`` / ``requests.post`` call signatures,
+    so endpoint classes can use it interchangeably with the ``requests`` module.
+    All calls go through a single ``requests.Session`` whose connections are kept
+    alive and reused instead of opening a new TCP connection per call.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 1,
+        pool_maxsize: int = 10,
+        keep_alive: bool = True,
+        timeout: Optional[Timeout] = (3.05, 30),
+        pool_block: bool = False,
+        cache: Optional[ResponseCache] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        retry: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        single_flight: Optional[SingleFlight] = None,
+        codec: Optional[Codec] = None
+    ):
+        """
+        Parameters:
+            pool_connections (int): The number of host pools to cache. Eagle runs on a single host, so 1 is enough.
+            pool_maxsize (int): The maximum number of connections kept open per host.
+            keep_alive (bool): Whether connections are reused between calls.
+            timeout (Optional[Timeout]): Default timeout in seconds, either a single value or a (connect, read) tuple.
+            pool_block (bool): Whether to block when the pool has no free connection instead of opening a new one.
+            cache (Optional[ResponseCache]): Cache for successful read-only GET responses. Disabled when None.
+            instrumentation (Optional[Instrumentation]): Records metrics of every request sent. Disabled when None.
+            retry (Optional[RetryPolicy]): Retries failed requests with backoff. Disabled when None.
+            circuit_breaker (Optional[CircuitBreaker]): Fails fast while the Eagle app is unresponsive. Disabled when None.
+            scheduler (Optional[RequestScheduler]): Rate-limits requests and orders them by priority lane. Disabled when None.
+            single_flight (Optional[SingleFlight]): Shares one request between identical concurrent GETs. Disabled when None.
+            codec (Optional[Codec]): Encodes ``json=`` bodies and decodes ``response.json()``. When None, bodies are
+                sent as compact JSON and responses are decoded by requests.
+        """
+        self.timeout = timeout
+        self.cache = cache
+        self.instrumentation = instrumentation
+        self.retry = retry
+        self.circuit_breaker = circuit_breaker
+        self.scheduler = scheduler
+        self.single_flight = single_flight
+        self.codec = codec
+        self._local = threading.local()
+        self.retries = 0
+        self._retries_lock = threading.Lock()
+        self.keep_alive = keep_alive
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Send a request through the pooled session.
+
+        Parameters:
+            method (str): The HTTP method.
+            url (str): The full URL of the endpoint.
+            **kwargs: Extra arguments passed to ``requests.Session.request``.
+
+        Returns:
+            requests.Response: The response from the server.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        payload = kwargs.get("json")
+        if payload is not None:
+            headers = dict(kwargs.get("headers") or {})
+            headers.setdefault("Content-Type", "application/json")
+            kwargs["headers"] = headers
+            kwargs["data"] = self.codec.dumps(payload) if self.codec is not None else compact_json(payload)
+            kwargs["json"] = None
+        response = self._cached(method, url, payload, kwargs)
+        if self.codec is not None or getattr(self._local, "raw", False):
+            # Installed after the cache and single-flight lookups, so a response fetched by another
+            # caller also honours raw mode. _decode checks the mode of whoever calls .json().
+            response.json = functools.partial(self._decode, response)
+        return response
+
+    def _cached(self, method: str, url: str, payload: Any, kwargs: dict) -> requests.Response:
+        if self.cache is None:
+            return self._coalesce(method, url, kwargs)
+
+        if method == "GET":
+            key = cache_key(url, kwargs.get("params"))
+            if not self.cache.is_cacheable(key):
+                return self._coalesce(method, url, kwargs)
+            response = self.cache.get(key)
+            if response is None:
+                response = self._coalesce(method, url, kwargs, lambda: self._fetch_cacheable(key, method, url, kwargs))
+            return response
+
+        response = self._send(method, url, kwargs)
+        if response.status_code == 200:
+            self.cache.invalidate_for(urlsplit(url).path, payload)
+        return response
+
+    def _fetch_cacheable(self, key, method: str, url: str, kwargs: dict) -> requests.Response:
+        # The generation is taken before sending: a mutation invalidating the endpoint while
+        # the request is in flight keeps the possibly stale response out of the cache.
+        generation = self.cache.generation(key)
+        response = self._send(method, url, kwargs)
+        if response.status_code == 200 and self._is_success(response):
+            self.cache.set(key, response, generation)
+        return response
+
+    def _is_success(self, response: requests.Response) -> bool:
+        try:
+            body = self.codec.loads(response.content) if self.codec is not None else response.json()
+        except ValueError:
+            return False
+        return isinstance(body, dict) and body.get("status") == "success"
+
+    def _coalesce(
+        self,
+        method: str,
+        url: str,
+        kwargs: dict,
+        send: Optional[Callable[[], requests.Response]] = None
+    ) -> requests.Response:
+        # Concurrent GETs of the same URL and params share one response object. Its body is
+        # already read, so every caller can decode it independently.
+        if send is None:
+            send = functools.partial(self._send, method, url, kwargs)
+        if self.single_flight is None or method != "GET" or kwargs.get("stream"):
+            return send()
+        key = cache_key(url, kwargs.get("params"))
+        return self.single_flight.do(key, send)
+
+    def _send(self, method: str, url: str, kwargs: dict) -> requests.Response:
+        if self.retry is None and self.circuit_breaker is None:
+            return self._observe(method, url, kwargs)
+
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.before_request()
+            error = None
+            try:
+                response = self._observe(method, url, kwargs)
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                error, response = exc, None
+            except BaseException:
+                # Any other error is not retried, but still counts as a failure so that a
+                # half-open trial frees its slot instead of keeping the breaker stuck.
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_failure()
+                raise
+            failed = error is not None or response.status_code >= 500
+            if self.circuit_breaker is not None:
+                if failed:
+                    self.circuit_breaker.record_failure()
+                else:
+                    self.circuit_breaker.record_success()
+            retryable = self.retry is not None and (error is not None or response.status_code in self.retry.status_codes)
+            if not retryable or not self.retry.should_retry(method, attempt):
+                if error is not None:
+                    raise error
+                return response
+            with self._retries_lock:
+                self.retries += 1
+            self.retry.sleep(self.retry.backoff(attempt))
+
+    def _observe(self, method: str, url: str, kwargs: dict) -> requests.Response:
+        if self.scheduler is not None:
+            with self.scheduler.slot(self.scheduler.lane_for(url)):
+                return self._dispatch(method, url, kwargs)
+        return self._dispatch(method, url, kwargs)
+
+    def _dispatch(self, method: str, url: str, kwargs: dict) -> requests.Response:
+        if self.instrumentation is None:
+            response = self.session.request(method, url, **kwargs)
+        else:
+            response = self.instrumentation.observe(self.session.request, method, url, kwargs)
+        return response
+
+    def _decode(self, response: requests.Response, **kwargs: Any) -> Any:
+        if getattr(self._local, "raw", False):
+            return response.content
+        if self.codec is None:
+            return requests.Response.json(response, **kwargs)
+        return self.codec.loads(response.content)
+
+    @contextmanager
+    def raw(self) -> Iterator[None]:
+        """
+        Skip decoding inside the block: ``response.json()`` returns the undecoded body as bytes,
+        so endpoint methods called by the current thread return raw JSON for pass-through pipelines.
+
+        Helpers that read the responses themselves, such as Item.iter_items, do not work inside the block.
+        """
+        previous = getattr(self._local, "raw", False)
+        self._local.raw = True
+        try:
+            yield
+        finally:
+            self._local.raw = previous
+
+    def is_raw(self) -> bool:
+        """
+        Whether the current thread is inside a raw block.
+        """
+        return getattr(self._local, "raw", False)
+
+    def bind_raw(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Wrap func so that it runs in raw mode, in whichever thread, when the calling thread is in raw mode.
+        """
+        if not self.is_raw():
+            return func
+
+        @functools.wraps(func)
+        def bound(*args, **kwargs):
+            with self.raw():
+                return func(*args, **kwargs)
+
+        return bound
+
+    def stats(self) -> dict:
+        """
+        Return the number of retries sent, the circuit breaker state, the scheduler queues and
+        the coalesced requests, for callers that need to back off.
+        """
+        return {
+            "retries": self.retries,
+            "circuit_breaker": self.circuit_breaker.stats() if self.circuit_breaker is not None else None,
+            "scheduler": self.scheduler.stats() if self.scheduler is not None else None,
+            "single_flight": self.single_flight.stats() if self.single_flight is not None else None,
+        }
+
+    def get(self, url: str, params: Optional[dict] = None, **kwargs: Any) -> requests.Response:
+        """
+        Send a GET request, mirroring ``requests.get``.
+        """
+        return self.request("GET", url, params=params, **kwargs)
+
+    def post(self, url: str, data: Any = None, json: Any = None, **kwargs: Any) -> requests.Response:
+        """
+        Send a POST request, mirroring ``requests.post``.
+        """
+        return self.request("POST", url, data=data, json=json, **kwargs)
+
+    def close(self) -> None:
+        """
+        Close every pooled connection.
+        """
+        self.session.close()
+
+    def __enter__(self) -> "Transport":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
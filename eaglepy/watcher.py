@@ -0,0 +1,401 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Collection, Dict, List, NamedTuple, Optional, Tuple
+
+import requests
+
+from .bulk import BulkImporter
+from .exceptions import EagleAPIError, EagleError
+from .folder import Folder
+from .folder_index import FolderIndex
+from .item import Item
+
+
+class FileEntry(NamedTuple):
+    """
+    A file found by scan_tree.
+    """
+    path: str
+    size: int
+    mtime: float
+
+
+def scan_tree(root: str, max_workers: int = 4, extensions: Optional[Collection[str]] = None) -> List[FileEntry]:
+    """
+    List the files under a directory, reading subdirectories in parallel.
+
+    Hidden files and directories (starting with a dot) are skipped.
+
+    Parameters:
+        root (str): The directory to scan.
+        max_workers (int): The maximum number of directories read at once.
+        extensions (Optional[Collection[str]]): Only list files with these extensions, lower case without the dot.
+
+    Returns:
+        List[FileEntry]: The files found, in no particular order.
+    """
+    files = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {executor.submit(_list_directory, root, extensions)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                found, directories = future.result()
+                files.extend(found)
+                for directory in directories:
+                    pending.add(executor.submit(_list_directory, directory, extensions))
+    return files
+
+
+def _list_directory(path: str, extensions: Optional[Collection[str]]) -> Tuple[List[FileEntry], List[str]]:
+    files, directories = [], []
+    try:
+        entries = list(os.scandir(path))
+    except OSError:
+        return files, directories
+    for entry in entries:
+        if entry.name.startswith("."):
+            continue
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                directories.append(entry.path)
+            elif entry.is_file():
+                if extensions is not None and os.path.splitext(entry.name)[1][1:].lower() not in extensions:
+                    continue
+                stat = entry.stat()
+                files.append(FileEntry(entry.path, stat.st_size, stat.st_mtime))
+        except OSError:
+            continue
+    return files, directories
+
+
+def file_hash(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """
+    Return the SHA-1 hex digest of a file's content.
+    """
+    digest = hashlib.sha1()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class IngestWatcher:
+    def __init__(
+        self,
+        item: Item,
+        folder: Folder,
+        roots: Dict[str, Optional[str]],
+        extensions: Optional[Collection[str]] = None,
+        debounce: float = 2.0,
+        batch_size: int = 500,
+        scan_workers: int = 4,
+        max_workers: int = 4,
+        use_hash: bool = False,
+        create_folders: bool = True,
+        state_path: Optional[str] = None,
+        clock=time.time
+    ):
+        """
+        Watch directory trees by polling and import new files in bulk through Item.add_items_from_paths.
+
+        Each poll scans the trees in parallel. A file is imported once it has not been modified
+        for ``debounce`` seconds, so files still being written are left for a later poll and a
+        burst of new files ends up in a few large imports instead of one call per file. Files are
+        imported once per size and modification time; with ``use_hash`` a file whose content was
+        already imported, under any path, is skipped as well.
+
+        Subdirectories map to Eagle folders of the same name under the folder of their root, e.g.
+        ``renders/shot1/a.png`` goes to "Renders/shot1" when ``renders`` maps to "Renders". Missing
+        folders are created with Folder.create_folder.
+
+        Parameters:
+            item (Item): The item endpoint used to import files.
+            folder (Folder): The folder endpoint used to look up and create folders.
+            roots (Dict[str, Optional[str]]): The watched directories, each mapped to an Eagle folder path,
+                e.g. "Projects/Renders". None or "" imports into the library root.
+            extensions (Optional[Collection[str]]): Only import files with these extensions. Defaults to any file.
+            debounce (float): Seconds a file must stay unmodified before it is imported.
+            batch_size (int): The maximum number of files per add_items_from_paths call.
+            scan_workers (int): The maximum number of directories read and files hashed at once.
+            max_workers (int): The maximum number of import calls in flight at once.
+            use_hash (bool): Skip files whose content was already imported, by SHA-1.
+            create_folders (bool): Create missing Eagle folders. Otherwise files go to the nearest existing one.
+            state_path (Optional[str]): JSON file keeping what was imported across restarts. Kept in memory when None.
+            clock (Callable[[], float]): Wall-clock time source, comparable with file modification times.
+        """
+        self.item = item
+        self.folder = folder
+        self.roots = {os.path.abspath(root): (path or "").strip("/") for root, path in roots.items()}
+        self.extensions = {ext.lower().lstrip(".") for ext in extensions} if extensions is not None else None
+        self.debounce = debounce
+        self.scan_workers = scan_workers
+        self.use_hash = use_hash
+        self.create_folders = create_folders
+        self.state_path = state_path
+        self.clock = clock
+        self.importer = BulkImporter(item, chunk_size=batch_size, max_workers=max_workers)
+        self.folders = None
+        self._seen = {}
+        self._hashes = set()
+        self._stop = threading.Event()
+        self.totals = {"polls": 0, "scanned": 0, "imported": 0, "bytes": 0, "duplicates": 0, "failed": 0,
+                       "folders_created": 0, "elapsed": 0.0}
+        if state_path is not None and os.path.exists(state_path):
+            with open(state_path) as handle:
+                state = json.load(handle)
+            self._seen = {path: tuple(signature) for path, signature in state.get("seen", {}).items()}
+            self._hashes = set(state.get("hashes", ()))
+
+    def mark_existing(self) -> int:
+        """
+        Treat every file currently in the watched trees as imported. Returns how many files were marked.
+        """
+        files = self._scan()
+        for entry in files:
+            self._seen[entry.path] = (entry.size, entry.mtime)
+        self._save()
+        return len(files)
+
+    def poll(self) -> Dict[str, Any]:
+        """
+        Scan once and import the new files that are ready.
+
+        Returns:
+            Dict[str, Any]: The counters of this poll: scanned, imported, bytes, duplicates, failed,
+            pending (files waiting for the debounce), folders_created, elapsed and rate (imported files per second).
+        """
+        started = time.perf_counter()
+        stats = {"scanned": 0, "imported": 0, "bytes": 0, "duplicates": 0, "failed": 0, "pending": 0,
+                 "folders_created": 0}
+        files = self._scan()
+        stats["scanned"] = len(files)
+        now = self.clock()
+        ready = []
+        for entry in files:
+            if self._seen.get(entry.path) == (entry.size, entry.mtime):
+                continue
+            if now - entry.mtime < self.debounce:
+                stats["pending"] += 1
+                continue
+            ready.append(entry)
+
+        hashes = {}
+        if self.use_hash and ready:
+            ready, hashes = self._dedupe(ready, stats)
+
+        batches = {}
+        for entry in ready:
+            batches.setdefault(self._folder_path(entry.path), []).append(entry)
+        for folder_path, entries in batches.items():
+            try:
+                folder_id = self._folder_id(folder_path, stats)
+            except (EagleError, requests.RequestException):
+                # E.g. Eagle restarting: the files stay unseen and are retried on the next poll,
+                # against a folder index rebuilt from scratch.
+                self._reset_folders()
+                stats["failed"] += len(entries)
+                continue
+            by_path = {entry.path: entry for entry in entries}
+            items = [{"path": entry.path, "name": os.path.splitext(os.path.basename(entry.path))[0]}
+                     for entry in entries]
+            for result in self.importer.import_paths(items, folder_id):
+                imported = [by_path[item["path"]] for item in result.items]
+                if not result.ok:
+                    stats["failed"] += len(imported)
+                    continue
+                for entry in imported:
+                    self._seen[entry.path] = (entry.size, entry.mtime)
+                    if entry.path in hashes:
+                        self._hashes.add(hashes[entry.path])
+                    stats["bytes"] += entry.size
+                stats["imported"] += len(imported)
+
+        if stats["imported"] or stats["duplicates"]:
+            self._save()
+        elapsed = time.perf_counter() - started
+        for key in ("scanned", "imported", "bytes", "duplicates", "failed", "folders_created"):
+            self.totals[key] += stats[key]
+        self.totals["polls"] += 1
+        self.totals["elapsed"] += elapsed
+        stats["elapsed"] = elapsed
+        stats["rate"] = stats["imported"] / elapsed if elapsed else 0.0
+        return stats
+
+    def run(self, interval: float = 1.0, callback=None) -> None:
+        """
+        Poll until stop is called, waiting ``interval`` seconds between polls.
+
+        Parameters:
+            interval (float): Seconds between the end of one poll and the start of the next.
+            callback (Optional[Callable[[Dict[str, Any]], None]]): Called with the counters of every poll.
+        """
+        self._stop.clear()
+        while not self._stop.is_set():
+            stats = self.poll()
+            if callback is not None:
+                callback(stats)
+            self._stop.wait(interval)
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the counters summed over every poll, with the overall import rate in files per second.
+        """
+        totals = dict(self.totals)
+        totals["rate"] = totals["imported"] / totals["elapsed"] if totals["elapsed"] else 0.0
+        return totals
+
+    def _scan(self) -> List[FileEntry]:
+        files = []
+        for root in self.roots:
+            files.extend(scan_tree(root, self.scan_workers, self.extensions))
+        return files
+
+    def _dedupe(self, ready: List[FileEntry], stats: Dict[str, int]) -> Tuple[List[FileEntry], Dict[str, str]]:
+        with ThreadPoolExecutor(max_workers=self.scan_workers) as executor:
+            digests = list(executor.map(lambda entry: _safe_hash(entry.path), ready))
+        unique, hashes, batch = [], {}, set()
+        for entry, digest in zip(ready, digests):
+            if digest is None:
+                continue
+            if digest in self._hashes or digest in batch:
+                self._seen[entry.path] = (entry.size, entry.mtime)
+                stats["duplicates"] += 1
+                continue
+            batch.add(digest)
+            hashes[entry.path] = digest
+            unique.append(entry)
+        return unique, hashes
+
+    def _folder_path(self, path: str) -> str:
+        root = max((root for root in self.roots if path.startswith(root + os.sep)), key=len)
+        relative = os.path.relpath(os.path.dirname(path), root)
+        parts = [self.roots[root]] if self.roots[root] else []
+        if relative != os.curdir:
+            parts.extend(relative.split(os.sep))
+        return "/".join(parts)
+
+    def _folder_id(self, folder_path: str, stats: Dict[str, int]) -> Optional[str]:
+        if not folder_path:
+            return None
+        if self.folders is None:
+            self.folders = FolderIndex.from_folder_api(self.folder)
+        parent_id = None
+        parts = folder_path.split("/")
+        for depth, name in enumerate(parts, 1):
+            node = self.folders.find_by_path("/".join(parts[:depth]))
+            if node is None:
+                if not self.create_folders:
+                    return parent_id
+                response = self.folder.create_folder(name, parent_id)
+                if not isinstance(response, dict) or response.get("status") != "success":
+                    raise EagleAPIError(f"Creating folder {folder_path} failed", response)
+                stats["folders_created"] += 1
+                node = self.folders.get(response["data"]["id"])
+            parent_id = node.id
+        return parent_id
+
+    def _reset_folders(self) -> None:
+        if self.folders is not None:
+            self.folders.detach()
+            self.folders = None
+
+    def _save(self) -> None:
+        if self.state_path is None:
+            return
+        temporary = self.state_path + ".tmp"
+        with open(temporary, "w") as handle:
+            json.dump({"seen": self._seen, "hashes": sorted(self._hashes)}, handle)
+        os.replace(temporary, self.state_path)
+
+
+def _safe_hash(path: str) -> Optional[str]:
+    try:
+        return file_hash(path)
+    except OSError:
+        return None
+
+
+def _parse_root(value: str) -> Tuple[str, Optional[str]]:
+    directory, _, folder_path = value.partition("=")
+    return directory, folder_path or None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Entry point of the ``eaglepy-watch`` command.
+    """
+    from .client import EagleClient
+
+    parser = argparse.ArgumentParser(
+        prog="eaglepy-watch",
+        description="Watch directories and import new files into Eagle in bulk."
+    )
+    parser.add_argument(
+        "roots", nargs="+", metavar="DIR[=FOLDER]",
+        help="A directory to watch, optionally mapped to an Eagle folder path, e.g. renders=Projects/Renders."
+    )
+    parser.add_argument("--url", default="http://localhost:41595", help="The base URL of the Eagle API.")
+    parser.add_argument("--interval", type=float, default=2.0, help="Seconds between scans.")
+    parser.add_argument("--debounce", type=float, default=2.0, help="Seconds a file must stay unmodified before import.")
+    parser.add_argument("--batch-size", type=int, default=500, help="The maximum number of files per import call.")
+    parser.add_argument("--workers", type=int, default=4, help="Parallel directory scans and import calls.")
+    parser.add_argument("--ext", action="append", help="Only import files with this extension. Repeatable.")
+    parser.add_argument("--hash", action="store_true", help="Skip files whose content was already imported.")
+    parser.add_argument("--no-create-folders", action="store_true", help="Do not create missing Eagle folders.")
+    parser.add_argument("--state", help="JSON file remembering imported files across restarts.")
+    parser.add_argument("--skip-existing", action="store_true", help="Do not import files present at startup.")
+    parser.add_argument("--once", action="store_true", help="Scan and import once, then exit.")
+    args = parser.parse_args(argv)
+
+    def report(stats):
+        if stats["imported"] or stats["failed"] or stats["duplicates"]:
+            print(
+                "imported {imported} files ({bytes} bytes) in {elapsed:.2f}s, {rate:.1f} files/s; "
+                "{duplicates} duplicates, {failed} failed, {pending} pending, {folders_created} folders created"
+                .format(**stats),
+                flush=True
+            )
+
+    with EagleClient(args.url) as client:
+        watcher = IngestWatcher(
+            client.item,
+            client.folder,
+            dict(_parse_root(value) for value in args.roots),
+            extensions=args.ext,
+            debounce=args.debounce,
+            batch_size=args.batch_size,
+            scan_workers=args.workers,
+            max_workers=args.workers,
+            use_hash=args.hash,
+            create_folders=not args.no_create_folders,
+            state_path=args.state
+        )
+        if args.skip_existing:
+            watcher.mark_existing()
+        try:
+            if args.once:
+                report(watcher.poll())
+            else:
+                watcher.run(args.interval, report)
+        except KeyboardInterrupt:
+            pass
+        totals = watcher.stats()
+        print(
+            "total: {imported} files imported in {polls} polls, {rate:.1f} files/s, {failed} failed".format(**totals),
+            file=sys.stderr
+        )
+    return 1 if totals["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,5 +17,9 @@ setup(
         "Operating System :: OS Independent",
     ],
     install_requires=["requests"],
-    python_requires='>=3.6',
+    extras_require={"fast": ["orjson"]},
+    entry_points={
+        "console_scripts": ["eaglepy-watch=eaglepy.watcher:main"],
+    },
+    python_requires='>=3.8',
 )
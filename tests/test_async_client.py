@@ -0,0 +1,94 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import patch, Mock
+from eaglepy.async_client import AsyncEagleClient
+
+
+class TestAsyncEagleClient(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.client = AsyncEagleClient(base_url="http://localhost:41595", max_concurrency=3)
+
+    async def asyncTearDown(self):
+        await self.client.close()
+
+    @patch('requests.Session.request')
+    async def test_get_item_info(self, mock_request):
+        mock_response = Mock()
+        mock_response.json.return_value = {"info": "test"}
+        mock_request.return_value = mock_response
+
+        response = await self.client.item.get_item_info("item_id")
+        self.assertEqual(response, {"info": "test"})
+        mock_request.assert_called_once_with(
+            "GET", "http://localhost:41595/api/item/info?id=item_id", params=None, timeout=(3.05, 30)
+        )
+
+    @patch('requests.Session.request')
+    async def test_update_item(self, mock_request):
+        mock_response = Mock()
+        mock_response.json.return_value = {"status": "success"}
+        mock_request.return_value = mock_response
+
+        response = await self.client.item.update_item("item_id", tags=["tag1"])
+        self.assertEqual(response, {"status": "success"})
+        mock_request.assert_called_once_with(
+            "POST", "http://localhost:41595/api/item/update", data=b'{"id":"item_id","tags":["tag1"]}',
+            json=None, headers={"Content-Type": "application/json"}, timeout=(3.05, 30)
+        )
+
+    async def test_iter_items(self):
+        pages = [[{"id": "a"}, {"id": "b"}], [{"id": "c"}]]
+
+        def list_page(method, url, params=None, **kwargs):
+            mock_response = Mock()
+            mock_response.json.return_value = {"status": "success", "data": pages[params["offset"]]}
+            return mock_response
+
+        with patch('requests.Session.request', side_effect=list_page):
+            ids = [item["id"] async for item in self.client.item.iter_items(page_size=2)]
+        self.assertEqual(ids, ["a", "b", "c"])
+
+    async def test_get_items_info(self):
+        def get_info(method, url, **kwargs):
+            item_id = url.rsplit("=", 1)[1]
+            if item_id == "bad":
+                raise ConnectionError("refused")
+            mock_response = Mock()
+            mock_response.json.return_value = {"status": "success", "data": {"id": item_id}}
+            return mock_response
+
+        with patch('requests.Session.request', side_effect=get_info) as mock_request:
+            response = await self.client.item.get_items_info(["b", "a", "bad", "a"])
+        self.assertEqual(list(response), ["b", "a", "bad"])
+        self.assertEqual(response["bad"]["status"], "error")
+        self.assertEqual(mock_request.call_count, 3)
+
+    async def test_concurrency_limit(self):
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def slow_request(*args, **kwargs):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.01)
+            with lock:
+                state["active"] -= 1
+            response = Mock()
+            response.json.return_value = {"status": "success"}
+            return response
+
+        with patch('requests.Session.request', side_effect=slow_request):
+            results = await asyncio.gather(*(self.client.item.get_item_info(str(i)) for i in range(12)))
+        self.assertEqual(len(results), 12)
+        self.assertEqual(state["peak"], 3)
+
+    def test_get_library_icon_is_sync(self):
+        url = self.client.library.get_library_icon("lib")
+        self.assertEqual(url, "http://localhost:41595/api/library/icon?libraryPath=lib")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import time
+import unittest
+from unittest.mock import Mock, call
+from eaglepy.batch_update import BatchUpdater
+
+
+class TestBatchUpdater(unittest.TestCase):
+    def setUp(self):
+        self.item = Mock()
+        self.item.update_item.return_value = {"status": "success"}
+
+    def test_edits_are_coalesced(self):
+        with BatchUpdater(self.item, flush_interval=None) as updater:
+            updater.update("a", tags=["x", "y"])
+            updater.update("a", tags=["y", "z"], annotation="first")
+            updater.update("a", annotation="second", star=3)
+            updater.update("b", url="http://example.com")
+            self.assertEqual(updater.pending, 2)
+            self.item.update_item.assert_not_called()
+        self.item.update_item.assert_has_calls([
+            call("a", ["x", "y", "z"], "second", None, 3),
+            call("b", None, None, "http://example.com", None),
+        ], any_order=True)
+        self.assertEqual(updater.stats(), {"updates": 4, "sent": 2, "failed": 0, "pending": 0})
+
+    def test_flush_on_size(self):
+        updater = BatchUpdater(self.item, max_pending=2, flush_interval=None)
+        updater.update("a", star=1)
+        updater.update("a", star=2)
+        self.item.update_item.assert_not_called()
+        updater.update("b", star=1)
+        self.assertEqual(self.item.update_item.call_count, 2)
+        updater.close()
+
+    def test_flush_on_interval(self):
+        updater = BatchUpdater(self.item, flush_interval=0.01)
+        updater.update("a", star=1)
+        deadline = time.monotonic() + 2
+        while not self.item.update_item.called and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.item.update_item.assert_called_once_with("a", None, None, None, 1)
+        updater.close()
+
+    def test_failures_are_reported(self):
+        self.item.update_item.side_effect = [ConnectionError("refused")]
+        on_result = Mock()
+        updater = BatchUpdater(self.item, flush_interval=None, on_result=on_result)
+        updater.update("a", star=1)
+        results = updater.flush()
+        self.assertIsInstance(results["a"], ConnectionError)
+        on_result.assert_called_once_with("a", None, results["a"])
+        self.assertEqual(updater.stats()["failed"], 1)
+        updater.close()
+        with self.assertRaises(RuntimeError):
+            updater.update("a", star=1)
+
+    def test_failing_callback_does_not_stop_the_timer(self):
+        on_result = Mock(side_effect=RuntimeError("callback bug"))
+        updater = BatchUpdater(self.item, flush_interval=0.01, on_result=on_result)
+        with self.assertLogs("eaglepy.batch_update", "ERROR"):
+            for item_id in ("a", "b"):
+                updater.update(item_id, star=1)
+                deadline = time.monotonic() + 2
+                while updater.pending and time.monotonic() < deadline:
+                    time.sleep(0.01)
+        self.assertEqual(self.item.update_item.call_count, 2)
+        self.assertTrue(updater._timer.is_alive())
+        updater.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+from eaglepy.bulk import BulkImporter, BulkItemOperations, chunked, run_chunks
+from eaglepy.client import EagleClient
+from eaglepy.mock_server import MockEagleServer
+
+
+class TestBulkImporter(unittest.TestCase):
+    def setUp(self):
+        self.item = Mock()
+        self.importer = BulkImporter(self.item, chunk_size=2, max_workers=2, max_retries=1)
+
+    def test_chunked(self):
+        self.assertEqual(list(chunked(range(5), 2)), [[0, 1], [2, 3], [4]])
+        with self.assertRaises(ValueError):
+            list(chunked([1], 0))
+
+    def test_import_paths_in_chunks(self):
+        self.item.add_items_from_paths.return_value = {"status": "success"}
+        items = [{"path": f"path/{i}.jpg", "name": str(i)} for i in range(5)]
+
+        results = list(self.importer.import_paths(items, folder_id="folder1"))
+        self.assertEqual(len(results), 3)
+        self.assertTrue(all(result.ok for result in results))
+        self.assertEqual(sorted(result.index for result in results), [0, 1, 2])
+        self.assertEqual(results[-1].completed, 5)
+        self.assertEqual(self.item.add_items_from_paths.call_count, 3)
+        self.item.add_items_from_paths.assert_any_call(items[4:], "folder1")
+
+    def test_failed_chunk_is_retried_alone(self):
+        calls = []
+
+        def add_items_from_urls(chunk, folder_id):
+            calls.append([entry["url"] for entry in chunk])
+            if chunk[0]["url"] == "u2" and calls.count(["u2", "u3"]) == 1:
+                raise ConnectionError("boom")
+            return {"status": "success"}
+
+        self.item.add_items_from_urls.side_effect = add_items_from_urls
+        items = [{"url": f"u{i}", "name": str(i)} for i in range(4)]
+
+        results = sorted(self.importer.import_urls(items), key=lambda result: result.index)
+        self.assertEqual([result.attempts for result in results], [1, 2])
+        self.assertTrue(all(result.ok for result in results))
+        self.assertEqual(calls.count(["u0", "u1"]), 1)
+        self.assertEqual(calls.count(["u2", "u3"]), 2)
+
+    def test_chunk_fails_after_retries(self):
+        self.item.add_items_from_paths.return_value = {"status": "error"}
+
+        results = list(self.importer.import_paths([{"path": "a", "name": "a"}]))
+        self.assertEqual(len(results), 1)
+        self.assertFalse(results[0].ok)
+        self.assertEqual(results[0].attempts, 2)
+        self.assertEqual(results[0].completed, 0)
+        self.assertEqual(results[0].processed, 1)
+
+    @patch('eaglepy.resilience.random.uniform', side_effect=lambda low, high: high)
+    def test_retries_back_off(self, _):
+        sleep = Mock()
+        send = Mock(return_value={"status": "error"})
+
+        results = list(run_chunks([["a"]], send, max_retries=3, backoff_base=0.5, backoff_max=1.5, sleep=sleep))
+        self.assertEqual(results[0].attempts, 4)
+        self.assertEqual([call.args[0] for call in sleep.call_args_list], [0.5, 1.0, 1.5])
+
+
+class TestBulkItemOperations(unittest.TestCase):
+    def setUp(self):
+        self.server = MockEagleServer().start()
+        self.client = EagleClient(self.server.base_url)
+        self.ids = self.server.add_items(7)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_trash_in_chunks_with_progress(self):
+        progress = []
+        operations = BulkItemOperations(self.client.item, chunk_size=3, max_workers=2,
+                                        progress=lambda result, total: progress.append((result.processed, total)))
+        summary = operations.trash(self.ids + self.ids[:2])
+        self.assertTrue(summary.ok)
+        self.assertEqual(sorted(summary.processed), sorted(self.ids))
+        self.assertEqual(summary.chunks, 3)
+        self.assertEqual(self.server.request_counts["/api/item/moveToTrash"], 3)
+        self.assertTrue(all(item["isDeleted"] for item in self.server.items.values()))
+        self.assertEqual(progress[-1], (7, 7))
+
+    def test_failed_trash_resumes_from_state(self):
+        with tempfile.TemporaryDirectory() as directory:
+            state = os.path.join(directory, "state.json")
+            self.server.fail_next("/api/item/moveToTrash", count=2)
+            operations = BulkItemOperations(self.client.item, chunk_size=4, max_workers=1, max_retries=1,
+                                            state_path=state)
+            summary = operations.trash(self.ids)
+            self.assertEqual(summary.failed, self.ids[:4])
+            self.assertEqual(summary.processed, self.ids[4:])
+
+            resumed = BulkItemOperations(self.client.item, chunk_size=4, state_path=state).trash(self.ids)
+        self.assertEqual((resumed.processed, resumed.skipped), (self.ids[:4], 3))
+        self.assertTrue(all(item["isDeleted"] for item in self.server.items.values()))
+
+    def test_state_is_appended_per_chunk(self):
+        with tempfile.TemporaryDirectory() as directory:
+            state = os.path.join(directory, "state.json")
+            BulkItemOperations(self.client.item, chunk_size=3, max_workers=1, state_path=state).trash(self.ids)
+            with open(state) as handle:
+                lines = [json.loads(line) for line in handle]
+            with open(state, "a") as handle:
+                handle.write('{"operation": "trash", "ids": ["trunc')
+            resumed = BulkItemOperations(self.client.item, state_path=state).trash(self.ids)
+        self.assertEqual([len(line["ids"]) for line in lines], [3, 3, 1])
+        self.assertEqual((resumed.processed, resumed.skipped), ([], 7))
+
+    def test_move_resumes_with_folders_in_any_order(self):
+        operations = BulkItemOperations(self.client.item, chunk_size=4)
+        operations.move(self.ids, ["F1", "F2"])
+        self.server.reset_counters()
+        summary = operations.move(self.ids, ["F2", "F1"])
+        self.assertEqual((summary.processed, summary.skipped), ([], 7))
+        self.assertEqual(self.server.request_counts, {})
+
+    def test_move_retries_only_unprocessed_items(self):
+        item = Mock()
+        moved = {"status": "success", "data": {"folders": ["F1"]}}
+        responses = iter([moved, {"status": "error"}] + [moved] * 10)
+        item.update_item.side_effect = lambda item_id, folders: next(responses)
+        operations = BulkItemOperations(item, chunk_size=3, max_workers=1)
+        summary = operations.move(["a", "b", "c"], ["F1"])
+        self.assertTrue(summary.ok)
+        self.assertEqual([call.args[0] for call in item.update_item.call_args_list], ["a", "b", "b", "c"])
+        item.update_item.assert_called_with("c", folders=["F1"])
+
+    def test_move_end_to_end(self):
+        summary = BulkItemOperations(self.client.item, chunk_size=2).move(self.ids, ["F1"])
+        self.assertEqual(sorted(summary.processed), sorted(self.ids))
+        self.assertTrue(all(item["folders"] == ["F1"] for item in self.server.items.values()))
+
+    def test_move_ignored_by_eagle_is_failed(self):
+        item = Mock()
+        item.update_item.return_value = {"status": "success", "data": {"id": "a", "folders": []}}
+        operations = BulkItemOperations(item, chunk_size=2, max_workers=1, max_retries=1)
+        summary = operations.move(["a", "b"], ["F1"])
+        self.assertFalse(summary.ok)
+        self.assertEqual((summary.processed, summary.failed), ([], ["a", "b"]))
+        self.assertEqual(operations.processed["move:F1"], set())
+
+
+if __name__ == '__main__':
+    unittest.main()
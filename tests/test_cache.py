@@ -0,0 +1,124 @@
+import unittest
+from unittest.mock import patch, Mock
+from eaglepy.cache import ResponseCache, cache_key
+from eaglepy.client import EagleClient
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = ResponseCache(ttls={"/api/item/info": 5, "/api/folder/list": 5}, maxsize=2, clock=self.clock)
+
+    def test_cache_key_ignores_parameter_order(self):
+        self.assertEqual(
+            cache_key("http://localhost:41595/api/item/list?b=2&a=1"),
+            cache_key("http://localhost:41595/api/item/list", {"a": "1", "b": "2"})
+        )
+
+    def test_ttl_expiry(self):
+        key = cache_key("http://localhost:41595/api/folder/list")
+        self.cache.set(key, "folders")
+        self.assertEqual(self.cache.get(key), "folders")
+        self.clock.now = 5
+        self.assertIsNone(self.cache.get(key))
+        self.assertEqual(self.cache.stats()["hits"], 1)
+        self.assertEqual(self.cache.stats()["misses"], 1)
+
+    def test_lru_eviction(self):
+        keys = [cache_key(f"http://localhost:41595/api/item/info?id={i}") for i in range(3)]
+        self.cache.set(keys[0], 0)
+        self.cache.set(keys[1], 1)
+        self.cache.get(keys[0])
+        self.cache.set(keys[2], 2)
+        self.assertIn(keys[0], self.cache)
+        self.assertNotIn(keys[1], self.cache)
+        self.assertEqual(self.cache.stats()["evictions"], 1)
+
+    def test_uncached_endpoint_is_not_stored(self):
+        key = cache_key("http://localhost:41595/api/item/list")
+        self.assertFalse(self.cache.is_cacheable(key))
+        self.cache.set(key, "items")
+        self.assertEqual(len(self.cache), 0)
+
+    def test_invalidate_for_item_update_drops_only_that_item(self):
+        first = cache_key("http://localhost:41595/api/item/info?id=a")
+        second = cache_key("http://localhost:41595/api/item/info?id=b")
+        self.cache.set(first, "a")
+        self.cache.set(second, "b")
+        self.assertEqual(self.cache.invalidate_for("/api/item/update", {"id": "a"}), 1)
+        self.assertNotIn(first, self.cache)
+        self.assertIn(second, self.cache)
+
+    def test_set_after_invalidation_is_skipped(self):
+        key = cache_key("http://localhost:41595/api/folder/list")
+        generation = self.cache.generation(key)
+        self.cache.invalidate_for("/api/folder/create", {"folderName": "New"})
+        self.cache.set(key, "stale", generation)
+        self.assertNotIn(key, self.cache)
+        self.cache.set(key, "fresh", self.cache.generation(key))
+        self.assertIn(key, self.cache)
+
+    def test_invalidate_for_switch_library_drops_everything(self):
+        self.cache.set(cache_key("http://localhost:41595/api/item/info?id=a"), "a")
+        self.cache.set(cache_key("http://localhost:41595/api/folder/list"), "folders")
+        self.assertEqual(self.cache.invalidate_for("/api/library/switch", {"libraryPath": "lib"}), 2)
+
+
+class TestClientCache(unittest.TestCase):
+    def setUp(self):
+        self.client = EagleClient(base_url="http://localhost:41595", cache=ResponseCache())
+
+    def tearDown(self):
+        self.client.close()
+
+    @patch('requests.Session.request')
+    def test_reads_are_cached_until_mutation(self, mock_request):
+        mock_response = Mock(status_code=200)
+        mock_response.json.return_value = {"status": "success", "data": []}
+        mock_request.return_value = mock_response
+
+        self.client.folder.list_folders()
+        self.client.folder.list_folders()
+        self.assertEqual(mock_request.call_count, 1)
+
+        self.client.folder.create_folder("New Folder")
+        self.client.folder.list_folders()
+        self.assertEqual(mock_request.call_count, 3)
+        self.assertEqual(self.client.cache.stats()["hits"], 1)
+
+    @patch('requests.Session.request')
+    def test_error_bodies_are_not_cached(self, mock_request):
+        mock_response = Mock(status_code=200)
+        mock_response.json.return_value = {"status": "error", "message": "busy"}
+        mock_request.return_value = mock_response
+
+        self.client.folder.list_folders()
+        self.client.folder.list_folders()
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(len(self.client.cache), 0)
+
+    @patch('requests.Session.request')
+    def test_read_in_flight_during_mutation_is_not_cached(self, mock_request):
+        def respond(method, url, **kwargs):
+            if url.endswith("/api/folder/list"):
+                # A concurrent create_folder completes while the list is in flight.
+                self.client.cache.invalidate_for("/api/folder/create", {"folderName": "New"})
+            response = Mock(status_code=200)
+            response.json.return_value = {"status": "success", "data": []}
+            return response
+
+        mock_request.side_effect = respond
+        self.client.folder.list_folders()
+        self.assertEqual(len(self.client.cache), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,170 @@
+import unittest
+from eaglepy.change_feed import ADDED, DELETED, UPDATED, ChangeEvent, ChangeFeed, diff, item_fingerprint
+from eaglepy.client import EagleClient
+from eaglepy.exceptions import EagleAPIError
+from eaglepy.mock_server import MockEagleServer
+
+
+class TestDiff(unittest.TestCase):
+    def test_reports_added_updated_and_deleted(self):
+        previous = {"a": item_fingerprint({"modificationTime": 1}), "b": item_fingerprint({"modificationTime": 1}),
+                    "c": item_fingerprint({"modificationTime": 1})}
+        entries = [{"id": "a", "modificationTime": 1}, {"id": "b", "modificationTime": 2}, {"id": "d"}]
+        current, events = diff("item", previous, entries, item_fingerprint)
+        self.assertEqual(sorted(current), ["a", "b", "d"])
+        self.assertEqual([(event.kind, event.id) for event in events], [(UPDATED, "b"), (ADDED, "d"), (DELETED, "c")])
+        self.assertIsNone(events[-1].data)
+
+    def test_without_previous_only_fingerprints(self):
+        current, events = diff("item", None, [{"id": "a"}], item_fingerprint)
+        self.assertEqual(list(current), ["a"])
+        self.assertEqual(events, [])
+
+
+class TestChangeFeed(unittest.TestCase):
+    def setUp(self):
+        self.server = MockEagleServer().start()
+        self.client = EagleClient(self.server.base_url)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def feed(self, **kwargs):
+        return ChangeFeed(self.client.item, self.client.folder, min_interval=1.0, max_interval=4.0, backoff=2.0, **kwargs)
+
+    def test_first_poll_sets_baseline(self):
+        self.server.add_items(3)
+        feed = self.feed()
+        self.assertEqual(feed.poll(), [])
+        self.assertEqual(len(feed.items), 3)
+
+    def test_emit_initial_reports_existing_items(self):
+        ids = self.server.add_items(2)
+        events = self.feed(emit_initial=True).poll()
+        self.assertEqual(sorted(event.id for event in events), sorted(ids))
+        self.assertTrue(all(event.kind == ADDED for event in events))
+
+    def test_item_changes(self):
+        first, second = self.server.add_items(2)
+        feed = self.feed()
+        feed.poll()
+        added = self.server.add_items(1)[0]
+        self.client.item.update_item(first, tags=["new"])
+        self.client.item.move_items_to_trash([second])
+        events = {(event.kind, event.id) for event in feed.poll()}
+        self.assertEqual(events, {(ADDED, added), (UPDATED, first), (DELETED, second)})
+        self.assertEqual(feed.poll(), [])
+
+    def test_folder_changes(self):
+        feed = self.feed()
+        feed.poll()
+        parent = self.client.folder.create_folder("Parent")["data"]["id"]
+        child = self.client.folder.create_folder("Child", parent=parent)["data"]["id"]
+        events = feed.poll()
+        self.assertEqual({(event.kind, event.entity, event.id) for event in events},
+                         {(ADDED, "folder", parent), (ADDED, "folder", child)})
+        self.assertEqual([event.data["parent"] for event in events if event.id == child], [parent])
+        self.client.folder.rename_folder(child, "Renamed")
+        self.assertEqual([(event.kind, event.id) for event in feed.poll()], [(UPDATED, child)])
+
+    def test_interval_adapts(self):
+        feed = self.feed()
+        feed.poll()
+        self.assertEqual(feed.interval, 2.0)
+        feed.poll()
+        feed.poll()
+        self.assertEqual(feed.interval, 4.0)
+        self.server.add_items(1)
+        feed.poll()
+        self.assertEqual(feed.interval, 1.0)
+
+    def test_subscribers_receive_events(self):
+        feed = self.feed()
+        feed.poll()
+        received = []
+        feed.subscribe(received.append)
+        self.server.add_items(2)
+        feed.poll()
+        self.assertEqual(len(received), 2)
+        self.assertIsInstance(received[0], ChangeEvent)
+        feed.unsubscribe(received.append)
+        self.server.add_items(1)
+        feed.poll()
+        self.assertEqual(len(received), 2)
+
+    def test_failing_callback_does_not_lose_events(self):
+        errors = []
+        feed = self.feed(on_error=errors.append)
+        feed.poll()
+        received = []
+
+        def fail(event):
+            raise RuntimeError("subscriber bug")
+
+        feed.subscribe(fail)
+        feed.subscribe(received.append)
+        ids = self.server.add_items(2)
+        events = feed.poll()
+        self.assertEqual(sorted(event.id for event in received), sorted(ids))
+        self.assertEqual(len(events), 2)
+        self.assertEqual(len(errors), 2)
+        self.assertIsInstance(errors[0], RuntimeError)
+        self.assertEqual(feed.interval, 1.0)
+
+    def test_background_thread(self):
+        self.server.add_items(2)
+        feed = ChangeFeed(self.client.item, min_interval=0.01, max_interval=0.01, emit_initial=True)
+        received = []
+        feed.subscribe(received.append)
+        feed.start()
+        try:
+            for _ in range(200):
+                if len(received) == 2:
+                    break
+                feed._stop.wait(0.01)
+        finally:
+            feed.stop()
+        self.assertEqual(len(received), 2)
+        self.assertIsNone(feed._thread)
+
+    def test_failed_poll_is_reported_and_retried(self):
+        feed = ChangeFeed(self.client.item, self.client.folder, min_interval=0.01, max_interval=0.02)
+        feed.poll()
+        errors = []
+        received = []
+        feed.on_error = errors.append
+        feed.subscribe(received.append)
+        self.server.fail_next("/api/folder/list", count=2)
+        item_id = self.server.add_items(1)[0]
+        feed.start()
+        try:
+            for _ in range(200):
+                if received:
+                    break
+                feed._stop.wait(0.01)
+        finally:
+            feed.stop()
+        self.assertEqual(len(errors), 2)
+        self.assertIsInstance(errors[0], EagleAPIError)
+        self.assertEqual((feed.errors, feed.last_error), (2, errors[-1]))
+        self.assertEqual([(event.kind, event.id) for event in received], [(ADDED, item_id)])
+
+
+class TestChangeFeedAsync(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = MockEagleServer().start()
+        self.client = EagleClient(self.server.base_url)
+
+    async def asyncTearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    async def test_async_iterator(self):
+        item_id = self.server.add_items(1)[0]
+        feed = ChangeFeed(self.client.item, min_interval=0.01, max_interval=0.01, emit_initial=True)
+        received = []
+        async for event in feed:
+            received.append(event)
+            feed.stop()
+        self.assertEqual([(event.kind, event.id) for event in received], [(ADDED, item_id)])
@@ -0,0 +1,37 @@
+import unittest
+from unittest.mock import patch, Mock
+from eaglepy.client import EagleClient
+
+
+class TestEagleClient(unittest.TestCase):
+    def setUp(self):
+        self.client = EagleClient(base_url="http://localhost:41595")
+
+    def tearDown(self):
+        self.client.close()
+
+    def test_endpoints_share_transport(self):
+        for endpoint in (self.client.application, self.client.folder, self.client.item, self.client.library):
+            self.assertIs(endpoint.session, self.client.transport)
+
+    @patch('requests.Session.request')
+    def test_calls_go_through_session(self, mock_request):
+        mock_response = Mock()
+        mock_response.json.return_value = {"info": "test"}
+        mock_request.return_value = mock_response
+
+        response = self.client.application.get_info()
+        self.assertEqual(response, {"info": "test"})
+        mock_request.assert_called_once_with(
+            "GET", "http://localhost:41595/api/application/info", params=None, timeout=(3.05, 30)
+        )
+
+    def test_context_manager_closes_transport(self):
+        with patch.object(self.client.transport, "close") as mock_close:
+            with self.client:
+                pass
+            mock_close.assert_called_once_with()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import asyncio
+import json
+import threading
+import unittest
+from eaglepy.async_client import AsyncEagleClient
+from eaglepy.cache import ResponseCache
+from eaglepy.client import EagleClient
+from eaglepy.codec import JSONCodec, OrjsonCodec, best_codec, orjson
+from eaglepy.mock_server import MockEagleServer
+from eaglepy.singleflight import SingleFlight
+
+
+class CountingCodec(JSONCodec):
+    def __init__(self):
+        self.encoded = 0
+        self.decoded = 0
+
+    def dumps(self, obj):
+        self.encoded += 1
+        return super().dumps(obj)
+
+    def loads(self, data):
+        self.decoded += 1
+        return super().loads(data)
+
+
+class TestCodecs(unittest.TestCase):
+    def test_round_trip(self):
+        payload = {"items": [{"path": "/tmp/ü.png", "tags": ["a", "b"], "star": 5}], "folderId": None}
+        codecs = [JSONCodec()] + ([OrjsonCodec()] if orjson is not None else [])
+        for codec in codecs:
+            data = codec.dumps(payload)
+            self.assertIsInstance(data, bytes)
+            self.assertEqual(codec.loads(data), payload)
+            self.assertEqual(json.loads(data), payload)
+
+    def test_best_codec(self):
+        self.assertIsInstance(best_codec(), OrjsonCodec if orjson is not None else JSONCodec)
+
+
+class TestClientCodec(unittest.TestCase):
+    def setUp(self):
+        self.server = MockEagleServer().start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_codec_encodes_requests_and_decodes_responses(self):
+        codec = CountingCodec()
+        with EagleClient(self.server.base_url, codec=codec) as client:
+            response = client.item.add_items_from_paths([{"path": "/tmp/a.png", "name": "a"}])
+            self.assertEqual(response["status"], "success")
+            listed = client.item.list_items("CREATEDATE", 10)
+        self.assertEqual([item["name"] for item in listed["data"]], ["a"])
+        self.assertEqual((codec.encoded, codec.decoded), (1, 2))
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_orjson_client(self):
+        self.server.add_items(3)
+        with EagleClient(self.server.base_url, codec=OrjsonCodec()) as client:
+            self.assertEqual(len(client.item.list_items("CREATEDATE", 10)["data"]), 3)
+
+    def test_raw_returns_undecoded_body(self):
+        self.server.add_items(2)
+        with EagleClient(self.server.base_url, cache=ResponseCache({"/api/folder/list": 60})) as client:
+            with client.raw():
+                body = client.item.list_items("CREATEDATE", 10)
+                folders = client.folder.list_folders()
+            self.assertIsInstance(body, bytes)
+            self.assertEqual(len(json.loads(body)["data"]), 2)
+            self.assertIsInstance(folders, bytes)
+            self.assertEqual(client.folder.list_folders(), {"status": "success", "data": []})
+
+    def test_raw_applies_to_responses_fetched_outside_raw(self):
+        with EagleClient(self.server.base_url, cache=ResponseCache()) as client:
+            self.assertIsInstance(client.library.get_library_info(), dict)
+            with client.raw():
+                self.assertIsInstance(client.library.get_library_info(), bytes)
+            self.assertIsInstance(client.library.get_library_info(), dict)
+        self.assertEqual(self.server.request_counts["/api/library/info"], 1)
+
+    def test_raw_applies_to_shared_responses(self):
+        self.server.latency = 0.2
+        with EagleClient(self.server.base_url, single_flight=SingleFlight()) as client:
+            results = {}
+
+            def raw():
+                with client.raw():
+                    results["raw"] = client.folder.list_folders()
+
+            thread = threading.Thread(target=raw)
+            thread.start()
+            results["decoded"] = client.folder.list_folders()
+            thread.join()
+        self.assertIsInstance(results["raw"], bytes)
+        self.assertEqual(results["decoded"], {"status": "success", "data": []})
+        self.assertEqual(self.server.request_counts["/api/folder/list"], 1)
+
+
+class TestAsyncClientRaw(unittest.IsolatedAsyncioTestCase):
+    async def test_raw_applies_to_awaited_calls(self):
+        with MockEagleServer() as server:
+            server.add_items(1)
+            async with AsyncEagleClient(server.base_url, single_flight=SingleFlight()) as client:
+                with client.raw():
+                    body, shared = await asyncio.gather(client.folder.list_folders(), client.folder.list_folders())
+                decoded = await client.folder.list_folders()
+        self.assertIsInstance(body, bytes)
+        self.assertIsInstance(shared, bytes)
+        self.assertEqual(json.loads(body), decoded)
+
+
+if __name__ == '__main__':
+    unittest.main()
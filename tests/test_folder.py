@@ -17,7 +17,7 @@ class TestFolder(unittest.TestCase):
         self.assertEqual(response, {"status": "success"})
         mock_post.assert_called_once_with(
             "http://localhost:41595/api/folder/create",
-            json={"folderName": "New Folder", "parent": None}
+            json={"folderName": "New Folder"}
         )
 
     @patch('requests.post')
@@ -0,0 +1,80 @@
+import unittest
+from unittest.mock import patch, Mock
+from eaglepy.exceptions import EagleAPIError
+from eaglepy.folder import Folder
+from eaglepy.folder_index import FolderIndex
+
+TREE = [
+    {"id": "p", "name": "Projects", "children": [
+        {"id": "y", "name": "2024", "children": [
+            {"id": "r", "name": "Refs", "children": []},
+        ]},
+    ]},
+    {"id": "a", "name": "Archive", "children": [
+        {"id": "r2", "name": "Refs", "children": []},
+    ]},
+]
+
+
+class TestFolderIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = FolderIndex.from_response({"status": "success", "data": TREE})
+
+    def test_lookups(self):
+        self.assertEqual(len(self.index), 5)
+        self.assertEqual(self.index.find_by_path("Projects/2024/Refs").id, "r")
+        self.assertEqual({node.id for node in self.index.find_by_name("Refs")}, {"r", "r2"})
+        self.assertEqual(self.index.path_of("r2"), "Archive/Refs")
+        self.assertIsNone(self.index.find_by_path("Projects/Refs"))
+
+    def test_navigation(self):
+        self.assertEqual(self.index.parent("r").id, "y")
+        self.assertEqual([node.id for node in self.index.children("p")], ["y"])
+        self.assertEqual([node.id for node in self.index.ancestors("r")], ["y", "p"])
+        self.assertEqual([node.id for node in self.index.descendants("p")], ["y", "r"])
+        self.assertEqual(self.index.roots, ["p", "a"])
+
+    def test_from_library_info(self):
+        index = FolderIndex.from_response({"status": "success", "data": {"folders": TREE}})
+        self.assertEqual(index.find_by_path("Archive/Refs").id, "r2")
+
+    def test_failed_response_raises(self):
+        for response in ({"status": "error", "message": "busy"}, {"status": "success"}, None):
+            with self.assertRaises(EagleAPIError):
+                FolderIndex.from_response(response)
+
+    @patch('requests.post')
+    def test_incremental_updates(self, mock_post):
+        folder = Folder(base_url="http://localhost:41595")
+        self.index.attach(folder)
+        mock_response = Mock()
+        mock_post.return_value = mock_response
+
+        mock_response.json.return_value = {"status": "success", "data": {"id": "n", "name": "New"}}
+        folder.create_folder("New", parent="r")
+        self.assertEqual(self.index.find_by_path("Projects/2024/Refs/New").id, "n")
+
+        mock_response.json.return_value = {"status": "success", "data": {"id": "y", "name": "2025"}}
+        folder.rename_folder("y", "2025")
+        self.assertIsNone(self.index.find_by_path("Projects/2024/Refs/New"))
+        self.assertEqual(self.index.find_by_path("Projects/2025/Refs/New").id, "n")
+        self.assertEqual(self.index.find_by_name("2025")[0].id, "y")
+        self.assertEqual(self.index.find_by_name("2024"), [])
+
+        mock_response.json.return_value = {"status": "error"}
+        folder.rename_folder("y", "Ignored")
+        self.assertEqual(self.index.path_of("y"), "Projects/2025")
+
+        mock_response.json.return_value = {"status": "success", "data": {"id": "a", "name": "Old"}}
+        folder.update_folder("a", "Old", "Old things", "red")
+        self.assertEqual(self.index.path_of("r2"), "Old/Refs")
+        self.assertEqual(self.index.get("a").data["description"], "Old things")
+
+        self.index.detach()
+        mock_response.json.return_value = {"status": "success", "data": {"id": "z", "name": "Z"}}
+        folder.create_folder("Z")
+        self.assertNotIn("z", self.index)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+from unittest.mock import Mock
+from eaglepy.client import EagleClient
+from eaglepy.instrumentation import Instrumentation
+from eaglepy.mock_server import MockEagleServer
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.instrumentation = Instrumentation(buckets=(0.5, 5))
+
+    def test_observe_records_success_and_errors(self):
+        response = Mock(status_code=200, content=b"{}")
+        response.request.body = b'{"id": "a"}'
+        send = Mock(return_value=response)
+
+        self.instrumentation.observe(send, "POST", "http://localhost:41595/api/item/update", {"json": {"id": "a"}})
+        send.side_effect = ConnectionError("refused")
+        with self.assertRaises(ConnectionError):
+            self.instrumentation.observe(send, "POST", "http://localhost:41595/api/item/update", {})
+
+        stats = self.instrumentation.as_dict()["POST /api/item/update"]
+        self.assertEqual(stats["count"], 2)
+        self.assertEqual(stats["errors"], 1)
+        self.assertEqual(stats["error_rate"], 0.5)
+        self.assertEqual(stats["request_bytes"], 11)
+        self.assertEqual(stats["response_bytes"], 2)
+        self.assertEqual(stats["latency_buckets"][float("inf")], 2)
+
+    def test_hooks(self):
+        before, after = Mock(), Mock()
+        self.instrumentation.add_before_hook(before)
+        self.instrumentation.add_after_hook(after)
+        self.instrumentation.observe(Mock(return_value=Mock(status_code=404)), "GET", "http://h/api/x", {})
+
+        event = after.call_args.args[0]
+        before.assert_called_once_with(event)
+        self.assertEqual((event.endpoint, event.status_code), ("/api/x", 404))
+        self.assertTrue(event.failed)
+        self.assertIsNotNone(event.elapsed)
+
+    def test_prometheus_export(self):
+        self.instrumentation.observe(Mock(return_value=Mock(status_code=200)), "GET", "http://h/api/folder/list", {})
+        text = self.instrumentation.to_prometheus()
+        self.assertIn('eaglepy_requests_total{method="GET",endpoint="/api/folder/list"} 1', text)
+        self.assertIn('eaglepy_request_duration_seconds_bucket{method="GET",endpoint="/api/folder/list",le="+Inf"} 1',
+                      text)
+        self.assertIn("# TYPE eaglepy_request_duration_seconds histogram", text)
+
+    def test_client_end_to_end(self):
+        with MockEagleServer() as server, EagleClient(server.base_url, instrumentation=self.instrumentation) as client:
+            client.folder.create_folder("New Folder")
+            client.folder.list_folders()
+            client.folder.list_folders()
+        metrics = self.instrumentation.as_dict()
+        self.assertEqual(metrics["GET /api/folder/list"]["count"], 2)
+        self.assertGreater(metrics["GET /api/folder/list"]["response_bytes"], 0)
+        self.assertGreater(metrics["POST /api/folder/create"]["request_bytes"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
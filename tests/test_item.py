@@ -1,5 +1,6 @@
 import unittest
 from unittest.mock import patch, Mock
+from eaglepy.exceptions import EagleAPIError
 from eaglepy.item import Item
 
 
@@ -17,8 +18,7 @@ class TestItem(unittest.TestCase):
         self.assertEqual(response, {"status": "success"})
         mock_post.assert_called_once_with(
             "http://localhost:41595/api/item/addFromURL",
-            json={"url": "http://example.com/image.jpg", "name": "image",
-                  "website": None, "tags": None, "modificationTime": None, "headers": None}
+            json={"url": "http://example.com/image.jpg", "name": "image"}
         )
 
     @patch('requests.post')
@@ -32,7 +32,7 @@ class TestItem(unittest.TestCase):
         self.assertEqual(response, {"status": "success"})
         mock_post.assert_called_once_with(
             "http://localhost:41595/api/item/addFromURLs",
-            json={"items": items, "folderId": None}
+            json={"items": items}
         )
 
     @patch('requests.post')
@@ -45,8 +45,7 @@ class TestItem(unittest.TestCase):
         self.assertEqual(response, {"status": "success"})
         mock_post.assert_called_once_with(
             "http://localhost:41595/api/item/addFromPath",
-            json={"path": "path/to/image.jpg", "name": "image", "website": None,
-                  "tags": None, "annotation": None, "folderId": None}
+            json={"path": "path/to/image.jpg", "name": "image"}
         )
 
     @patch('requests.post')
@@ -60,7 +59,7 @@ class TestItem(unittest.TestCase):
         self.assertEqual(response, {"status": "success"})
         mock_post.assert_called_once_with(
             "http://localhost:41595/api/item/addFromPaths",
-            json={"items": items, "folderId": None}
+            json={"items": items}
         )
 
     @patch('requests.post')
@@ -73,7 +72,7 @@ class TestItem(unittest.TestCase):
         self.assertEqual(response, {"status": "success"})
         mock_post.assert_called_once_with(
             "http://localhost:41595/api/item/addBookmark",
-            json={"url": "http://example.com", "name": "bookmark", "tags": None, "base64": "base64data"}
+            json={"url": "http://example.com", "name": "bookmark", "base64": "base64data"}
         )
 
     @patch('requests.get')
@@ -86,6 +85,23 @@ class TestItem(unittest.TestCase):
         self.assertEqual(response, {"info": "test"})
         mock_get.assert_called_once_with("http://localhost:41595/api/item/info?id=item_id")
 
+    @patch('requests.get')
+    def test_get_items_info(self, mock_get):
+        def get_info(url):
+            item_id = url.rsplit("=", 1)[1]
+            if item_id == "bad":
+                raise ConnectionError("refused")
+            mock_response = Mock()
+            mock_response.json.return_value = {"status": "success", "data": {"id": item_id}}
+            return mock_response
+
+        mock_get.side_effect = get_info
+        response = self.item.get_items_info(["b", "a", "bad", "b"], max_workers=2)
+        self.assertEqual(list(response), ["b", "a", "bad"])
+        self.assertEqual(response["a"]["data"], {"id": "a"})
+        self.assertEqual(response["bad"], {"status": "error", "message": "refused"})
+        self.assertEqual(mock_get.call_count, 3)
+
     @patch('requests.get')
     def test_get_item_thumbnail(self, mock_get):
         mock_response = Mock()
@@ -110,6 +126,44 @@ class TestItem(unittest.TestCase):
                     "name": "name", "folders": ["folder1"], "tags": "tag1"}
         )
 
+    @patch('requests.get')
+    def test_list_items_with_offset(self, mock_get):
+        mock_response = Mock()
+        mock_response.json.return_value = {"items": []}
+        mock_get.return_value = mock_response
+
+        self.item.list_items("CREATEDATE", 10, offset=2)
+        mock_get.assert_called_once_with(
+            "http://localhost:41595/api/item/list",
+            params={"orderBy": "CREATEDATE", "limit": 10, "ext": None,
+                    "name": None, "folders": None, "tags": None, "offset": 2}
+        )
+
+    @patch('requests.get')
+    def test_iter_items(self, mock_get):
+        pages = [[{"id": "a"}, {"id": "b"}], [{"id": "c"}, {"id": "d"}], [{"id": "e"}]]
+
+        def list_page(url, params):
+            mock_response = Mock()
+            mock_response.json.return_value = {"status": "success", "data": pages[params["offset"]]}
+            return mock_response
+
+        mock_get.side_effect = list_page
+        for prefetch in (True, False):
+            ids = [item["id"] for item in self.item.iter_items(page_size=2, tags=["tag1"], prefetch=prefetch)]
+            self.assertEqual(ids, ["a", "b", "c", "d", "e"])
+        self.assertEqual(mock_get.call_count, 6)
+        self.assertEqual(mock_get.call_args.kwargs["params"]["tags"], "tag1")
+
+    @patch('requests.get')
+    def test_iter_items_raises_on_error(self, mock_get):
+        mock_response = Mock()
+        mock_response.json.return_value = {"status": "error"}
+        mock_get.return_value = mock_response
+
+        with self.assertRaises(EagleAPIError):
+            list(self.item.iter_items())
+
     @patch('requests.post')
     def test_move_items_to_trash(self, mock_post):
         mock_response = Mock()
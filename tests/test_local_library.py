@@ -0,0 +1,60 @@
+import json
+import os
+import tempfile
+import unittest
+from eaglepy.local_library import LocalLibrary
+
+
+def write_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as handle:
+        json.dump(data, handle)
+
+
+class TestLocalLibrary(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "Test.library")
+        self.folders = [{"id": "F1", "name": "Refs", "children": [{"id": "F2", "name": "Sub", "children": []}]}]
+        write_json(os.path.join(self.path, "metadata.json"), {"folders": self.folders, "smartFolders": []})
+        for index in range(5):
+            item_id = f"ITEM{index}"
+            write_json(os.path.join(self.path, "images", f"{item_id}.info", "metadata.json"), {
+                "id": item_id, "name": f"image{index}", "ext": "png", "tags": ["a"], "folders": ["F1"],
+                "isDeleted": index == 4,
+            })
+        os.makedirs(os.path.join(self.path, "images", "BROKEN.info"))
+        with open(os.path.join(self.path, "images", "BROKEN.info", "metadata.json"), "w") as handle:
+            handle.write("{")
+        open(os.path.join(self.path, "images", "ITEM0.info", "image0_thumbnail.png"), "w").close()
+        self.library = LocalLibrary(self.path, max_workers=2, batch_size=2)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_library_info_and_folders(self):
+        info = self.library.get_library_info()
+        self.assertEqual(info["status"], "success")
+        self.assertEqual(info["data"]["library"], {"path": self.path, "name": "Test"})
+        self.assertEqual(self.library.list_folders(), {"status": "success", "data": self.folders})
+
+    def test_iter_items_skips_deleted_and_unreadable(self):
+        ids = [item["id"] for item in self.library.iter_items()]
+        self.assertEqual(ids, ["ITEM0", "ITEM1", "ITEM2", "ITEM3"])
+        items = self.library.list_items(include_deleted=True)["data"]
+        self.assertEqual(len(items), 5)
+
+    def test_get_item_info_and_thumbnail(self):
+        self.assertEqual(self.library.get_item_info("ITEM1")["data"]["name"], "image1")
+        self.assertEqual(self.library.get_item_info("MISSING")["status"], "error")
+        thumbnail = self.library.get_item_thumbnail("ITEM0")["data"]
+        self.assertTrue(thumbnail.endswith("image0_thumbnail.png"))
+        self.assertTrue(self.library.get_item_thumbnail("ITEM1")["data"].endswith("image1.png"))
+
+    def test_process_pool(self):
+        library = LocalLibrary(self.path, max_workers=2, use_processes=True)
+        self.assertEqual(len(library.list_items()["data"]), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
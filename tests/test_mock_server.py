@@ -0,0 +1,65 @@
+import unittest
+from eaglepy.client import EagleClient
+from eaglepy.mock_server import MockEagleServer
+
+
+class TestMockEagleServer(unittest.TestCase):
+    def setUp(self):
+        self.server = MockEagleServer(seed=1).start()
+        self.client = EagleClient(self.server.base_url)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_application_info(self):
+        response = self.client.application.get_info()
+        self.assertEqual(response["status"], "success")
+        self.assertIn("version", response["data"])
+
+    def test_item_round_trip(self):
+        self.client.item.add_items_from_paths(
+            [{"path": "/tmp/a.png", "name": "a", "tags": ["x"]}, {"path": "/tmp/b.jpg", "name": "b"}]
+        )
+        items = self.client.item.list_items("NAME", 10)["data"]
+        self.assertEqual([item["name"] for item in items], ["a", "b"])
+        self.assertEqual(items[0]["ext"], "png")
+
+        item_id = items[0]["id"]
+        self.client.item.update_item(item_id, tags=["x", "y"], star=4)
+        info = self.client.item.get_item_info(item_id)["data"]
+        self.assertEqual((info["tags"], info["star"]), (["x", "y"], 4))
+
+        self.client.item.move_items_to_trash([item_id])
+        self.assertEqual(self.client.item.get_item_info(item_id)["status"], "error")
+        self.assertEqual(len(self.client.item.list_items("NAME", 10, tags=["x"])["data"]), 0)
+
+    def test_pagination(self):
+        self.server.add_items(5)
+        ids = [item["id"] for item in self.client.item.iter_items(page_size=2)]
+        self.assertEqual(len(ids), 5)
+        self.assertEqual(len(set(ids)), 5)
+
+    def test_folders_and_library(self):
+        parent = self.client.folder.create_folder("Projects")["data"]["id"]
+        child = self.client.folder.create_folder("2024", parent=parent)["data"]["id"]
+        self.client.folder.rename_folder(child, "2025")
+        folders = self.client.library.get_library_info()["data"]["folders"]
+        self.assertEqual(folders[0]["children"][0]["name"], "2025")
+
+        self.client.library.switch_library("/tmp/Other.library")
+        self.assertEqual(self.client.library.get_library_history()["data"][0], "/tmp/Other.library")
+
+    def test_failure_injection_and_pooling(self):
+        self.server.fail_next("/api/folder/list", status=503)
+        self.assertEqual(self.client.folder.list_folders()["status"], "error")
+        self.assertEqual(self.client.folder.list_folders()["status"], "success")
+        self.server.reset_counters()
+        for _ in range(5):
+            self.client.folder.list_folders()
+        self.assertEqual(self.server.request_counts["/api/folder/list"], 5)
+        self.assertLessEqual(self.server.connections, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+from array import array
+from eaglepy.models import ItemRecord, ItemTable, Palette
+
+ITEMS = [
+    {"id": "a", "name": "A", "ext": "png", "size": 100, "width": 4096, "height": 2160,
+     "modificationTime": 1000, "tags": ["red", "sky"], "folders": ["f1"], "star": 5,
+     "palettes": [{"color": [255, 0, 0], "ratio": 60.5, "$$hashKey": "x"}]},
+    {"id": "b", "name": "B", "ext": "jpg", "size": 300, "width": 640, "height": 480, "modificationTime": 3000},
+    {"id": "c", "name": "C", "ext": "png", "size": 200, "width": 3840, "height": 2160, "modificationTime": 2000},
+]
+
+
+class TestItemRecord(unittest.TestCase):
+    def test_from_dict(self):
+        record = ItemRecord.from_dict(ITEMS[0])
+        self.assertEqual((record.id, record.ext, record.size, record.star), ("a", "png", 100, 5))
+        self.assertEqual(record.tags, ("red", "sky"))
+        self.assertFalse(hasattr(record, "__dict__"))
+
+    def test_strings_are_interned(self):
+        first = ItemRecord.from_dict({"id": "x", "tags": ["".join(["sh", "ared"])]})
+        second = ItemRecord.from_dict({"id": "y", "tags": ["".join(["sha", "red"])]})
+        self.assertIs(first.tags[0], second.tags[0])
+
+    def test_palettes_are_packed(self):
+        record = ItemRecord.from_dict(ITEMS[0])
+        self.assertIsInstance(record._palettes, array)
+        self.assertEqual(record.palettes, (Palette((255, 0, 0), 60.5),))
+        self.assertEqual(ItemRecord.from_dict(ITEMS[1]).palettes, ())
+
+    def test_round_trip(self):
+        record = ItemRecord.from_dict(ITEMS[0])
+        self.assertEqual(ItemRecord.from_dict(record.to_dict()), record)
+
+
+class TestItemTable(unittest.TestCase):
+    def setUp(self):
+        self.table = ItemTable.from_items(iter(ITEMS))
+
+    def test_columns(self):
+        self.assertEqual(len(self.table), 3)
+        self.assertEqual(list(self.table.column("size")), [100, 300, 200])
+        self.assertEqual(self.table.column("size").typecode, "q")
+        self.assertEqual(self.table.exts, ["png", "jpg"])
+        self.assertEqual(self.table.row(1)["modificationTime"], 3000)
+
+    def test_filter(self):
+        self.assertEqual(self.table.ids_at(self.table.filter(ext="png", min_width=3840)), ["a", "c"])
+        self.assertEqual(self.table.ids_at(self.table.filter(min_size=150, max_size=250)), ["c"])
+        self.assertEqual(self.table.ids_at(self.table.filter(since=2000, until=3000)), ["c"])
+        self.assertEqual(list(self.table.filter(ext="gif")), [])
+
+    def test_sort(self):
+        self.assertEqual(self.table.ids_at(self.table.sort("modification_time", reverse=True)), ["b", "c", "a"])
+        png = self.table.filter(ext="png")
+        self.assertEqual(self.table.ids_at(self.table.sort("size", png, reverse=True)), ["c", "a"])
+
+
+if __name__ == '__main__':
+    unittest.main()
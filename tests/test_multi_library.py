@@ -0,0 +1,88 @@
+import json
+import os
+import tempfile
+import unittest
+from eaglepy.client import EagleClient
+from eaglepy.mock_server import MockEagleServer
+from eaglepy.multi_library import LibraryOrchestrator
+
+
+class TestLibraryOrchestrator(unittest.TestCase):
+    def setUp(self):
+        self.server = MockEagleServer().start()
+        self.client = EagleClient(self.server.base_url)
+        self.original = self.server.library_path
+        self.orchestrator = LibraryOrchestrator(self.client, poll_interval=0.01)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def open_library(self, _client):
+        return self.server.library_path
+
+    def test_groups_live_jobs_by_library_and_restores_original(self):
+        for path in ["/libs/B.library", self.original, "/libs/A.library", "/libs/B.library", self.original]:
+            self.orchestrator.add(path, self.open_library)
+        report = self.orchestrator.run()
+
+        self.assertEqual([result.result for result in report.results],
+                         [result.job.library_path for result in report.results])
+        self.assertEqual([switch.library_path for switch in report.switches],
+                         ["/libs/A.library", "/libs/B.library", self.original])
+        self.assertEqual(self.server.request_counts["/api/library/switch"], 3)
+        self.assertEqual(self.server.library_path, self.original)
+        self.assertGreaterEqual(report.switch_time, 0)
+        self.assertEqual(self.orchestrator.jobs, [])
+
+    def test_failing_job_does_not_stop_others_and_library_is_restored(self):
+        def fail(_client):
+            raise RuntimeError("boom")
+
+        self.orchestrator.add("/libs/A.library", fail)
+        self.orchestrator.add("/libs/A.library", self.open_library)
+        report = self.orchestrator.run()
+        self.assertIsInstance(report.results[0].error, RuntimeError)
+        self.assertEqual(report.results[1].result, "/libs/A.library")
+        self.assertEqual(self.server.library_path, self.original)
+
+    def test_failed_switch_back_is_reported(self):
+        self.orchestrator.add("/libs/A.library", self.open_library)
+        self.server.fail_next("/api/library/switch", count=1)
+        self.orchestrator.add("/libs/B.library", self.open_library)
+        original_switch = self.orchestrator.switch
+
+        def switch(library_path):
+            if library_path == self.original:
+                raise RuntimeError("Eagle is busy")
+            return original_switch(library_path)
+
+        self.orchestrator.switch = switch
+        report = self.orchestrator.run()
+        self.assertFalse(report.results[0].ok)
+        self.assertEqual(report.results[1].result, "/libs/B.library")
+        self.assertEqual([(switch.library_path, switch.ok) for switch in report.switches],
+                         [("/libs/A.library", False), ("/libs/B.library", True), (self.original, False)])
+        self.assertIsInstance(report.switches[-1].error, RuntimeError)
+
+    def test_read_only_jobs_do_not_switch(self):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = []
+            for name in ("A", "B"):
+                path = os.path.join(directory, f"{name}.library")
+                os.makedirs(os.path.join(path, "images", f"ITEM{name}.info"))
+                with open(os.path.join(path, "metadata.json"), "w") as handle:
+                    json.dump({"folders": []}, handle)
+                with open(os.path.join(path, "images", f"ITEM{name}.info", "metadata.json"), "w") as handle:
+                    json.dump({"id": f"ITEM{name}", "name": name}, handle)
+                paths.append(path)
+                self.orchestrator.add(path, lambda library: [item["id"] for item in library.iter_items()],
+                                      read_only=True)
+            report = self.orchestrator.run()
+        self.assertEqual([result.result for result in report.results], [["ITEMA"], ["ITEMB"]])
+        self.assertEqual(report.switches, [])
+        self.assertNotIn("/api/library/switch", self.server.request_counts)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import json
+import unittest
+from unittest.mock import patch, Mock
+from eaglepy.folder import Folder
+from eaglepy.item import Item
+from eaglepy.payload import build_payload, compact_json, normalize_color, normalize_star, normalize_tags
+
+
+class TestPayload(unittest.TestCase):
+    def test_build_payload_drops_none_and_normalises(self):
+        payload = build_payload({
+            "id": "a", "annotation": None, "tags": [" red ", "red", "", "blue"], "star": 3, "url": ""
+        })
+        self.assertEqual(payload, {"id": "a", "tags": ["red", "blue"], "star": 3, "url": ""})
+
+    def test_empty_tags_are_kept(self):
+        self.assertEqual(build_payload({"tags": []}), {"tags": []})
+        self.assertEqual(normalize_tags("single"), ["single"])
+        with self.assertRaises(TypeError):
+            normalize_tags(["ok", 1])
+
+    def test_items_are_built_entry_by_entry(self):
+        payload = build_payload({
+            "items": [{"path": "/a.png", "name": "a", "website": None, "tags": ["x", "x"]}],
+            "folderId": None,
+        })
+        self.assertEqual(payload, {"items": [{"path": "/a.png", "name": "a", "tags": ["x"]}]})
+
+    def test_star_and_color_validation(self):
+        self.assertEqual(normalize_star(0), 0)
+        for star in (6, -1, 2.5, True, "3"):
+            with self.assertRaises(ValueError):
+                normalize_star(star)
+        self.assertEqual(normalize_color(" Red"), "red")
+        with self.assertRaises(ValueError):
+            normalize_color("teal")
+
+    def test_compact_json(self):
+        body = compact_json({"name": "café", "tags": ["a", "b"]})
+        self.assertEqual(body, '{"name":"café","tags":["a","b"]}'.encode())
+        self.assertEqual(json.loads(body), {"name": "café", "tags": ["a", "b"]})
+
+
+class TestEndpointPayloads(unittest.TestCase):
+    @patch('requests.post')
+    def test_update_item_validates_before_sending(self, mock_post):
+        item = Item(base_url="http://localhost:41595")
+        with self.assertRaises(ValueError):
+            item.update_item("item_id", star=9)
+        mock_post.assert_not_called()
+
+    @patch('requests.post')
+    def test_update_folder_normalises_color(self, mock_post):
+        mock_post.return_value = Mock(json=Mock(return_value={"status": "success", "data": {}}))
+        Folder(base_url="http://localhost:41595").update_folder("folder_id", "Name", None, "Blue")
+        mock_post.assert_called_once_with(
+            "http://localhost:41595/api/folder/update",
+            json={"folderId": "folder_id", "newName": "Name", "newColor": "blue"}
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
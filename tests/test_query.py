@@ -0,0 +1,67 @@
+import unittest
+from eaglepy.query import Between, Everything, HasExt, HasTag, InFolder, ItemIndex, Query
+
+ITEMS = [
+    {"id": "a", "tags": ["A", "B"], "folders": ["X"], "ext": "png", "width": 4096, "height": 2160},
+    {"id": "b", "tags": ["A", "B", "C"], "folders": ["X"], "ext": "png", "width": 4096, "height": 2160},
+    {"id": "c", "tags": ["A"], "folders": ["Y"], "ext": "jpg", "width": 1920, "height": 1080},
+    {"id": "d", "tags": ["A", "B"], "folders": ["X"], "ext": "jpg", "width": 1280, "height": 720},
+]
+
+
+class TestItemIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = ItemIndex.from_items(ITEMS)
+
+    def test_boolean_query(self):
+        query = HasTag("A") & HasTag("B") & ~HasTag("C") & Between("width", 3840) & InFolder("X")
+        self.assertEqual(self.index.search(query), ["a"])
+        self.assertEqual(self.index.search(HasExt("jpg") | HasTag("C")), ["b", "c", "d"])
+        self.assertEqual(self.index.count(Everything()), 4)
+        self.assertEqual(self.index.search(HasTag("missing")), [])
+
+    def test_find(self):
+        self.assertEqual(self.index.find(all_tags=["A", "B"], no_tags=["C"], folders=["X"]), ["a", "d"])
+        self.assertEqual(self.index.find(any_tags=["C", "missing"]), ["b"])
+        self.assertEqual(self.index.find(ext="jpg", folders=["Y", "X"]), ["c", "d"])
+
+    def test_remove_and_replace(self):
+        self.assertTrue(self.index.remove("a"))
+        self.assertFalse(self.index.remove("a"))
+        self.assertEqual(self.index.search(~HasTag("C") & HasTag("B")), ["d"])
+        self.assertEqual(self.index.search(Between("width", 4000)), ["b"])
+
+        self.index.add({"id": "d", "tags": ["C"], "ext": "gif"})
+        self.assertEqual(self.index.search(HasTag("C")), ["b", "d"])
+        self.assertEqual(self.index.search(HasExt("jpg")), ["c"])
+        self.assertEqual(len(self.index), 3)
+
+    def test_duplicate_ids_keep_last(self):
+        index = ItemIndex.from_items(ITEMS + [{"id": "a", "tags": ["Z"], "ext": "gif"}])
+        self.assertEqual(len(index), 4)
+        self.assertEqual(index.search(HasTag("Z")), ["a"])
+        self.assertEqual(index.search(HasExt("png")), ["b"])
+        self.assertEqual(index.find(all_tags=["A", "B"]), ["b", "d"])
+
+    def test_replace_reuses_rows(self):
+        for version in range(100):
+            self.index.add({"id": "a", "tags": [f"v{version}"], "ext": "png"})
+        self.assertEqual(len(self.index.table), 4)
+        self.assertEqual(self.index.live.bit_length(), 4)
+        self.assertEqual(self.index.search(HasTag("v99")), ["a"])
+        self.assertNotIn("v98", self.index.tags)
+
+    def test_duplicate_rows_are_reused(self):
+        index = ItemIndex.from_items(ITEMS + [{"id": "a", "tags": ["Z"], "ext": "gif"}])
+        index.add({"id": "e", "tags": ["E"], "ext": "png"})
+        self.assertEqual(len(index.table), 5)
+        self.assertEqual(index.search(HasTag("A")), ["b", "c", "d"])
+        self.assertEqual(index.search(HasTag("E")), ["e"])
+
+    def test_query_is_abstract(self):
+        with self.assertRaises(TypeError):
+            Query()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+import threading
+import unittest
+from unittest.mock import patch, Mock
+import requests
+from eaglepy.client import EagleClient
+from eaglepy.exceptions import CircuitOpenError
+from eaglepy.mock_server import MockEagleServer
+from eaglepy.resilience import CircuitBreaker, RetryPolicy
+from eaglepy.transport import Transport
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_only_idempotent_methods_are_retried(self):
+        policy = RetryPolicy(max_retries=2)
+        self.assertTrue(policy.should_retry("GET", 2))
+        self.assertFalse(policy.should_retry("GET", 3))
+        self.assertFalse(policy.should_retry("POST", 1))
+
+    def test_backoff_is_bounded(self):
+        policy = RetryPolicy(backoff_base=0.1, backoff_max=0.3)
+        for attempt in range(1, 10):
+            self.assertLessEqual(policy.backoff(attempt), 0.3)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=self.clock)
+
+    def test_opens_after_threshold_and_recovers(self):
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, "closed")
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, "open")
+        with self.assertRaises(CircuitOpenError) as context:
+            self.breaker.before_request()
+        self.assertEqual(context.exception.retry_after, 10)
+
+        self.clock.now = 10
+        self.assertEqual(self.breaker.state, "half_open")
+        self.breaker.before_request()
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.before_request()
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.stats()["state"], "closed")
+        self.assertEqual(self.breaker.stats()["rejected"], 2)
+
+    def test_failed_trial_reopens(self):
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.clock.now = 10
+        self.breaker.before_request()
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, "open")
+        self.assertEqual(self.breaker.stats()["opened"], 2)
+
+
+class TestResilientTransport(unittest.TestCase):
+    def setUp(self):
+        self.sleep = Mock()
+        self.transport = Transport(
+            retry=RetryPolicy(max_retries=2, sleep=self.sleep),
+            circuit_breaker=CircuitBreaker(failure_threshold=3)
+        )
+
+    def tearDown(self):
+        self.transport.close()
+
+    @patch('requests.Session.request')
+    def test_get_is_retried(self, mock_request):
+        mock_request.side_effect = [requests.ConnectionError("refused"), Mock(status_code=503), Mock(status_code=200)]
+        response = self.transport.get("http://localhost:41595/api/folder/list")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(mock_request.call_count, 3)
+        self.assertEqual(self.sleep.call_count, 2)
+        self.assertEqual(self.transport.stats()["retries"], 2)
+
+    @patch('requests.Session.request')
+    def test_post_is_not_retried(self, mock_request):
+        mock_request.side_effect = requests.ConnectionError("refused")
+        with self.assertRaises(requests.ConnectionError):
+            self.transport.post("http://localhost:41595/api/item/update", json={"id": "a"})
+        self.assertEqual(mock_request.call_count, 1)
+
+    @patch('requests.Session.request')
+    def test_breaker_fails_fast(self, mock_request):
+        mock_request.side_effect = requests.Timeout("stalled")
+        with self.assertRaises(requests.Timeout):
+            self.transport.get("http://localhost:41595/api/folder/list")
+        with self.assertRaises(CircuitOpenError):
+            self.transport.get("http://localhost:41595/api/folder/list")
+        self.assertEqual(mock_request.call_count, 3)
+        self.assertEqual(self.transport.stats()["circuit_breaker"]["state"], "open")
+
+    @patch('requests.Session.request')
+    def test_unexpected_error_frees_half_open_trial(self, mock_request):
+        clock = FakeClock()
+        transport = Transport(circuit_breaker=CircuitBreaker(failure_threshold=1, reset_timeout=1, clock=clock))
+        mock_request.side_effect = requests.Timeout("stalled")
+        with self.assertRaises(requests.Timeout):
+            transport.get("http://localhost:41595/api/folder/list")
+        clock.now = 2
+        mock_request.side_effect = requests.exceptions.ChunkedEncodingError("truncated")
+        with self.assertRaises(requests.exceptions.ChunkedEncodingError):
+            transport.get("http://localhost:41595/api/folder/list")
+        self.assertEqual(transport.stats()["circuit_breaker"]["state"], "open")
+        clock.now = 4
+        mock_request.side_effect = None
+        mock_request.return_value = Mock(status_code=200)
+        self.assertEqual(transport.get("http://localhost:41595/api/folder/list").status_code, 200)
+        self.assertEqual(transport.stats()["circuit_breaker"]["state"], "closed")
+        transport.close()
+
+    @patch('requests.Session.request')
+    def test_retries_are_counted_across_threads(self, mock_request):
+        mock_request.side_effect = lambda *args, **kwargs: Mock(status_code=503)
+        transport = Transport(retry=RetryPolicy(max_retries=2, sleep=self.sleep))
+        threads = [
+            threading.Thread(target=transport.get, args=("http://localhost:41595/api/folder/list",))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(transport.stats()["retries"], 16)
+        transport.close()
+
+    def test_client_against_flaky_server(self):
+        with MockEagleServer() as server:
+            server.fail_next("/api/application/info", count=2, status=503)
+            with EagleClient(server.base_url, retry=RetryPolicy(sleep=self.sleep)) as client:
+                self.assertEqual(client.application.get_info()["status"], "success")
+            self.assertEqual(server.request_counts["/api/application/info"], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
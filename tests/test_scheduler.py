@@ -0,0 +1,133 @@
+import threading
+import time
+import unittest
+from eaglepy.async_client import AsyncEagleClient
+from eaglepy.client import EagleClient
+from eaglepy.mock_server import MockEagleServer
+from eaglepy.scheduler import BULK, INTERACTIVE, RequestScheduler, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_refills_at_rate_up_to_burst(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10, burst=2, clock=clock)
+        self.assertEqual(bucket.take(), 0)
+        self.assertEqual(bucket.take(), 0)
+        self.assertAlmostEqual(bucket.take(), 0.1)
+        clock.now = 10
+        self.assertEqual(bucket.take(), 0)
+        self.assertEqual(bucket.take(), 0)
+        self.assertGreater(bucket.take(), 0)
+
+
+class TestRequestScheduler(unittest.TestCase):
+    def wait_for_depth(self, scheduler, lane, depth):
+        deadline = time.monotonic() + 5
+        while scheduler.stats()["lanes"][lane]["depth"] < depth:
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.001)
+
+    def test_lanes_share_slots_by_weight(self):
+        scheduler = RequestScheduler(max_concurrency=1, weights={INTERACTIVE: 3, BULK: 1})
+        order = []
+
+        def worker(lane):
+            with scheduler.slot(lane):
+                order.append(lane[0])
+
+        scheduler.acquire(INTERACTIVE)
+        threads = []
+        for lane in [BULK] * 4 + [INTERACTIVE] * 4:
+            thread = threading.Thread(target=worker, args=(lane,))
+            thread.start()
+            threads.append(thread)
+            self.wait_for_depth(scheduler, lane, sum(1 for other in threads if other._args[0] == lane))
+        scheduler.release()
+        for thread in threads:
+            thread.join()
+
+        # The slot held above was charged to the interactive lane, so bulk goes first, then 3:1.
+        self.assertEqual("".join(order), "biiibibb")
+        stats = scheduler.stats()
+        self.assertEqual(stats["in_flight"], 0)
+        self.assertEqual(stats["lanes"][BULK]["max_depth"], 4)
+        self.assertEqual(stats["lanes"][BULK]["admitted"], 4)
+        self.assertGreater(stats["lanes"][BULK]["wait_max"], 0)
+
+    def test_rate_limit(self):
+        scheduler = RequestScheduler(rate=100, burst=1)
+        started = time.monotonic()
+        for _ in range(6):
+            with scheduler.slot(INTERACTIVE):
+                pass
+        self.assertGreaterEqual(time.monotonic() - started, 0.045)
+
+    def test_lane_selection(self):
+        scheduler = RequestScheduler()
+        self.assertEqual(scheduler.lane_for("http://localhost/api/item/info?id=1"), INTERACTIVE)
+        self.assertEqual(scheduler.lane_for("http://localhost/api/item/addFromPaths"), BULK)
+        with scheduler.lane(BULK):
+            self.assertEqual(scheduler.lane_for("http://localhost/api/item/info?id=1"), BULK)
+        with self.assertRaises(ValueError):
+            with scheduler.lane("other"):
+                pass
+
+    def test_client_integration(self):
+        scheduler = RequestScheduler(rate=1000)
+        with MockEagleServer() as server, EagleClient(server.base_url, scheduler=scheduler) as client:
+            client.folder.list_folders()
+            client.item.add_items_from_paths([{"path": "/tmp/a.png", "name": "a"}])
+            stats = client.transport.stats()["scheduler"]
+        self.assertEqual(stats["lanes"][INTERACTIVE]["admitted"], 1)
+        self.assertEqual(stats["lanes"][BULK]["admitted"], 1)
+
+    def test_worker_threads_use_the_callers_lane(self):
+        scheduler = RequestScheduler(rate=1000)
+        with MockEagleServer() as server, EagleClient(server.base_url, scheduler=scheduler) as client:
+            ids = server.add_items(6)
+            with scheduler.lane(BULK):
+                responses = client.item.get_items_info(ids, max_workers=3)
+            client.item.get_items_info(ids[:2])
+            stats = client.transport.stats()["scheduler"]
+        self.assertTrue(all(response["status"] == "success" for response in responses.values()))
+        self.assertEqual(stats["lanes"][BULK]["admitted"], 6)
+        self.assertEqual(stats["lanes"][INTERACTIVE]["admitted"], 2)
+
+    def test_bind_without_lane_returns_func(self):
+        scheduler = RequestScheduler()
+
+        def func():
+            return scheduler.lane_for("http://localhost/api/item/info")
+
+        self.assertIs(scheduler.bind(func), func)
+        with scheduler.lane(BULK):
+            bound = scheduler.bind(func)
+        self.assertEqual(bound(), BULK)
+        self.assertEqual(func(), INTERACTIVE)
+
+
+class TestAsyncClientLanes(unittest.IsolatedAsyncioTestCase):
+    async def test_calls_use_the_lane_chosen_around_the_await(self):
+        scheduler = RequestScheduler(rate=1000)
+        with MockEagleServer() as server:
+            item_id = server.add_items(1)[0]
+            async with AsyncEagleClient(server.base_url, scheduler=scheduler) as client:
+                with scheduler.lane(BULK):
+                    for _ in range(3):
+                        await client.item.get_item_info(item_id)
+                await client.folder.list_folders()
+                stats = scheduler.stats()
+        self.assertEqual(stats["lanes"][BULK]["admitted"], 3)
+        self.assertEqual(stats["lanes"][INTERACTIVE]["admitted"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from eaglepy.async_client import AsyncEagleClient
+from eaglepy.client import EagleClient
+from eaglepy.mock_server import MockEagleServer
+from eaglepy.singleflight import AsyncSingleFlight, SingleFlight
+
+
+class TestSingleFlight(unittest.TestCase):
+    def test_concurrent_callers_share_one_call(self):
+        flights = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            started.set()
+            release.wait()
+            return "value"
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            leader = executor.submit(flights.do, "key", slow)
+            started.wait()
+            followers = [executor.submit(flights.do, "key", slow) for _ in range(4)]
+            while flights.stats()["shared"] < 4:
+                time.sleep(0.001)
+            release.set()
+            results = [leader.result()] + [future.result() for future in followers]
+        self.assertEqual(results, ["value"] * 5)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flights.stats(), {"calls": 1, "shared": 4, "in_flight": 0})
+        self.assertEqual(flights.do("key", lambda: "again"), "again")
+
+    def test_error_is_raised_and_not_kept(self):
+        flights = SingleFlight()
+
+        def fail():
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            flights.do("key", fail)
+        self.assertEqual(flights.do("key", lambda: 1), 1)
+
+
+class TestAsyncSingleFlight(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_coroutines_share_one_call(self):
+        flights = AsyncSingleFlight()
+        calls = []
+
+        async def slow():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(*(flights.do("key", slow) for _ in range(5)))
+        self.assertEqual(results, ["value"] * 5)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flights.stats()["shared"], 4)
+
+    async def test_error_reaches_every_caller(self):
+        flights = AsyncSingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(*(flights.do("key", fail) for _ in range(3)), return_exceptions=True)
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+
+
+class TestClientSingleFlight(unittest.TestCase):
+    def test_threads_share_identical_gets(self):
+        with MockEagleServer(latency=0.05) as server:
+            item_id = server.add_items(1)[0]
+            with EagleClient(server.base_url, single_flight=SingleFlight()) as client:
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    results = list(executor.map(lambda _: client.item.get_item_info(item_id), range(8)))
+                client.folder.create_folder("A")
+                client.folder.create_folder("A")
+            self.assertEqual(server.request_counts["/api/item/info"], 1)
+            self.assertEqual(server.request_counts["/api/folder/create"], 2)
+        self.assertTrue(all(result["data"]["id"] == item_id for result in results))
+
+
+class TestAsyncClientSingleFlight(unittest.IsolatedAsyncioTestCase):
+    async def test_coroutines_share_identical_reads(self):
+        with MockEagleServer(latency=0.05) as server:
+            item_id = server.add_items(1)[0]
+            async with AsyncEagleClient(server.base_url, single_flight=SingleFlight()) as client:
+                results = await asyncio.gather(*(client.item.get_item_info(item_id) for _ in range(8)))
+                self.assertEqual(client.single_flight.stats()["shared"], 7)
+            self.assertEqual(server.request_counts["/api/item/info"], 1)
+        self.assertTrue(all(result["data"]["id"] == item_id for result in results))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import base64
+import io
+import json
+import os
+import tempfile
+import unittest
+from eaglepy.client import EagleClient
+from eaglepy.mock_server import MockEagleServer
+from eaglepy.streaming import guess_mime_type, iter_base64, stream_json_body
+
+
+class TestStreaming(unittest.TestCase):
+    def setUp(self):
+        self.data = bytes(range(256)) * 41 + b"tail"
+
+    def test_iter_base64_matches_one_shot_encoding(self):
+        for chunk_size in (3, 4, 100, 1 << 20):
+            encoded = b"".join(iter_base64(io.BytesIO(self.data), chunk_size=chunk_size))
+            self.assertEqual(encoded, base64.b64encode(self.data))
+
+    def test_iter_base64_reads_paths(self):
+        with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as handle:
+            handle.write(self.data)
+        try:
+            self.assertEqual(b"".join(iter_base64(handle.name, chunk_size=9)), base64.b64encode(self.data))
+            self.assertEqual(guess_mime_type(handle.name), "image/jpeg")
+        finally:
+            os.unlink(handle.name)
+
+    def test_stream_json_body(self):
+        body = b"".join(stream_json_body({"name": "shot", "tags": None}, "base64", io.BytesIO(self.data), chunk_size=6))
+        decoded = json.loads(body)
+        self.assertEqual(decoded["name"], "shot")
+        self.assertIsNone(decoded["tags"])
+        self.assertEqual(decoded["base64"], "data:image/png;base64," + base64.b64encode(self.data).decode())
+
+    def test_stream_json_body_without_other_fields(self):
+        body = b"".join(stream_json_body({}, "url", io.BytesIO(b"abc"), mime_type="image/gif"))
+        self.assertEqual(json.loads(body), {"url": "data:image/gif;base64,YWJj"})
+
+    def test_streamed_upload_end_to_end(self):
+        with MockEagleServer() as server, EagleClient(server.base_url) as client:
+            response = client.item.add_bookmark_from_file("http://example.com", "bookmark", ["a"], io.BytesIO(self.data))
+            self.assertEqual(response["status"], "success")
+            response = client.item.add_item_from_file(io.BytesIO(self.data), "image", tags=["b"])
+            self.assertEqual(response["status"], "success")
+            items = client.item.list_items("NAME", 10)["data"]
+        self.assertEqual(sorted(item["name"] for item in items), ["bookmark", "image"])
+
+
+if __name__ == '__main__':
+    unittest.main()
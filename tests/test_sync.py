@@ -0,0 +1,71 @@
+import os
+import tempfile
+import unittest
+from eaglepy.client import EagleClient
+from eaglepy.mock_server import MockEagleServer
+from eaglepy.sync import LibrarySync
+
+
+class TestLibrarySync(unittest.TestCase):
+    def setUp(self):
+        self.server = MockEagleServer().start()
+        self.client = EagleClient(self.server.base_url)
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "snapshot.sqlite")
+        self.ids = [self.server.add_items(1, modificationTime=1000 + i)[0] for i in range(7)]
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+        self.directory.cleanup()
+
+    def open(self):
+        return LibrarySync(self.path, self.client.item, self.client.library, page_size=3)
+
+    def test_first_sync_is_full(self):
+        with self.open() as sync:
+            self.assertIsNone(sync.last_synced)
+            result = sync.sync()
+            self.assertTrue(result.full)
+            self.assertEqual((result.added, result.fetched), (7, 7))
+            self.assertEqual(sync.watermark, 1006)
+            self.assertIsNotNone(sync.last_synced)
+
+    def test_snapshot_survives_restart_and_quick_sync_fetches_only_new(self):
+        self.client.folder.create_folder("Refs")
+        with self.open() as sync:
+            sync.sync()
+        self.ids += [self.server.add_items(1, modificationTime=2000 + i)[0] for i in range(2)]
+
+        with self.open() as sync:
+            self.assertEqual(len(sync), 7)
+            self.assertEqual(sync.folders()[0]["name"], "Refs")
+            result = sync.sync()
+            self.assertFalse(result.full)
+            self.assertEqual(result.added, 2)
+            self.assertEqual(result.fetched, 3)
+            self.assertEqual([entry["id"] for entry in sync.items()][:2], [self.ids[8], self.ids[7]])
+
+    def test_full_sync_picks_up_edits_and_deletions(self):
+        with self.open() as sync:
+            sync.sync()
+            self.client.item.update_item(self.ids[0], tags=["retagged"])
+            self.client.item.move_items_to_trash([self.ids[1]])
+            result = sync.sync(full=True)
+            self.assertEqual((result.added, result.updated, result.deleted), (0, 1, 1))
+            self.assertEqual(sync.get(self.ids[0])["tags"], ["retagged"])
+            self.assertIsNone(sync.get(self.ids[1]))
+
+    def test_library_switch_resets_snapshot(self):
+        with self.open() as sync:
+            sync.sync()
+            self.client.library.switch_library("/tmp/Other.library")
+            self.server.items.clear()
+            result = sync.sync()
+            self.assertTrue(result.full)
+            self.assertEqual(len(sync), 0)
+            self.assertEqual(sync.library_path, "/tmp/Other.library")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import mmap
+import os
+import tempfile
+import unittest
+from eaglepy.client import EagleClient
+from eaglepy.mock_server import MockEagleServer
+from eaglepy.thumbnails import ThumbnailCache, ThumbnailLoader
+
+
+class TestThumbnailCache(unittest.TestCase):
+    def test_evicts_least_recently_used_by_size(self):
+        cache = ThumbnailCache(max_bytes=10)
+        cache.set(("a", 1), b"1234")
+        cache.set(("b", 1), b"1234")
+        cache.get(("a", 1))
+        cache.set(("c", 1), b"1234")
+        self.assertIn(("a", 1), cache)
+        self.assertNotIn(("b", 1), cache)
+        self.assertEqual(cache.stats()["bytes"], 8)
+        cache.set(("d", 1), b"x" * 11)
+        self.assertNotIn(("d", 1), cache)
+
+    def test_bounds_cached_mmaps(self):
+        cache = ThumbnailCache(max_mapped=2)
+        with tempfile.TemporaryFile() as handle:
+            handle.write(b"data")
+            handle.flush()
+            for name in "abc":
+                cache.set((name, 1), mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ))
+            cache.set(("d", 1), b"data")
+        self.assertNotIn(("a", 1), cache)
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(cache.stats()["mapped"], 2)
+        cache.clear()
+        self.assertEqual(cache.stats()["mapped"], 0)
+
+
+class TestThumbnailLoader(unittest.TestCase):
+    def setUp(self):
+        self.server = MockEagleServer().start()
+        self.client = EagleClient(self.server.base_url)
+        self.directory = tempfile.TemporaryDirectory()
+        self.server.library_path = self.directory.name
+        self.ids = self.server.add_items(5, modificationTime=1)
+        for item_id in self.ids[:4]:
+            folder = os.path.join(self.directory.name, "images", f"{item_id}.info")
+            os.makedirs(folder)
+            with open(os.path.join(folder, f"{self.server.items[item_id]['name']}_thumbnail.png"), "wb") as handle:
+                handle.write(item_id.encode())
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+        self.directory.cleanup()
+
+    def test_load_reads_bytes_and_caches_by_last_modified(self):
+        loader = ThumbnailLoader(self.client.item, max_workers=3)
+        items = [self.server.items[item_id] for item_id in self.ids]
+        thumbnails = loader.load(items)
+        self.assertEqual(list(thumbnails), self.ids)
+        self.assertEqual(thumbnails[self.ids[0]], self.ids[0].encode())
+        self.assertIsNone(thumbnails[self.ids[4]])
+
+        self.server.reset_counters()
+        loader.load(items[:4])
+        self.assertEqual(self.server.request_counts, {})
+
+        self.client.item.refresh_thumbnail(self.ids[0])
+        refreshed = self.client.item.get_item_info(self.ids[0])["data"]
+        self.assertEqual(refreshed["modificationTime"], 1)
+        self.server.reset_counters()
+        self.assertEqual(loader.load_one(refreshed), self.ids[0].encode())
+        self.assertEqual(self.server.request_counts, {"/api/item/thumbnail": 1})
+
+        legacy = {"id": self.ids[1], "modificationTime": 1}
+        self.server.reset_counters()
+        self.assertEqual(loader.load_one(legacy), self.ids[1].encode())
+        self.assertEqual(self.server.request_counts, {})
+
+    def test_mmap(self):
+        loader = ThumbnailLoader(self.client.item, use_mmap=True, mmap_threshold=1)
+        data = loader.load_one(self.ids[1])
+        self.assertIsInstance(data, mmap.mmap)
+        self.assertEqual(data[:], self.ids[1].encode())
+        data.close()
+
+    def test_small_files_are_not_mapped(self):
+        loader = ThumbnailLoader(self.client.item, use_mmap=True)
+        self.assertEqual(loader.load_one(self.ids[1]), self.ids[1].encode())
+        self.assertEqual(loader.cache.stats()["mapped"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
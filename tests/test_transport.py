@@ -0,0 +1,49 @@
+import unittest
+from unittest.mock import patch, Mock
+from eaglepy.transport import Transport
+
+
+class TestTransport(unittest.TestCase):
+    def setUp(self):
+        self.transport = Transport(pool_maxsize=4, timeout=5)
+
+    def tearDown(self):
+        self.transport.close()
+
+    def test_adapter_pool_size(self):
+        adapter = self.transport.session.get_adapter("http://localhost:41595")
+        self.assertEqual(adapter._pool_maxsize, 4)
+
+    @patch('requests.Session.request')
+    def test_get_applies_default_timeout(self, mock_request):
+        mock_request.return_value = Mock()
+
+        self.transport.get("http://localhost:41595/api/folder/list")
+        mock_request.assert_called_once_with(
+            "GET", "http://localhost:41595/api/folder/list", params=None, timeout=5
+        )
+
+    @patch('requests.Session.request')
+    def test_post_keeps_explicit_timeout(self, mock_request):
+        mock_request.return_value = Mock()
+
+        self.transport.post("http://localhost:41595/api/folder/create", json={"folderName": "a"}, timeout=1)
+        mock_request.assert_called_once_with(
+            "POST", "http://localhost:41595/api/folder/create", data=b'{"folderName":"a"}', json=None,
+            headers={"Content-Type": "application/json"}, timeout=1
+        )
+
+    def test_keep_alive_disabled(self):
+        transport = Transport(keep_alive=False)
+        self.assertEqual(transport.session.headers["Connection"], "close")
+        transport.close()
+
+    def test_context_manager_closes_session(self):
+        with patch.object(self.transport.session, "close") as mock_close:
+            with self.transport as transport:
+                self.assertIs(transport, self.transport)
+            mock_close.assert_called_once_with()
+
+
+if __name__ == '__main__':
+    unittest.main()
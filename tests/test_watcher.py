@@ -0,0 +1,148 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout, redirect_stderr
+from unittest.mock import patch
+import requests
+from eaglepy.client import EagleClient
+from eaglepy.mock_server import MockEagleServer
+from eaglepy.watcher import IngestWatcher, main, scan_tree
+
+
+def write(path, content=b"data", mtime=1000.0):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as handle:
+        handle.write(content)
+    os.utime(path, (mtime, mtime))
+
+
+class TestScanTree(unittest.TestCase):
+    def test_scans_nested_directories_and_skips_hidden(self):
+        with tempfile.TemporaryDirectory() as root:
+            write(os.path.join(root, "a.png"))
+            write(os.path.join(root, "sub", "deeper", "b.jpg"))
+            write(os.path.join(root, "sub", "notes.txt"))
+            write(os.path.join(root, ".cache", "c.png"))
+            write(os.path.join(root, "sub", ".partial.png"))
+            found = sorted(os.path.relpath(entry.path, root) for entry in scan_tree(root, extensions={"png", "jpg"}))
+        self.assertEqual(found, ["a.png", os.path.join("sub", "deeper", "b.jpg")])
+
+
+class TestIngestWatcher(unittest.TestCase):
+    def setUp(self):
+        self.server = MockEagleServer().start()
+        self.client = EagleClient(self.server.base_url)
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = self.directory.name
+        self.now = 2000.0
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+        self.directory.cleanup()
+
+    def watcher(self, **kwargs):
+        kwargs.setdefault("roots", {self.root: "Renders"})
+        return IngestWatcher(self.client.item, self.client.folder, clock=lambda: self.now, batch_size=2, **kwargs)
+
+    def imported(self):
+        return sorted(item["name"] for item in self.server.items.values())
+
+    def folder_of(self, name):
+        return next(item["folders"] for item in self.server.items.values() if item["name"] == name)
+
+    def test_imports_in_batches_and_maps_directories_to_folders(self):
+        for index in range(3):
+            write(os.path.join(self.root, f"top{index}.png"))
+        write(os.path.join(self.root, "shot1", "frame.png"))
+        watcher = self.watcher()
+        stats = watcher.poll()
+        self.assertEqual((stats["imported"], stats["folders_created"]), (4, 2))
+        self.assertEqual(self.imported(), ["frame", "top0", "top1", "top2"])
+        self.assertEqual(self.server.request_counts["/api/item/addFromPaths"], 3)
+        renders = self.server.folders[0]
+        self.assertEqual(renders["name"], "Renders")
+        self.assertEqual(self.folder_of("top0"), [renders["id"]])
+        self.assertEqual(self.folder_of("frame"), [renders["children"][0]["id"]])
+
+        self.assertEqual(watcher.poll()["imported"], 0)
+        self.assertEqual(self.server.request_counts["/api/item/addFromPaths"], 3)
+        self.assertEqual(watcher.stats()["imported"], 4)
+
+    def test_debounces_recently_modified_files(self):
+        write(os.path.join(self.root, "old.png"))
+        write(os.path.join(self.root, "new.png"), mtime=self.now - 0.5)
+        watcher = self.watcher(roots={self.root: None})
+        stats = watcher.poll()
+        self.assertEqual((stats["imported"], stats["pending"]), (1, 1))
+        self.now += 5
+        self.assertEqual(watcher.poll()["imported"], 1)
+        self.assertEqual(self.imported(), ["new", "old"])
+
+    def test_skips_duplicate_content_and_keeps_state(self):
+        state = os.path.join(self.directory.name, "state.json")
+        watched = os.path.join(self.root, "watched")
+        write(os.path.join(watched, "a.png"), b"same")
+        write(os.path.join(watched, "b.png"), b"same")
+        write(os.path.join(watched, "c.png"), b"other")
+        stats = self.watcher(roots={watched: None}, use_hash=True, state_path=state).poll()
+        self.assertEqual((stats["imported"], stats["duplicates"]), (2, 1))
+
+        write(os.path.join(watched, "d.png"), b"other")
+        stats = self.watcher(roots={watched: None}, use_hash=True, state_path=state).poll()
+        self.assertEqual((stats["imported"], stats["duplicates"]), (0, 1))
+
+    def test_mark_existing_and_failed_imports_are_retried(self):
+        write(os.path.join(self.root, "existing.png"))
+        watcher = self.watcher(roots={self.root: None})
+        self.assertEqual(watcher.mark_existing(), 1)
+        write(os.path.join(self.root, "fresh.png"))
+        self.server.fail_next("/api/item/addFromPaths", count=3)
+        self.assertEqual(watcher.poll()["failed"], 1)
+        self.assertEqual(watcher.poll()["imported"], 1)
+        self.assertEqual(self.imported(), ["fresh"])
+
+    def test_connection_errors_count_as_failed(self):
+        write(os.path.join(self.root, "a.png"))
+        watcher = self.watcher()
+        with patch.object(self.client.folder, "list_folders", side_effect=requests.ConnectionError("refused")):
+            stats = watcher.poll()
+        self.assertEqual((stats["imported"], stats["failed"]), (0, 1))
+        self.assertEqual(watcher.poll()["imported"], 1)
+        self.assertEqual(self.imported(), ["a"])
+
+    def test_failed_folder_listing_does_not_duplicate_folders(self):
+        self.client.folder.create_folder("Renders")
+        write(os.path.join(self.root, "a.png"))
+        watcher = self.watcher()
+        self.server.fail_next("/api/folder/list")
+        self.assertEqual(watcher.poll()["failed"], 1)
+        self.assertIsNone(watcher.folders)
+        stats = watcher.poll()
+        self.assertEqual((stats["imported"], stats["folders_created"]), (1, 0))
+        self.assertEqual([folder["name"] for folder in self.server.folders], ["Renders"])
+        self.assertEqual(self.folder_of("a"), [self.server.folders[0]["id"]])
+
+    def test_failed_folder_creation_rebuilds_the_index(self):
+        write(os.path.join(self.root, "a.png"))
+        watcher = self.watcher()
+        self.server.fail_next("/api/folder/create")
+        self.assertEqual(watcher.poll()["failed"], 1)
+        self.assertIsNone(watcher.folders)
+        self.assertEqual(self.client.folder._listeners, [])
+        self.assertEqual(watcher.poll()["imported"], 1)
+
+    def test_cli_once(self):
+        write(os.path.join(self.root, "a.png"))
+        output, errors = io.StringIO(), io.StringIO()
+        with redirect_stdout(output), redirect_stderr(errors):
+            code = main([f"{self.root}=Inbox", "--url", self.server.base_url, "--once", "--debounce", "0"])
+        self.assertEqual(code, 0)
+        self.assertIn("imported 1 files", output.getvalue())
+        self.assertIn("total: 1 files imported", errors.getvalue())
+        self.assertEqual(self.server.folders[0]["name"], "Inbox")
+
+
+if __name__ == '__main__':
+    unittest.main()